@@ -0,0 +1,130 @@
+"""Batched, cached synchronization of the skill catalog.
+
+Skill names are matched case-insensitively (after trimming and collapsing
+whitespace). Resolved ids are kept in a process-local name -> id map that is
+validated against a shared version counter, bumped whenever a skill is
+renamed or deleted, so a warm catalog answers without touching the database.
+Unknown names cost one lookup, and missing ones are inserted with a single
+`bulk_create`. That path skips the question-generation `post_save` signal,
+so questions for new skills are generated explicitly, and `skills_created`
+tells other apps about the batch.
+"""
+import threading
+
+from django.db import transaction
+from django.dispatch import Signal
+from django.db.models.functions import Lower
+
+from core.versioning import bump_version, get_version
+from .models import Skill
+from .utils import generate_questions_for_skill, schedule_question_generation
+
+SKILL_CATALOG_NAMESPACE = 'skill-catalog'
+NAME_MAX_LENGTH = Skill._meta.get_field('name').max_length
+
+# Sent with `names` (the display names) after `bulk_create` inserts new
+# catalog skills, which skips their post_save signal.
+skills_created = Signal()
+
+_lock = threading.Lock()
+_cached_ids = {'version': None, 'ids': {}}
+
+
+def normalize_skill_name(name):
+    """Display form of a skill name: trimmed, inner whitespace collapsed."""
+    if not isinstance(name, str):
+        return ''
+    return ' '.join(name.split())[:NAME_MAX_LENGTH]
+
+
+def skill_key(name):
+    # Lower() in SQL, so keys must use the same (not casefold) semantics.
+    return normalize_skill_name(name).lower()
+
+
+def invalidate_skill_catalog():
+    bump_version(SKILL_CATALOG_NAMESPACE)
+
+
+def _current_ids():
+    version = get_version(SKILL_CATALOG_NAMESPACE)
+    with _lock:
+        if _cached_ids['version'] != version:
+            _cached_ids['version'] = version
+            _cached_ids['ids'] = {}
+        return _cached_ids['ids']
+
+
+def _lookup(keys):
+    found = {}
+    rows = (
+        Skill.objects.annotate(key=Lower('name'))
+        .filter(key__in=keys)
+        .order_by('pk')
+        .values_list('key', 'pk')
+    )
+    for key, pk in rows:
+        # Legacy rows may differ only by case; the oldest one wins.
+        found.setdefault(key, pk)
+    return found
+
+
+def _remember(cached, resolved):
+    with _lock:
+        cached.update(resolved)
+
+
+def resolve_skill_ids(names, create=True):
+    """
+    Map skill names to Skill ids, creating missing skills when `create`.
+
+    Returns `(ids, created)`: `ids` maps each distinct normalized name (in
+    input order) to its Skill id, and `created` lists the ids inserted by
+    this call.
+    """
+    display = {}
+    for name in names:
+        normalized = normalize_skill_name(name)
+        if normalized:
+            display.setdefault(normalized.lower(), normalized)
+    if not display:
+        return {}, []
+
+    cached = _current_ids()
+    resolved = {key: cached[key] for key in display if key in cached}
+    missing = [key for key in display if key not in resolved]
+    created = []
+    if missing:
+        resolved.update(_lookup(missing))
+        missing = [key for key in missing if key not in resolved]
+        if missing and create:
+            Skill.objects.bulk_create([Skill(name=display[key]) for key in missing], ignore_conflicts=True)
+            # ignore_conflicts leaves pks unset; re-read to learn the new ids.
+            inserted = _lookup(missing)
+            resolved.update(inserted)
+            created = list(inserted.values())
+            if created:
+                skills_created.send(sender=Skill, names=[display[key] for key in inserted])
+        # Only remember rows once they are committed; a rolled-back insert
+        # must not leave a dangling id behind.
+        transaction.on_commit(lambda: _remember(cached, resolved))
+
+    ids = {display[key]: resolved[key] for key in display if key in resolved}
+    return ids, created
+
+
+def ensure_skills(names, defer_questions=True):
+    """
+    Make sure a Skill exists for every name and return how many were created.
+
+    Questions for new skills are generated after commit (see
+    `schedule_question_generation`), or inline when `defer_questions` is
+    False, e.g. in management commands that exit before a thread would finish.
+    """
+    _, created = resolve_skill_ids(names)
+    if defer_questions:
+        schedule_question_generation(created)
+    else:
+        for skill in Skill.objects.filter(pk__in=created):
+            generate_questions_for_skill(skill)
+    return len(created)
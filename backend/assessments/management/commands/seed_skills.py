@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 
+from assessments.catalog import ensure_skills
 from assessments.models import Skill
 
 SKILL_DATASET = [
@@ -106,10 +107,6 @@ class Command(BaseCommand):
             deleted, _ = Skill.objects.all().delete()
             self.stdout.write(self.style.WARNING(f"Deleted {deleted} existing skill records."))
 
-        added = 0
-        for name in SKILL_DATASET:
-            skill, created = Skill.objects.get_or_create(name=name)
-            if created:
-                added += 1
+        added = ensure_skills(SKILL_DATASET, defer_questions=False)
 
         self.stdout.write(self.style.SUCCESS(f"Skill catalog up to date. {added} new skills added, {Skill.objects.count()} total."))
@@ -0,0 +1,60 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from assessments.catalog import ensure_skills, normalize_skill_name, resolve_skill_ids
+from assessments.models import Question, Skill
+
+
+def test_normalize_skill_name():
+    """Test trimming and whitespace collapsing"""
+    assert normalize_skill_name("  Machine   Learning ") == "Machine Learning"
+    assert normalize_skill_name(None) == ""
+
+
+@pytest.mark.django_db
+def test_resolve_matches_existing_skills_case_insensitively():
+    """Test that differently cased names resolve to the stored skill"""
+    python = Skill.objects.create(name="Python")
+
+    ids, created = resolve_skill_ids(["python", " PYTHON ", "Django"])
+
+    assert ids == {"python": python.pk, "Django": Skill.objects.get(name="Django").pk}
+    assert created == [Skill.objects.get(name="Django").pk]
+    assert Skill.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_warm_catalog_skips_the_database(django_capture_on_commit_callbacks):
+    """Test one batched round trip when cold and none when warm"""
+    with django_capture_on_commit_callbacks(execute=True):
+        with CaptureQueriesContext(connection) as cold:
+            resolve_skill_ids(["Go", "Rust", "SQL"])
+    # lookup, batched insert, re-read, profiles listing the new skills
+    assert len(cold) == 4
+
+    with CaptureQueriesContext(connection) as warm:
+        ids, created = resolve_skill_ids(["go", "rust", "sql"])
+    assert len(warm) == 0
+    assert created == []
+    assert len(ids) == 3
+
+
+@pytest.mark.django_db
+def test_rename_invalidates_cached_ids(django_capture_on_commit_callbacks):
+    """Test that renaming a skill drops the memoized mapping"""
+    with django_capture_on_commit_callbacks(execute=True):
+        ids, _ = resolve_skill_ids(["Kotlin"])
+    skill = Skill.objects.get(pk=ids["Kotlin"])
+    skill.name = "Kotlin Multiplatform"
+    skill.save()
+
+    ids, created = resolve_skill_ids(["Kotlin"])
+    assert created and ids["Kotlin"] != skill.pk
+
+
+@pytest.mark.django_db
+def test_ensure_skills_generates_questions_inline():
+    """Test that bulk-created skills still receive questions"""
+    assert ensure_skills(["Elixir", "elixir"], defer_questions=False) == 1
+    assert Question.objects.filter(skill__name="Elixir").exists()
@@ -0,0 +1,36 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from assessments.models import AssessmentAttempt, Question, Skill
+from core.models import ApplicantProfile
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_submit_invalidates_the_profile_etag():
+    """Test that /me answers 200 with the new score after a submit, not a stale 304"""
+    user = User.objects.create_user(username="student", email="student@test.com", role="APPLICANT")
+    # bulk_create: no question generation for the new skill
+    skill = Skill.objects.bulk_create([Skill(name="Python")])[0]
+    ApplicantProfile.objects.create(user=user, skills=["Python"])
+    question = Question.objects.create(skill=skill, text="2 + 2?", options=["3", "4"], correct_option=1)
+    attempt = AssessmentAttempt.objects.create(user=user)
+    attempt.skills_assessed.set([skill])
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    before = client.get("/api/applicants/me/")
+    assert before.data["vsps_score"] == 0.0
+
+    response = client.post(
+        "/api/assessments/submit/",
+        {"attempt_id": attempt.pk, "answers": {str(question.pk): 1}, "time_taken": {str(question.pk): 3}},
+        format="json",
+    )
+    assert response.data["status"] == "COMPLETED"
+
+    after = client.get("/api/applicants/me/", HTTP_IF_NONE_MATCH=before["ETag"])
+    assert after.status_code == 200
+    assert after.data["vsps_score"] == pytest.approx(0.9)
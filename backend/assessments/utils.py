@@ -1,5 +1,16 @@
+import logging
 import re
-from .models import Question
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from core.db_routing import use_primary
+
+from .gemini_generator import generate_questions_with_gemini, generate_default_questions
+from .models import Question, Skill
+
+logger = logging.getLogger(__name__)
 
 
 def letter_to_index(letter):
@@ -95,3 +106,73 @@ def save_questions(skill, questions):
             options=question_data['options'],
             correct_option=question_data['correct_option']
         )
+
+
+def generate_questions_for_skill(skill):
+    """
+    Generate and store questions for a skill that has none yet.
+
+    Gemini is tried first; any failure falls back to the default generator.
+    Errors are logged rather than raised so skill creation never breaks.
+    """
+    # Check if questions already exist (e.g. imported or generated earlier)
+    if Question.objects.filter(skill=skill).exists():
+        logger.warning(f"Questions already exist for skill {skill.name}, skipping generation")
+        return
+
+    try:
+        # Try to generate questions with Gemini
+        logger.info(f"Generating questions with Gemini for skill: {skill.name}")
+        questions = generate_questions_with_gemini(skill.name)
+        generation_method = "AI"
+    except Exception as e:
+        # Fallback to default questions
+        logger.warning(f"Gemini generation failed for skill {skill.name}: {e}")
+        logger.info(f"Using fallback question generation for skill: {skill.name}")
+        questions = generate_default_questions(skill.name)
+        generation_method = "fallback"
+
+    # Save questions to database
+    try:
+        save_questions(skill, questions)
+        logger.info(f"Successfully saved {len(questions)} questions for skill {skill.name} using {generation_method}")
+    except Exception as e:
+        logger.error(f"Failed to save questions for skill {skill.name}: {e}")
+
+
+def _generate_for_skill_ids(skill_ids):
+    for skill in Skill.objects.filter(pk__in=skill_ids):
+        try:
+            generate_questions_for_skill(skill)
+        except Exception:
+            logger.exception("Question generation failed for skill %s", skill.pk)
+
+
+def _run_generation(skill_ids):
+    close_old_connections()
+    try:
+        with use_primary():  # the skills were just committed
+            _generate_for_skill_ids(skill_ids)
+    except Exception:
+        # Loading the skills themselves failed; nothing else reports a thread's death.
+        logger.exception("Question generation failed for skills %s", skill_ids)
+    finally:
+        close_old_connections()
+
+
+def schedule_question_generation(skill_ids):
+    """
+    Generate questions for skills created without the post_save signal
+    (bulk_create), once the creating transaction has committed.
+    """
+    skill_ids = list(skill_ids)
+    if not skill_ids:
+        return
+
+    def dispatch():
+        if settings.SKILL_QUESTION_GENERATION_ASYNC:
+            threading.Thread(target=_run_generation, args=(skill_ids,), daemon=True).start()
+        else:
+            _generate_for_skill_ids(skill_ids)
+
+    transaction.on_commit(dispatch)
@@ -14,7 +14,8 @@ from .serializers import (
     AssessmentAttemptDetailSerializer,
     AssessmentSubmitSerializer,
 )
-from .utils import save_questions
+from .catalog import resolve_skill_ids
+from .utils import generate_questions_for_skill, save_questions
 from .gemini_generator import generate_questions_with_gemini, generate_default_questions
 from core.models import ApplicantProfile
 from django.contrib.auth import get_user_model
@@ -150,22 +151,12 @@ class AssessmentViewSet(viewsets.ViewSet):
             return Response({"error": "No skills provided. Please add a skill first."}, status=status.HTTP_400_BAD_REQUEST)
 
         # Find or bootstrap Skill objects (Case Insensitive)
-        skill_objs = []
-        for s_name in user_skills:
-            if not s_name:
-                continue
-            normalized = s_name.strip()
-            if not normalized:
-                continue
-            skill_obj = Skill.objects.filter(name__iexact=normalized).first()
-            if not skill_obj:
-                skill_obj = Skill.objects.create(name=normalized)
-                try:
-                    generated = generate_questions_with_gemini(normalized)
-                except Exception:
-                    generated = generate_default_questions(normalized)
-                save_questions(skill_obj, generated)
-            skill_objs.append(skill_obj)
+        skill_ids, created_ids = resolve_skill_ids(user_skills)
+        skill_objs = list(Skill.objects.filter(pk__in=skill_ids.values()))
+        for skill in skill_objs:
+            if skill.pk in created_ids:
+                # bulk-created skills skip the post_save question generator
+                generate_questions_for_skill(skill)
         
         if not skill_objs:
              return Response({"error": f"No assessment available for skills: {', '.join(user_skills)}"}, status=status.HTTP_404_NOT_FOUND)
@@ -251,7 +242,7 @@ class AssessmentViewSet(viewsets.ViewSet):
                 profile.assessment_accuracy = 0.0
                 profile.assessment_speed_score = 0.0
                 profile.skills = merge_skill_attempt_payload(profile.skills, assessed_skills, attempt, 0.0, attempt.final_vsps)
-                profile.save(update_fields=['assessment_accuracy', 'assessment_speed_score', 'skills'])
+                profile.save(update_fields=['assessment_accuracy', 'assessment_speed_score', 'skills', 'updated_at'])
             return Response({
                 "status": "FAILED",
                 "score": 0.0,
@@ -305,7 +296,7 @@ class AssessmentViewSet(viewsets.ViewSet):
                 profile.assessment_accuracy = accuracy
                 profile.assessment_speed_score = speed_score
                 profile.skills = merge_skill_attempt_payload(profile.skills, assessed_skills, attempt, accuracy, final_vsps)
-                profile.save(update_fields=['vsps_score', 'assessment_accuracy', 'assessment_speed_score', 'skills'])
+                profile.save(update_fields=['vsps_score', 'assessment_accuracy', 'assessment_speed_score', 'skills', 'updated_at'])
             msg = "Assessment Passed!"
         else:
             attempt.status = 'FAILED'
@@ -313,7 +304,7 @@ class AssessmentViewSet(viewsets.ViewSet):
                 profile.assessment_accuracy = accuracy
                 profile.assessment_speed_score = speed_score
                 profile.skills = merge_skill_attempt_payload(profile.skills, assessed_skills, attempt, accuracy, final_vsps)
-                profile.save(update_fields=['assessment_accuracy', 'assessment_speed_score', 'skills'])
+                profile.save(update_fields=['assessment_accuracy', 'assessment_speed_score', 'skills', 'updated_at'])
             msg = "Assessment Failed. Low accuracy."
 
         attempt.save()
@@ -0,0 +1,17 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cache-backed versions and memoized ids must not leak between tests."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def synchronous_background_work(settings):
+    """Generate questions and match internships inline; threads outlive the test's database."""
+    settings.SKILL_QUESTION_GENERATION_ASYNC = False
+    settings.INTERNSHIP_MATCH_ASYNC = False
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import ApplicantProfile, RecruiterProfile, Internship, Application
+from .models import ApplicantProfile, RecruiterProfile, Internship, Application, InternshipMatch, InternshipFacetCount, PlatformRollup
 
 @admin.register(ApplicantProfile)
 class ApplicantProfileAdmin(admin.ModelAdmin):
@@ -24,3 +24,20 @@ class ApplicationAdmin(admin.ModelAdmin):
     list_display = ('internship', 'applicant', 'status', 'applied_at')
     search_fields = ('internship__title', 'applicant__user__email')
     list_filter = ('status', 'applied_at')
+
+@admin.register(InternshipMatch)
+class InternshipMatchAdmin(admin.ModelAdmin):
+    list_display = ('internship', 'applicant', 'similarity', 'score', 'created_at')
+    search_fields = ('internship__title', 'applicant__user__email')
+    list_filter = ('created_at',)
+
+@admin.register(InternshipFacetCount)
+class InternshipFacetCountAdmin(admin.ModelAdmin):
+    list_display = ('facet', 'value', 'count')
+    search_fields = ('value',)
+    list_filter = ('facet',)
+
+@admin.register(PlatformRollup)
+class PlatformRollupAdmin(admin.ModelAdmin):
+    list_display = ('metric', 'bucket', 'value', 'refreshed_at')
+    list_filter = ('metric',)
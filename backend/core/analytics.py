@@ -0,0 +1,143 @@
+"""Materialized platform analytics.
+
+The expensive GROUP BYs over users, internships, applications and assessment
+attempts run in `refresh_platform_rollups` (the `refresh_analytics` command,
+scheduled as a CronJob) and land in `PlatformRollup` as (metric, bucket,
+value) rows. The admin endpoint only reads that small table, so its cost does
+not depend on how much data the platform holds.
+
+Snapshot metrics (counts by role/status, the VSPS histogram) are single
+grouped scans and are replaced on every run. The applications-per-day series
+is incremental: only days from the previous refresh onwards are recounted,
+and `full=True` recounts history (e.g. after bulk deletes).
+"""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F, Max, Q
+from django.db.models.functions import Floor, TruncDate
+from django.utils import timezone
+
+from assessments.models import AssessmentAttempt
+from .models import ApplicantProfile, Application, Internship, PlatformRollup
+
+USERS_BY_ROLE = 'users_by_role'
+INTERNSHIPS_BY_STATUS = 'internships_by_status'
+APPLICATIONS_BY_STATUS = 'applications_by_status'
+APPLICATIONS_PER_DAY = 'applications_per_day'
+ASSESSMENTS_BY_STATUS = 'assessments_by_status'
+VSPS_DISTRIBUTION = 'vsps_distribution'
+
+VSPS_BUCKETS = 10
+# Applications committed late for the previous day are still picked up.
+INCREMENTAL_OVERLAP = timedelta(days=1)
+
+
+def vsps_bucket_label(index):
+    width = 1 / VSPS_BUCKETS
+    return f'{index * width:.1f}-{(index + 1) * width:.1f}'
+
+
+def _upsert(metric, values):
+    PlatformRollup.objects.bulk_create(
+        [PlatformRollup(metric=metric, bucket=bucket, value=value) for bucket, value in values.items()],
+        update_conflicts=True,
+        unique_fields=['metric', 'bucket'],
+        update_fields=['value', 'refreshed_at'],
+    )
+
+
+def _replace(metric, values):
+    PlatformRollup.objects.filter(metric=metric).exclude(bucket__in=list(values)).delete()
+    if values:
+        _upsert(metric, values)
+    return len(values)
+
+
+def _grouped(queryset, field):
+    return {str(row[field]): row['total'] for row in queryset.values(field).annotate(total=Count('pk')).order_by()}
+
+
+def _vsps_histogram():
+    histogram = {vsps_bucket_label(index): 0 for index in range(VSPS_BUCKETS)}
+    rows = (
+        ApplicantProfile.objects.annotate(slot=Floor(F('vsps_score') * VSPS_BUCKETS))
+        .values('slot')
+        .annotate(total=Count('pk'))
+        .order_by()
+    )
+    for row in rows:
+        # vsps_score == 1.0 belongs to the top bucket
+        index = min(max(int(row['slot'] or 0), 0), VSPS_BUCKETS - 1)
+        histogram[vsps_bucket_label(index)] += row['total']
+    return histogram
+
+
+def _applications_per_day(full):
+    applications = Application.objects.all()
+    watermark = None
+    if not full:
+        watermark = PlatformRollup.objects.filter(metric=APPLICATIONS_PER_DAY).aggregate(last=Max('refreshed_at'))['last']
+    if watermark is None:
+        PlatformRollup.objects.filter(metric=APPLICATIONS_PER_DAY).delete()
+    else:
+        applications = applications.filter(applied_at__date__gte=(watermark - INCREMENTAL_OVERLAP).date())
+    rows = applications.annotate(day=TruncDate('applied_at')).values('day').annotate(total=Count('pk')).order_by()
+    return {row['day'].isoformat(): row['total'] for row in rows}
+
+
+def refresh_platform_rollups(full=False):
+    """Recompute the rollup table; returns the number of buckets written per metric."""
+    User = get_user_model()
+    written = {}
+    with transaction.atomic():
+        written[USERS_BY_ROLE] = _replace(USERS_BY_ROLE, _grouped(User.objects.all(), 'role'))
+        written[INTERNSHIPS_BY_STATUS] = _replace(INTERNSHIPS_BY_STATUS, _grouped(Internship.objects.all(), 'status'))
+        written[APPLICATIONS_BY_STATUS] = _replace(APPLICATIONS_BY_STATUS, _grouped(Application.objects.all(), 'status'))
+        written[ASSESSMENTS_BY_STATUS] = _replace(ASSESSMENTS_BY_STATUS, _grouped(AssessmentAttempt.objects.all(), 'status'))
+        written[VSPS_DISTRIBUTION] = _replace(VSPS_DISTRIBUTION, _vsps_histogram())
+
+        per_day = _applications_per_day(full)
+        if per_day:
+            _upsert(APPLICATIONS_PER_DAY, per_day)
+        written[APPLICATIONS_PER_DAY] = len(per_day)
+    return written
+
+
+def get_platform_analytics(days=30):
+    """Read the rollups (one query) for the admin dashboard; `days` bounds the daily series."""
+    today = timezone.now().date()
+    start = today - timedelta(days=days - 1)
+    rows = PlatformRollup.objects.filter(
+        ~Q(metric=APPLICATIONS_PER_DAY) | Q(metric=APPLICATIONS_PER_DAY, bucket__gte=start.isoformat())
+    ).values_list('metric', 'bucket', 'value', 'refreshed_at')
+
+    metrics = {}
+    refreshed_at = None
+    for metric, bucket, value, stamp in rows:
+        metrics.setdefault(metric, {})[bucket] = int(value)
+        refreshed_at = stamp if refreshed_at is None else max(refreshed_at, stamp)
+
+    per_day = metrics.get(APPLICATIONS_PER_DAY, {})
+    assessments = metrics.get(ASSESSMENTS_BY_STATUS, {})
+    finished = assessments.get('COMPLETED', 0) + assessments.get('FAILED', 0)
+    vsps = metrics.get(VSPS_DISTRIBUTION, {})
+    return {
+        'users_by_role': metrics.get(USERS_BY_ROLE, {}),
+        'internships_by_status': metrics.get(INTERNSHIPS_BY_STATUS, {}),
+        'applications_by_status': metrics.get(APPLICATIONS_BY_STATUS, {}),
+        'applications_per_day': [
+            {'date': day.isoformat(), 'count': per_day.get(day.isoformat(), 0)}
+            for day in (start + timedelta(days=offset) for offset in range(days))
+        ],
+        'assessments': {
+            'by_status': assessments,
+            'pass_rate': round(assessments.get('COMPLETED', 0) / finished, 4) if finished else None,
+        },
+        'vsps_distribution': [
+            {'bucket': vsps_bucket_label(index), 'count': vsps.get(vsps_bucket_label(index), 0)}
+            for index in range(VSPS_BUCKETS)
+        ],
+        'refreshed_at': refreshed_at,
+    }
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        import core.signals  # noqa
+        from core.db_routing import install_write_pinning
+
+        connection_created.connect(install_write_pinning, dispatch_uid='core-write-pinning')
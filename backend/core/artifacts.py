@@ -0,0 +1,48 @@
+"""Precomputed TF-IDF index served to the in-browser recommender.
+
+The artifact is built once per internship-index version and cached as
+serialized bytes with a content-hash ETag. Saving or deleting an internship
+bumps the version, so the next request rebuilds it. A single cache entry
+holds `(version, etag, body)`; a rebuild replaces it rather than leaving one
+full index per version behind.
+"""
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ml_engine.recommender import export_internship_index
+from .db_routing import use_primary
+from .matching import internship_to_ml
+from .models import Internship, PlatformSettings
+from .versioning import bump_version, get_version
+
+INTERNSHIP_INDEX_NAMESPACE = 'internship-index'
+ARTIFACT_CACHE_KEY = 'internship-index-artifact'
+
+
+def invalidate_internship_index():
+    bump_version(INTERNSHIP_INDEX_NAMESPACE)
+    # A reader between the bump and the commit caches the old index under
+    # the new version; bump again once the change is visible.
+    transaction.on_commit(lambda: bump_version(INTERNSHIP_INDEX_NAMESPACE))
+
+
+def get_internship_index_artifact():
+    """Return `(etag, body)` for the current internship index."""
+    version = get_version(INTERNSHIP_INDEX_NAMESPACE)
+    cached = cache.get(ARTIFACT_CACHE_KEY)
+    if cached is not None and cached[0] == version:
+        return cached[1], cached[2]
+
+    # Cached under the new version: a lagging replica must not fill it.
+    with use_primary():
+        platform_settings = PlatformSettings.get_settings()
+        internships = Internship.objects.only('id', 'title', 'description', 'required_skills').order_by('id')
+        artifact = export_internship_index([internship_to_ml(i, platform_settings) for i in internships])
+
+    body = json.dumps(artifact, separators=(',', ':')).encode('utf-8')
+    etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+    cache.set(ARTIFACT_CACHE_KEY, (version, etag, body), timeout=None)
+    return etag, body
@@ -0,0 +1,73 @@
+"""Response compression with brotli/gzip negotiation.
+
+Responses smaller than `RESPONSE_COMPRESSION_MIN_BYTES` are sent as they are;
+compressing a few hundred bytes costs more CPU than it saves on the wire.
+Larger ones are brotli-encoded when the client accepts `br` and the `brotli`
+package is installed, and gzip-encoded otherwise (via Django's
+GZipMiddleware, which also handles streaming exports). A compressed body
+that is not smaller than the original is discarded.
+
+Responses to credentialed requests (an Authorization header or a session
+cookie) may carry secrets next to attacker-influenced text, so they always
+take the gzip path: GZipMiddleware pads its output by a random length
+against BREACH-style length oracles, and brotli has no equivalent.
+"""
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import has_vary_header
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+def accepted_encodings(header):
+    """Encodings from an Accept-Encoding header that the client did not refuse with q=0."""
+    accepted = set()
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name and quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def is_credentialed(request, response):
+    return (
+        'HTTP_AUTHORIZATION' in request.META
+        or settings.SESSION_COOKIE_NAME in request.COOKIES
+        or has_vary_header(response, 'Cookie')
+        or has_vary_header(response, 'Authorization')
+    )
+
+
+class CompressionMiddleware(GZipMiddleware):
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding'):
+            return response
+        if not response.streaming and len(response.content) < settings.RESPONSE_COMPRESSION_MIN_BYTES:
+            return response
+
+        accepted = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if brotli is None or 'br' not in accepted or response.streaming or is_credentialed(request, response):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        compressed = brotli.compress(response.content, quality=settings.RESPONSE_COMPRESSION_BROTLI_QUALITY)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers['Content-Length'] = str(len(compressed))
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br'
+        return response
@@ -0,0 +1,73 @@
+"""Conditional GET (ETag / Last-Modified) helpers for API views.
+
+Validators are derived from `updated_at` columns so a 304 can be answered
+before anything is serialized. ETags are weak because the representation is
+produced by a serializer rather than stored byte-for-byte.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def make_etag(*parts):
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def not_modified(request, etag, last_modified=None):
+    """Return a 304 response when the client's validators still match, else None."""
+    timestamp = last_modified.timestamp() if last_modified else None
+    return get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+
+def set_validators(response, etag, last_modified=None):
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
+
+def queryset_version(queryset, *timestamp_fields):
+    """Cheap aggregate (row count + newest timestamps) describing a list's contents."""
+    aggregates = {'rows': Count('pk')}
+    for index, field in enumerate(timestamp_fields):
+        aggregates[f'ts{index}'] = Max(field)
+    values = queryset.order_by().aggregate(**aggregates)
+    stamps = [values[f'ts{index}'] for index in range(len(timestamp_fields))]
+    latest = max((stamp for stamp in stamps if stamp is not None), default=None)
+    return (values['rows'], *stamps), latest
+
+
+class ConditionalGetMixin:
+    """
+    ETag/Last-Modified for `list` and `retrieve` of a ModelViewSet.
+
+    `conditional_timestamp_fields` lists the `updated_at` columns (own and
+    joined) that change whenever the serialized representation does.
+    """
+    conditional_timestamp_fields = ('updated_at',)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        version, latest = queryset_version(queryset, *self.conditional_timestamp_fields)
+        query = sorted(request.query_params.lists())
+        etag = make_etag(self.basename, 'list', version, query)
+        response = not_modified(request, etag, latest)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        return set_validators(response, etag, latest)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = {self.lookup_field: kwargs[self.lookup_url_kwarg or self.lookup_field]}
+        stamps = self.get_queryset().filter(**lookup).values_list(*self.conditional_timestamp_fields).first()
+        if stamps is None:
+            return super().retrieve(request, *args, **kwargs)
+        latest = max((stamp for stamp in stamps if stamp is not None), default=None)
+        # The query string may select a sparse fieldset, i.e. another representation.
+        etag = make_etag(self.basename, lookup, stamps, sorted(request.query_params.lists()))
+        response = not_modified(request, etag, latest)
+        if response is None:
+            response = super().retrieve(request, *args, **kwargs)
+        return set_validators(response, etag, latest)
@@ -0,0 +1,90 @@
+"""Per-recruiter dashboard aggregates.
+
+One grouped query over the recruiter's internships (LEFT JOIN applications
+and applicants) yields application counts by status, the average applicant
+VSPS and the latest application time per listing. The result is cached per
+recruiter under a version that application and internship changes bump.
+VSPS updates on applicant profiles are not tracked individually; the cache
+timeout bounds how stale the averages can get.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Avg, Count, Max, Q
+from django.utils import timezone
+
+from .models import Application, Internship
+from .versioning import bump_version, get_version
+
+STATUSES = [code for code, _ in Application.STATUS_CHOICES]
+
+
+def _namespace(recruiter_id):
+    return f'recruiter-dashboard:{recruiter_id}'
+
+
+def _bump(recruiter_ids):
+    for recruiter_id in recruiter_ids:
+        bump_version(_namespace(recruiter_id))
+
+
+def invalidate_recruiter_dashboards(recruiter_ids):
+    recruiter_ids = {recruiter_id for recruiter_id in recruiter_ids if recruiter_id is not None}
+    if not recruiter_ids:
+        return
+    # Bump now for readers in this transaction and again once others can see it.
+    _bump(recruiter_ids)
+    transaction.on_commit(lambda: _bump(recruiter_ids))
+
+
+def compute_recruiter_dashboard(recruiter_id):
+    status_counts = {
+        status.lower(): Count('applications', filter=Q(applications__status=status))
+        for status in STATUSES
+    }
+    rows = (
+        Internship.objects.filter(recruiter_id=recruiter_id)
+        .annotate(
+            applications_total=Count('applications'),
+            average_vsps=Avg('applications__applicant__vsps_score'),
+            latest_application_at=Max('applications__applied_at'),
+            **status_counts,
+        )
+        .order_by('-created_at', '-id')
+        .values(
+            'id', 'title', 'status', 'location', 'created_at',
+            'applications_total', 'average_vsps', 'latest_application_at', *status_counts,
+        )
+    )
+
+    internships = []
+    totals = {'internships': 0, 'applications': 0, **{key: 0 for key in status_counts}}
+    for row in rows:
+        internships.append({
+            'id': row['id'],
+            'title': row['title'],
+            'status': row['status'],
+            'location': row['location'],
+            'created_at': row['created_at'],
+            'applications': {
+                'total': row['applications_total'],
+                **{key: row[key] for key in status_counts},
+            },
+            'average_vsps': round(row['average_vsps'], 4) if row['average_vsps'] is not None else None,
+            'latest_application_at': row['latest_application_at'],
+        })
+        totals['internships'] += 1
+        totals['applications'] += row['applications_total']
+        for key in status_counts:
+            totals[key] += row[key]
+
+    return {'internships': internships, 'totals': totals, 'generated_at': timezone.now()}
+
+
+def get_recruiter_dashboard(recruiter_id):
+    key = f'recruiter-dashboard:{recruiter_id}:{get_version(_namespace(recruiter_id))}'
+    dashboard = cache.get(key)
+    if dashboard is None:
+        dashboard = compute_recruiter_dashboard(recruiter_id)
+        cache.set(key, dashboard, timeout=settings.RECRUITER_DASHBOARD_CACHE_TIMEOUT)
+    return dashboard
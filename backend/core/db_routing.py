@@ -0,0 +1,102 @@
+"""Read-replica routing with read-your-writes stickiness.
+
+`ReplicaRouter` sends reads to one of `settings.DATABASE_REPLICAS` and every
+write to `default`. Reads go to the primary instead ("pinned") when:
+
+* the current request is not a safe method: writes and the reads around
+  them (e.g. duplicate checks before applying) must see the same data;
+* the client wrote within the last `DATABASE_REPLICA_PIN_SECONDS`. After an
+  unsafe request `ReplicaPinningMiddleware` sets a short-lived cookie, so the
+  user's next pages (their application, their updated profile) do not race
+  replication lag;
+* a write was executed in the current context. Every `default` connection
+  gets an execute wrapper that pins on INSERT/UPDATE/DELETE statements;
+  merely routing a query for writing (e.g. the lookup half of a
+  `get_or_create` that finds its row) does not pin;
+* the code asked for it with `use_primary`, e.g. threads started right after
+  a commit, or cache fills stored under a freshly bumped version, which must
+  not capture rows from before the replica caught up.
+
+With no replicas configured every query goes to `default`, as before.
+"""
+import contextlib
+import contextvars
+import random
+
+from django.conf import settings
+
+PRIMARY = 'default'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+_pinned = contextvars.ContextVar('db_pinned_to_primary', default=False)
+
+
+def pin_to_primary():
+    _pinned.set(True)
+
+
+def is_pinned():
+    return _pinned.get()
+
+
+@contextlib.contextmanager
+def use_primary():
+    """Read from the primary inside the block."""
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+def _pin_on_write(execute, sql, params, many, context):
+    if sql.lstrip()[:7].upper().startswith(WRITE_STATEMENTS):
+        pin_to_primary()
+    return execute(sql, params, many, context)
+
+
+def install_write_pinning(sender, connection, **kwargs):
+    """`connection_created` receiver: watch the primary's statements for writes."""
+    if connection.alias == PRIMARY and _pin_on_write not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_pin_on_write)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas or is_pinned():
+            return PRIMARY
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        databases = {PRIMARY, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
+
+
+class ReplicaPinningMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        cookie = settings.DATABASE_REPLICA_PIN_COOKIE
+        unsafe = request.method not in SAFE_METHODS
+        token = _pinned.set(unsafe or cookie in request.COOKIES)
+        try:
+            response = self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        if unsafe and settings.DATABASE_REPLICAS and response.status_code < 400:
+            response.set_cookie(
+                cookie, '1', max_age=settings.DATABASE_REPLICA_PIN_SECONDS, httponly=True, samesite='Lax'
+            )
+        return response
@@ -0,0 +1,96 @@
+"""Streaming exports of an internship's applicants.
+
+Rows are read with `values()` over a pre-joined queryset and a server-side
+`iterator(chunk_size=...)`, then encoded one at a time, so memory use does
+not grow with the number of applicants.
+"""
+import csv
+import json
+
+from django.http import StreamingHttpResponse
+
+from .models import Application
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+}
+EXPORT_CHUNK_SIZE = 2000
+# Leading characters spreadsheets treat as the start of a formula.
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+# (column name, lookup) pairs; lookups follow applicant -> user without per-row queries.
+EXPORT_COLUMNS = [
+    ('application_id', 'id'),
+    ('status', 'status'),
+    ('applied_at', 'applied_at'),
+    ('applicant_id', 'applicant_id'),
+    ('email', 'applicant__user__email'),
+    ('first_name', 'applicant__user__first_name'),
+    ('last_name', 'applicant__user__last_name'),
+    ('vsps_score', 'applicant__vsps_score'),
+    ('college', 'applicant__college'),
+    ('degree', 'applicant__degree'),
+    ('major', 'applicant__major'),
+    ('graduation_year', 'applicant__graduation_year'),
+    ('skills', 'applicant__skills'),
+    ('mobile_number', 'applicant__mobile_number'),
+    ('github_link', 'applicant__github_link'),
+    ('linkedin_link', 'applicant__linkedin_link'),
+]
+
+
+class _Echo:
+    """File-like object whose write() hands the encoded line back to csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def _skill_labels(skills):
+    from .matching import skill_names
+    return skill_names(skills)
+
+
+def applicant_rows(internship):
+    lookups = [lookup for _, lookup in EXPORT_COLUMNS]
+    rows = (
+        Application.objects.filter(internship=internship)
+        .order_by('-applicant__vsps_score', '-id')
+        .values_list(*lookups)
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    names = [name for name, _ in EXPORT_COLUMNS]
+    for row in rows:
+        record = dict(zip(names, row))
+        record['skills'] = _skill_labels(record['skills'])
+        record['applied_at'] = record['applied_at'].isoformat() if record['applied_at'] else None
+        yield record
+
+
+def _spreadsheet_safe(value):
+    """Quote user-controlled text so spreadsheet apps do not evaluate it as a formula."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_lines(records):
+    writer = csv.writer(_Echo())
+    names = [name for name, _ in EXPORT_COLUMNS]
+    yield writer.writerow(names)
+    for record in records:
+        record['skills'] = '; '.join(record['skills'])
+        yield writer.writerow([_spreadsheet_safe(record[name]) for name in names])
+
+
+def _jsonl_lines(records):
+    for record in records:
+        yield json.dumps(record, default=str) + '\n'
+
+
+def stream_applicants(internship, export_format):
+    encode = _csv_lines if export_format == 'csv' else _jsonl_lines
+    response = StreamingHttpResponse(encode(applicant_rows(internship)), content_type=EXPORT_FORMATS[export_format])
+    response['Content-Disposition'] = f'attachment; filename="internship-{internship.pk}-applicants.{export_format}"'
+    return response
@@ -0,0 +1,145 @@
+"""Facet counts for the internship listings UI.
+
+Counts live in `InternshipFacetCount` and are adjusted incrementally from the
+Internship save/delete signals: the facet values an internship had before a
+save are diffed against the values after it and only the changed rows are
+updated. `rebuild_facet_counts` recomputes everything from scratch (see the
+`rebuild_facets` management command).
+"""
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from .db_routing import use_primary
+from .models import Internship, InternshipFacetCount
+from .versioning import bump_version, get_version
+
+FACETS_NAMESPACE = 'internship-facets'
+FACET_FIELDS = ('location', 'work_type', 'status', 'stipend', 'required_skills')
+
+# (upper bound exclusive, label); None means open-ended
+STIPEND_BUCKETS = [
+    (1, 'unpaid'),
+    (5000, '1-4999'),
+    (10000, '5000-9999'),
+    (20000, '10000-19999'),
+    (None, '20000+'),
+]
+
+
+def stipend_bucket(stipend):
+    if stipend is None:
+        return 'unspecified'
+    for upper, label in STIPEND_BUCKETS:
+        if upper is None or stipend < upper:
+            return label
+    return STIPEND_BUCKETS[-1][1]
+
+
+def stipend_bucket_range(label):
+    """
+    Return the (min, max) stipend range for a bucket label, or None if unknown.
+
+    Either bound may be None (open-ended); 'unpaid' has no lower bound so it
+    matches every stipend `stipend_bucket` counts there.
+    """
+    lower = None
+    for upper, bucket in STIPEND_BUCKETS:
+        if bucket == label:
+            return lower, (upper - 1 if upper is not None else None)
+        lower = upper
+    return None
+
+
+def facet_pairs(values):
+    """Facet (name, value) pairs for a dict with the FACET_FIELDS keys."""
+    from .matching import skill_names
+
+    pairs = {
+        ('location', values.get('location') or ''),
+        ('work_type', values.get('work_type') or ''),
+        ('status', values.get('status') or ''),
+        ('stipend', stipend_bucket(values.get('stipend'))),
+    }
+    pairs.update(('skill', name.lower()) for name in skill_names(values.get('required_skills')))
+    return pairs
+
+
+def internship_facet_pairs(internship):
+    return facet_pairs({field: getattr(internship, field) for field in FACET_FIELDS})
+
+
+def stored_facet_pairs(pk):
+    values = Internship.objects.filter(pk=pk).values(*FACET_FIELDS).first()
+    return facet_pairs(values) if values else set()
+
+
+def _adjust(pairs, delta):
+    by_facet = {}
+    for facet, value in pairs:
+        by_facet.setdefault(facet, []).append(value)
+    for facet, values in by_facet.items():
+        InternshipFacetCount.objects.filter(facet=facet, value__in=values).update(count=F('count') + delta)
+
+
+def apply_facet_delta(removed=(), added=(), times=1):
+    """Decrement the `removed` pairs and increment the `added` ones `times` times."""
+    removed, added = set(removed), set(added)
+    if not removed and not added:
+        return
+    with transaction.atomic():
+        if added:
+            InternshipFacetCount.objects.bulk_create(
+                [InternshipFacetCount(facet=facet, value=value[:255]) for facet, value in added],
+                ignore_conflicts=True,
+            )
+            _adjust(added, times)
+        if removed:
+            _adjust(removed, -times)
+    # Bump now for readers in this transaction and again once others can see it.
+    bump_version(FACETS_NAMESPACE)
+    transaction.on_commit(lambda: bump_version(FACETS_NAMESPACE))
+
+
+def apply_facet_counter(counter):
+    """Apply a Counter of pair -> delta in one pass per distinct delta."""
+    grouped = {}
+    for pair, delta in counter.items():
+        if delta:
+            grouped.setdefault(delta, set()).add(pair)
+    for delta, pairs in grouped.items():
+        if delta > 0:
+            apply_facet_delta(added=pairs, times=delta)
+        else:
+            apply_facet_delta(removed=pairs, times=-delta)
+
+
+def rebuild_facet_counts():
+    counter = Counter()
+    for values in Internship.objects.values(*FACET_FIELDS).iterator(chunk_size=2000):
+        counter.update(facet_pairs(values))
+    with transaction.atomic():
+        InternshipFacetCount.objects.all().delete()
+        InternshipFacetCount.objects.bulk_create(
+            [InternshipFacetCount(facet=facet, value=value[:255], count=count) for (facet, value), count in counter.items()],
+            batch_size=1000,
+        )
+    bump_version(FACETS_NAMESPACE)
+    return len(counter)
+
+
+def get_facet_counts():
+    """Return `{facet: [{'value', 'count'}, ...]}`, cached per facet version."""
+    cache_key = f'internship-facets:{get_version(FACETS_NAMESPACE)}'
+    facets = cache.get(cache_key)
+    if facets is None:
+        facets = {'location': [], 'work_type': [], 'status': [], 'stipend': [], 'skill': []}
+        rows = InternshipFacetCount.objects.filter(count__gt=0).order_by('facet', '-count', 'value')
+        with use_primary():  # cached under the new version; not from a lagging replica
+            for facet, value, count in rows.values_list('facet', 'value', 'count'):
+                facets.setdefault(facet, []).append({'value': value, 'count': count})
+        cache.set(cache_key, facets, timeout=settings.FACET_COUNTS_CACHE_TIMEOUT)
+    return facets
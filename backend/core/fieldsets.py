@@ -0,0 +1,81 @@
+"""Sparse fieldsets for list and detail GETs.
+
+`?fields=id,title,company_name` limits a response to the named fields and
+`?view=compact` to the serializer's `Meta.compact_fields`; `id` is always
+included. The serializer drops the other fields (so they are never
+computed) and the view narrows the SQL projection to the columns the kept
+fields read, dropping joins nobody needs.
+
+Serializers declare `Meta.field_sources` for fields that do not map 1:1 to a
+model field of the same name (joined or computed values); every other field
+is loaded by its own name.
+"""
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+
+def requested_fields(request, available, compact):
+    """The field names asked for by `request`, or None for the full representation."""
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    raw = request.query_params.get('fields')
+    view = request.query_params.get('view')
+    if raw:
+        names = {name.strip() for name in raw.split(',') if name.strip()}
+    elif view == 'compact':
+        names = set(compact)
+    elif view in (None, '', 'full'):
+        return None
+    else:
+        raise ValidationError({'view': 'Expected "compact" or "full".'})
+    unknown = sorted(names - set(available))
+    if unknown:
+        raise ValidationError({'fields': f'Unknown field(s): {", ".join(unknown)}.'})
+    return names | {'id'}
+
+
+class SparseFieldsetSerializerMixin:
+    """Applies `?fields=`/`?view=` to the top-level serializer of a response (not to nested ones)."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return fields
+        selected = requested_fields(
+            self.context.get('request'), fields, getattr(self.Meta, 'compact_fields', fields)
+        )
+        if selected is None:
+            return fields
+        return {name: field for name, field in fields.items() if name in selected}
+
+
+class SparseFieldsetViewMixin:
+    """Narrows the queryset with `only()`/`select_related()` for sparse `list`/`retrieve` requests."""
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action not in ('list', 'retrieve'):
+            return queryset
+        serializer_class = self.get_serializer_class()
+        meta = serializer_class.Meta
+        available = serializer_class().fields
+        selected = requested_fields(self.request, available, getattr(meta, 'compact_fields', available))
+        if selected is None:
+            return queryset
+
+        sources = getattr(meta, 'field_sources', {})
+        paths = {path for name in selected for path in sources.get(name, (name,))}
+        # Cursor pagination reads its ordering columns off the last row.
+        ordering = getattr(self.pagination_class, 'ordering', ()) if self.action == 'list' else ()
+        model_fields = {field.name for field in queryset.model._meta.concrete_fields}
+        paths.update(name.lstrip('-') for name in ordering if name.lstrip('-') in model_fields)
+        relations = {path.rsplit('__', 1)[0] for path in paths if '__' in path}
+        queryset = queryset.select_related(None)
+        if relations:
+            queryset = queryset.select_related(*relations)
+        return queryset.only(*paths)
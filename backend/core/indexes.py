@@ -0,0 +1,27 @@
+"""PostgreSQL-only indexes that Django's portable Meta.indexes cannot express.
+
+GIN indexes (jsonb_path_ops) on the JSON skill lists serve containment
+queries such as `required_skills__contains=['Python']`. Other backends have
+no equivalent and skip them.
+"""
+
+POSTGRES_GIN_INDEXES = {
+    'core_internship_skills_gin': ('core_internship', 'required_skills'),
+    'core_applicant_skills_gin': ('core_applicantprofile', 'skills'),
+}
+
+
+def install_gin_indexes(schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, (table, column) in POSTGRES_GIN_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING GIN ({column} jsonb_path_ops)'
+        )
+
+
+def uninstall_gin_indexes(schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in POSTGRES_GIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
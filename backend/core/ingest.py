@@ -0,0 +1,170 @@
+"""Streaming bulk ingestion of internship listings from CSV or JSONL.
+
+Rows are read lazily and handled in chunks: each row is validated with
+`InternshipSerializer`, the valid rows of a chunk are inserted with one
+`bulk_create` and their skills upserted in one batch. `bulk_create` skips the
+Internship signals, so each chunk writes its skill links, applies its facet
+deltas, invalidates the cached index, listings and recruiter dashboard, and
+schedules matching explicitly. Invalid rows do not stop the import; they are returned in a
+per-line error report.
+"""
+import csv
+import io
+import json
+import re
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+
+from .artifacts import invalidate_internship_index
+from .dashboards import invalidate_recruiter_dashboards
+from .facets import apply_facet_counter, internship_facet_pairs
+from .matching import schedule_internship_matching
+from .models import Internship
+from .response_cache import invalidate_internship_responses
+from .serializers import InternshipSerializer
+from .skill_links import sync_internship_skills
+
+FORMATS = ('csv', 'jsonl')
+LIST_FIELDS = ('required_skills', 'preferred_skills')
+
+
+def detect_format(filename, default='csv'):
+    name = (filename or '').lower()
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if name.endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def _split_list(value):
+    value = value.strip()
+    if value.startswith('['):
+        return json.loads(value)
+    return [item.strip() for item in re.split(r'[;|,]', value) if item.strip()]
+
+
+def _unreadable(exc):
+    """Error entry for a line the file could not be read past (bad encoding, broken CSV)."""
+    if isinstance(exc, UnicodeDecodeError):
+        message = 'The file is not valid UTF-8 from here on; re-save it as UTF-8 and import the remaining rows.'
+    else:
+        message = f'Unreadable CSV from here on: {exc}'
+    return {'non_field_errors': [message]}
+
+
+def _csv_rows(stream):
+    reader = csv.DictReader(stream)
+    records = iter(reader)
+    while True:
+        # The upload is decoded while it is read, so a bad byte surfaces here;
+        # the rows before it stay imported and the rest is reported, not a 500.
+        try:
+            record = next(records)
+        except StopIteration:
+            return
+        except (UnicodeDecodeError, csv.Error) as exc:
+            yield reader.line_num + 1, None, _unreadable(exc)
+            return
+        # Blank cells mean "use the default", not an empty value to validate.
+        data = {key.strip(): value for key, value in record.items() if key and value not in (None, '')}
+        try:
+            for field in LIST_FIELDS:
+                if field in data:
+                    data[field] = _split_list(data[field])
+        except ValueError as exc:
+            yield reader.line_num, None, {'non_field_errors': [f'Invalid skill list: {exc}']}
+            continue
+        yield reader.line_num, data, None
+
+
+def _jsonl_rows(stream):
+    line_number = 0
+    lines = iter(stream)
+    while True:
+        try:
+            line = next(lines)
+        except StopIteration:
+            return
+        except UnicodeDecodeError as exc:
+            yield line_number + 1, None, _unreadable(exc)
+            return
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield line_number, None, {'non_field_errors': [f'Invalid JSON: {exc}']}
+            continue
+        if not isinstance(data, dict):
+            yield line_number, None, {'non_field_errors': ['Each line must be a JSON object.']}
+            continue
+        yield line_number, data, None
+
+
+def iter_rows(stream, fmt):
+    """Yield `(line, data, errors)` for every record of a text stream."""
+    if fmt not in FORMATS:
+        raise ValueError(f'Unsupported format {fmt!r}; expected one of {", ".join(FORMATS)}.')
+    return _csv_rows(stream) if fmt == 'csv' else _jsonl_rows(stream)
+
+
+def text_stream(binary):
+    """Wrap an uploaded/binary file so it is decoded lazily, line by line."""
+    return io.TextIOWrapper(binary, encoding='utf-8-sig', newline='')
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _ingest_chunk(chunk, recruiter, report):
+    internships = []
+    for line, data, errors in chunk:
+        if errors is None:
+            serializer = InternshipSerializer(data=data)
+            if serializer.is_valid():
+                internships.append(Internship(recruiter=recruiter, **serializer.validated_data))
+                continue
+            errors = serializer.errors
+        report['errors'].append({'line': line, 'errors': errors})
+
+    if not internships:
+        return
+    with transaction.atomic():
+        created = Internship.objects.bulk_create(internships)
+        report['skills_created'] += sync_internship_skills(created, fresh=True)
+        apply_facet_counter(Counter(pair for internship in created for pair in internship_facet_pairs(internship)))
+        pks = [internship.pk for internship in created if internship.pk is not None]
+        invalidate_internship_index()
+        invalidate_internship_responses(pks)
+        invalidate_recruiter_dashboards([recruiter.pk])
+        schedule_internship_matching(*pks)
+    report['created'] += len(created)
+
+
+def ingest_internships(stream, fmt, recruiter, chunk_size=None):
+    """
+    Import internships for `recruiter` from a text stream.
+
+    Each chunk commits on its own, so a failure late in a large file keeps the
+    rows already imported; a file that cannot be decoded or parsed past some
+    line ends the import with an error entry for that line. Returns a report with `created`, `failed`,
+    `skills_created` and `errors` (`[{'line', 'errors'}]`).
+    """
+    chunk_size = chunk_size or settings.INTERNSHIP_INGEST_CHUNK_SIZE
+    report = {'created': 0, 'failed': 0, 'skills_created': 0, 'errors': []}
+    for chunk in _chunks(iter_rows(stream, fmt), chunk_size):
+        _ingest_chunk(chunk, recruiter, report)
+    report['failed'] = len(report['errors'])
+    return report
@@ -0,0 +1,91 @@
+import gzip
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.compression import brotli
+from core.models import ApplicantProfile, Internship
+from core.renderers import FastJSONRenderer, orjson
+from core.serializers import InternshipSerializer
+from core.views import InternshipViewSet
+
+
+def _best_of(iterations, func):
+    best = float("inf")
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def benchmark_payload(data, iterations):
+    """Render/compress timings (best of `iterations`, ms) and sizes (bytes) for one payload."""
+    stdlib = JSONRenderer()
+    fast = FastJSONRenderer()
+    body = stdlib.render(data)
+    result = {
+        "bytes": len(body),
+        "stdlib_ms": _best_of(iterations, lambda: stdlib.render(data)),
+        "fast_ms": _best_of(iterations, lambda: fast.render(data)),
+        "gzip_bytes": len(gzip.compress(body, compresslevel=6)),
+        "gzip_ms": _best_of(iterations, lambda: gzip.compress(body, compresslevel=6)),
+    }
+    if brotli is not None:
+        quality = settings.RESPONSE_COMPRESSION_BROTLI_QUALITY
+        result["br_bytes"] = len(brotli.compress(body, quality=quality))
+        result["br_ms"] = _best_of(iterations, lambda: brotli.compress(body, quality=quality))
+    return result
+
+
+class Command(BaseCommand):
+    help = "Benchmarks JSON rendering and compression of the internships and recommendations payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20, help="Runs per measurement (best is reported).")
+        parser.add_argument("--limit", type=int, default=500, help="Internships in the list payload.")
+        parser.add_argument("--email", help="Applicant whose recommendations are rendered (default: the first one).")
+
+    def handle(self, *args, **options):
+        iterations = max(1, options["iterations"])
+        payloads = {
+            "internships": InternshipSerializer(
+                Internship.objects.select_related("recruiter__user").order_by("-created_at")[: options["limit"]],
+                many=True,
+            ).data,
+        }
+        recommendations = self._recommendations(options.get("email"))
+        if recommendations is not None:
+            payloads["recommendations"] = recommendations
+
+        self.stdout.write(
+            f"orjson: {'yes' if orjson else 'no'}, brotli: {'yes' if brotli else 'no'}, best of {iterations} runs"
+        )
+        for name, data in payloads.items():
+            result = benchmark_payload(data, iterations)
+            line = (
+                f"{name}: {len(data)} rows, {result['bytes']} B | "
+                f"render stdlib {result['stdlib_ms']:.2f} ms, fast {result['fast_ms']:.2f} ms | "
+                f"gzip {result['gzip_bytes']} B in {result['gzip_ms']:.2f} ms"
+            )
+            if "br_bytes" in result:
+                line += f", br {result['br_bytes']} B in {result['br_ms']:.2f} ms"
+            self.stdout.write(line)
+
+    def _recommendations(self, email):
+        profiles = ApplicantProfile.objects.select_related("user")
+        profile = profiles.filter(user__email__lower=email.lower()).first() if email else profiles.order_by("pk").first()
+        if profile is None:
+            if email:
+                raise CommandError(f"No applicant profile for {email}.")
+            self.stdout.write(self.style.WARNING("No applicant profiles; skipping the recommendations payload."))
+            return None
+        request = APIRequestFactory().get("/api/internships/recommendations/")
+        force_authenticate(request, user=profile.user)
+        response = InternshipViewSet.as_view({"get": "recommendations"})(request)
+        if response.status_code != 200:
+            raise CommandError(f"Recommendations failed with HTTP {response.status_code}.")
+        return response.data
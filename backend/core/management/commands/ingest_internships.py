@@ -0,0 +1,53 @@
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.ingest import FORMATS, detect_format, ingest_internships, text_stream
+from core.models import RecruiterProfile
+
+
+class Command(BaseCommand):
+    help = "Bulk-imports internships for one recruiter from a CSV or JSONL file ('-' reads stdin)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV/JSONL file to import, or '-' for stdin.")
+        parser.add_argument("--recruiter", required=True, help="Recruiter profile id or recruiter user email.")
+        parser.add_argument("--format", choices=FORMATS, help="Input format (default: from the file extension, else csv).")
+        parser.add_argument("--chunk-size", type=int, default=None, help="Rows validated and inserted per batch.")
+        parser.add_argument("--report", help="Write the per-line error report as JSON to this file.")
+
+    def handle(self, *args, **options):
+        recruiter = self._recruiter(options["recruiter"])
+        fmt = options["format"] or detect_format(options["path"])
+
+        if options["path"] == "-":
+            report = ingest_internships(text_stream(sys.stdin.buffer), fmt, recruiter, options["chunk_size"])
+        else:
+            try:
+                handle = open(options["path"], "rb")
+            except OSError as exc:
+                raise CommandError(f"Cannot open {options['path']}: {exc}")
+            with handle:
+                report = ingest_internships(text_stream(handle), fmt, recruiter, options["chunk_size"])
+
+        if options["report"]:
+            with open(options["report"], "w", encoding="utf-8") as output:
+                json.dump(report, output, indent=2)
+        else:
+            for entry in report["errors"]:
+                self.stderr.write(f"line {entry['line']}: {json.dumps(entry['errors'])}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report['created']} internships ({report['failed']} rejected, "
+                f"{report['skills_created']} new skills)."
+            )
+        )
+
+    def _recruiter(self, value):
+        lookup = {"pk": value} if value.isdigit() else {"user__email__lower": value.lower()}
+        try:
+            return RecruiterProfile.objects.get(**lookup)
+        except RecruiterProfile.DoesNotExist:
+            raise CommandError(f"Recruiter {value!r} not found.")
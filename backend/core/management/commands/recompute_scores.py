@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.scoring import recompute_profile_scores
+
+
+class Command(BaseCommand):
+    help = "Recomputes decayed applicant recency scores and VSPS in chunks (run hourly)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Profiles read and written per query.")
+        parser.add_argument("--half-life-days", type=float, help="Recency half-life (default: RECENCY_HALF_LIFE_DAYS).")
+        parser.add_argument("--dry-run", action="store_true", help="Count the changes without writing them.")
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive.")
+        if options["half_life_days"] is not None and options["half_life_days"] <= 0:
+            raise CommandError("--half-life-days must be positive.")
+        started = time.perf_counter()
+        stats = recompute_profile_scores(
+            chunk_size=options["chunk_size"], half_life_days=options["half_life_days"], dry_run=options["dry_run"]
+        )
+        verb = "would update" if options["dry_run"] else "updated"
+        self.stdout.write(self.style.SUCCESS(
+            f"Scored {stats['profiles']} profiles, {verb} {stats['updated']} "
+            f"in {time.perf_counter() - started:.2f}s."
+        ))
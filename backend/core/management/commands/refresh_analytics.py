@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from core.analytics import refresh_platform_rollups
+
+
+class Command(BaseCommand):
+    help = "Refreshes the materialized platform analytics (incremental unless --full)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recount the whole applications-per-day history instead of only recent days.",
+        )
+
+    def handle(self, *args, **options):
+        written = refresh_platform_rollups(full=options["full"])
+        summary = ", ".join(f"{metric}: {count}" for metric, count in written.items())
+        self.stdout.write(self.style.SUCCESS(f"Refreshed platform analytics ({summary})."))
@@ -4,6 +4,7 @@ from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand, CommandError
 from django.utils.text import slugify
 
+from assessments.catalog import ensure_skills
 from core.models import ApplicantProfile, Internship, RecruiterProfile
 
 User = get_user_model()
@@ -278,6 +279,11 @@ class Command(BaseCommand):
             User.objects.filter(email__in=recruiter_emails).delete()
             self.stdout.write(self.style.WARNING("Cleared previously seeded recruiter accounts and internships."))
 
+        # Before the listings, so the skill-link signal finds them and questions
+        # are generated inline rather than on threads that die with the command.
+        skills_added = ensure_skills(
+            (skill for record in INTERNSHIP_DATA for skill in record["skills"]), defer_questions=False
+        )
         created_recruiters = 0
         created_internships = 0
 
@@ -301,7 +307,7 @@ class Command(BaseCommand):
             recruiter_profile, _ = RecruiterProfile.objects.get_or_create(user=user, defaults={"company_name": record["company"]})
             if recruiter_profile.company_name != record["company"]:
                 recruiter_profile.company_name = record["company"]
-                recruiter_profile.save(update_fields=["company_name"])
+                recruiter_profile.save(update_fields=["company_name", "updated_at"])
 
             internship, created_listing = Internship.objects.update_or_create(
                 recruiter=recruiter_profile,
@@ -319,7 +325,8 @@ class Command(BaseCommand):
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"Seeded/updated {len(INTERNSHIP_DATA)} internships ({created_internships} new) with {created_recruiters} recruiter accounts."
+                f"Seeded/updated {len(INTERNSHIP_DATA)} internships ({created_internships} new) with {created_recruiters} recruiter accounts"
+                f" and {skills_added} new catalog skills."
             )
         )
 
@@ -3,6 +3,7 @@ import itertools
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand, CommandError
 
+from assessments.catalog import ensure_skills
 from core.models import ApplicantProfile
 
 User = get_user_model()
@@ -189,6 +190,10 @@ class Command(BaseCommand):
             User.objects.filter(email__in=emails).delete()
             truncated = True
 
+        # Profile skills are linked to catalog skills on save; create them up
+        # front so their questions are generated before the command exits.
+        ensure_skills((skill for entry in STUDENT_DATA for skill in entry.get("skills", [])), defer_questions=False)
+
         for entry in STUDENT_DATA:
             email = entry["email"].lower()
             user_defaults = {
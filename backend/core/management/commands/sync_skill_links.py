@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from core.models import ApplicantProfile, Internship
+from core.skill_links import sync_applicant_skills, sync_internship_skills
+
+
+class Command(BaseCommand):
+    help = "Re-derives the applicant/internship skill link tables from the JSON skill lists."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Profiles/listings synced per batch.")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        skills_created = 0
+        for queryset, sync in (
+            (ApplicantProfile.objects.only("pk", "skills"), sync_applicant_skills),
+            (Internship.objects.only("pk", "required_skills", "preferred_skills"), sync_internship_skills),
+        ):
+            batch = []
+            for owner in queryset.order_by("pk").iterator(chunk_size=batch_size):
+                batch.append(owner)
+                if len(batch) >= batch_size:
+                    skills_created += sync(batch)
+                    batch = []
+            if batch:
+                skills_created += sync(batch)
+        self.stdout.write(self.style.SUCCESS(f"Synced skill links ({skills_created} new catalog skills)."))
@@ -0,0 +1,147 @@
+"""Percolator-style matching of new internships against stored applicants.
+
+Instead of running `RecommendationEngine.recommend` once per applicant when a
+listing is posted, every applicant's skills are kept in a single sparse TF-IDF
+matrix (`CandidateIndex`). A new internship is scored against all of them with
+one matrix-vector product and the applicants above the similarity threshold
+are stored as `InternshipMatch` rows.
+"""
+import logging
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from ml_engine.recommender import (
+    CandidateIndex,
+    CandidateProfile,
+    MicroAssessment,
+    Internship as MLInternship,
+)
+from .db_routing import use_primary
+from .models import ApplicantProfile, Internship, InternshipMatch, PlatformSettings
+from .versioning import bump_version, get_version
+
+logger = logging.getLogger(__name__)
+
+CANDIDATE_INDEX_NAMESPACE = 'candidate-index'
+
+_index_lock = threading.Lock()
+_cached_index = None  # (version, CandidateIndex)
+
+
+def skill_names(raw_skills):
+    """Flatten a JSON skill list holding strings and/or {'name': ...} dicts."""
+    names = []
+    for skill in raw_skills or []:
+        if isinstance(skill, dict):
+            label = (skill.get('name') or '').strip()
+        else:
+            label = str(skill).strip()
+        if label:
+            names.append(label)
+    return names
+
+
+def candidate_from_profile(profile):
+    return CandidateProfile(
+        id=profile.pk,
+        skills=skill_names(profile.skills),
+        micro_assessment=MicroAssessment(
+            accuracy=profile.assessment_accuracy,
+            speed_score=profile.assessment_speed_score,
+            skip_penalty=profile.assessment_skip_penalty,
+        ),
+        recency_score=profile.recency_score,
+    )
+
+
+def internship_to_ml(internship, platform_settings):
+    """Build the engine-side internship; required skills are part of its text."""
+    description = ' '.join([internship.description or ''] + skill_names(internship.required_skills))
+    return MLInternship(
+        id=internship.pk,
+        title=internship.title,
+        description=description,
+        recruiter_rating=platform_settings.recruiter_rating,
+        recency_score=platform_settings.recency_score,
+    )
+
+
+def invalidate_candidate_index():
+    bump_version(CANDIDATE_INDEX_NAMESPACE)
+
+
+def get_candidate_index():
+    """Return the process-local candidate index, rebuilding it when stale."""
+    global _cached_index
+    version = get_version(CANDIDATE_INDEX_NAMESPACE)
+    with _index_lock:
+        if _cached_index is not None and _cached_index[0] == version:
+            return _cached_index[1]
+        profiles = ApplicantProfile.objects.only(
+            'id', 'skills', 'assessment_accuracy', 'assessment_speed_score',
+            'assessment_skip_penalty', 'recency_score',
+        ).iterator(chunk_size=2000)
+        # Kept until the next version bump, so never built from a lagging replica.
+        with use_primary():
+            index = CandidateIndex().fit([candidate_from_profile(profile) for profile in profiles])
+        _cached_index = (version, index)
+        return index
+
+
+def match_internship(internship_id):
+    """Store matches for one internship and return how many were recorded."""
+    try:
+        internship = Internship.objects.get(pk=internship_id)
+    except Internship.DoesNotExist:
+        return 0
+
+    ml_internship = internship_to_ml(internship, PlatformSettings.get_settings())
+    results = get_candidate_index().match(
+        ml_internship,
+        min_similarity=settings.INTERNSHIP_MATCH_MIN_SIMILARITY,
+        top_k=settings.INTERNSHIP_MATCH_LIMIT,
+    )
+    matches = [
+        InternshipMatch(
+            internship=internship,
+            applicant_id=result['candidate'].id,
+            similarity=result['cosine_similarity'],
+            score=result['final_score'],
+        )
+        for result in results
+    ]
+    InternshipMatch.objects.bulk_create(matches, ignore_conflicts=True)
+    logger.info("Matched internship %s against %s applicants", internship_id, len(matches))
+    return len(matches)
+
+
+def _match_all(internship_ids):
+    for internship_id in internship_ids:
+        try:
+            match_internship(internship_id)
+        except Exception:
+            logger.exception("Internship matching failed for internship %s", internship_id)
+
+
+def _run_matching(internship_ids):
+    close_old_connections()
+    try:
+        # Threads start with a fresh context; the rows were just committed, so
+        # read them from the primary rather than a lagging replica.
+        with use_primary():
+            _match_all(internship_ids)
+    finally:
+        close_old_connections()
+
+
+def schedule_internship_matching(*internship_ids):
+    """Match the internships once the creating transaction has committed."""
+    def dispatch():
+        if settings.INTERNSHIP_MATCH_ASYNC:
+            threading.Thread(target=_run_matching, args=(internship_ids,), daemon=True).start()
+        else:
+            _match_all(internship_ids)
+
+    transaction.on_commit(dispatch)
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_internship_deadline_internship_duration_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InternshipMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('similarity', models.FloatField(default=0.0)),
+                ('score', models.FloatField(default=0.0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='internship_matches', to='core.applicantprofile')),
+                ('internship', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='core.internship')),
+            ],
+            options={
+                'unique_together': {('internship', 'applicant')},
+            },
+        ),
+    ]
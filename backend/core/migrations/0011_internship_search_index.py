@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+def install(apps, schema_editor):
+    from core.search import install_search_index
+    install_search_index(schema_editor)
+
+
+def uninstall(apps, schema_editor):
+    from core.search import uninstall_search_index
+    uninstall_search_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+    """
+    Full-text search over title, description, responsibilities and skills:
+    a generated tsvector column + GIN index on PostgreSQL, an FTS5 table on SQLite.
+    """
+
+    dependencies = [
+        ('core', '0010_internshipmatch'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
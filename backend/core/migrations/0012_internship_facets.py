@@ -0,0 +1,85 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:44
+
+from collections import Counter
+
+from django.db import migrations, models
+
+
+# Frozen copy of the bucketing in core.facets at the time of this migration;
+# the live module (and its ml_engine imports) may change later.
+FACET_FIELDS = ('location', 'work_type', 'status', 'stipend', 'required_skills')
+STIPEND_BUCKETS = [(1, 'unpaid'), (5000, '1-4999'), (10000, '5000-9999'), (20000, '10000-19999'), (None, '20000+')]
+
+
+def stipend_bucket(stipend):
+    if stipend is None:
+        return 'unspecified'
+    for upper, label in STIPEND_BUCKETS:
+        if upper is None or stipend < upper:
+            return label
+
+
+def facet_pairs(values):
+    pairs = {
+        ('location', values.get('location') or ''),
+        ('work_type', values.get('work_type') or ''),
+        ('status', values.get('status') or ''),
+        ('stipend', stipend_bucket(values.get('stipend'))),
+    }
+    for skill in values.get('required_skills') or []:
+        name = (skill.get('name') or '').strip() if isinstance(skill, dict) else str(skill).strip()
+        if name:
+            pairs.add(('skill', name.lower()))
+    return pairs
+
+
+def populate_facet_counts(apps, schema_editor):
+    Internship = apps.get_model('core', 'Internship')
+    InternshipFacetCount = apps.get_model('core', 'InternshipFacetCount')
+    counter = Counter()
+    for values in Internship.objects.values(*FACET_FIELDS).iterator():
+        counter.update(facet_pairs(values))
+    InternshipFacetCount.objects.bulk_create(
+        [InternshipFacetCount(facet=facet, value=value[:255], count=count) for (facet, value), count in counter.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_internship_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InternshipFacetCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('facet', models.CharField(max_length=32)),
+                ('value', models.CharField(max_length=255)),
+                ('count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='internship',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='intern_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='internship',
+            index=models.Index(fields=['location', '-created_at', '-id'], name='intern_location_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='internship',
+            index=models.Index(fields=['work_type', '-created_at', '-id'], name='intern_worktype_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='internship',
+            index=models.Index(fields=['stipend'], name='intern_stipend_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='internshipfacetcount',
+            unique_together={('facet', 'value')},
+        ),
+        migrations.RunPython(populate_facet_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:06
+
+from django.db import migrations, models
+
+
+def install_gin(apps, schema_editor):
+    from core.indexes import install_gin_indexes
+    install_gin_indexes(schema_editor)
+
+
+def uninstall_gin(apps, schema_editor):
+    from core.indexes import uninstall_gin_indexes
+    uninstall_gin_indexes(schema_editor)
+
+
+class Migration(migrations.Migration):
+    """
+    Composite indexes for the hot application/applicant queries, plus GIN
+    indexes on the JSON skill lists (PostgreSQL only, see core.indexes).
+    """
+
+    dependencies = [
+        ('core', '0014_platformrollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='applicantprofile',
+            index=models.Index(fields=['-vsps_score'], name='applicant_vsps_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['internship', 'status'], name='app_internship_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['applicant', '-applied_at'], name='app_applicant_applied_idx'),
+        ),
+        migrations.RunPython(install_gin, uninstall_gin),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0001_initial'),
+        ('core', '0015_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicantSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('verified', 'Verified')], default='pending', max_length=20)),
+                ('score', models.FloatField(blank=True, null=True)),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='core.applicantprofile')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applicant_links', to='assessments.skill')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'status', 'applicant'], name='applicant_skill_lookup_idx')],
+                'unique_together': {('applicant', 'skill')},
+            },
+        ),
+        migrations.CreateModel(
+            name='InternshipSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('required', 'Required'), ('preferred', 'Preferred')], default='required', max_length=20)),
+                ('internship', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='core.internship')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='internship_links', to='assessments.skill')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'kind', 'internship'], name='internship_skill_lookup_idx')],
+                'unique_together': {('internship', 'skill')},
+            },
+        ),
+    ]
@@ -0,0 +1,90 @@
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def _entries(raw_skills):
+    for raw in raw_skills or []:
+        if isinstance(raw, dict):
+            name, entry = raw.get('name'), raw
+        else:
+            name, entry = raw, {}
+        name = ' '.join(name.split())[:100] if isinstance(name, str) else ''
+        if name:
+            yield name, entry
+
+
+def _score(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def backfill_skill_links(apps, schema_editor):
+    """
+    Derive ApplicantSkill/InternshipSkill rows from the JSON skill lists.
+
+    Uses the historical models (the runtime catalog and its cache are not
+    available here), so names are matched case-insensitively in Python.
+    Internship skills missing from the catalog are inserted in one batch
+    (their questions are generated the first time an assessment for them is
+    started); self-reported applicant skills only link to catalog skills.
+    """
+    Skill = apps.get_model('assessments', 'Skill')
+    ApplicantProfile = apps.get_model('core', 'ApplicantProfile')
+    Internship = apps.get_model('core', 'Internship')
+    ApplicantSkill = apps.get_model('core', 'ApplicantSkill')
+    InternshipSkill = apps.get_model('core', 'InternshipSkill')
+
+    profiles = ApplicantProfile.objects.only('pk', 'skills').order_by('pk')
+    internships = Internship.objects.only('pk', 'required_skills', 'preferred_skills').order_by('pk')
+
+    skill_ids = {}
+    for pk, name in Skill.objects.order_by('pk').values_list('pk', 'name'):
+        skill_ids.setdefault(' '.join(name.split()).lower(), pk)
+    missing = {}
+    for internship in internships.iterator(chunk_size=BATCH_SIZE):
+        for name, _ in _entries(list(internship.required_skills or []) + list(internship.preferred_skills or [])):
+            if name.lower() not in skill_ids:
+                missing.setdefault(name.lower(), name)
+    if missing:
+        Skill.objects.bulk_create(
+            [Skill(name=name) for name in missing.values()], batch_size=BATCH_SIZE, ignore_conflicts=True
+        )
+        for pk, name in Skill.objects.order_by('pk').values_list('pk', 'name'):
+            skill_ids.setdefault(name.lower(), pk)
+
+    links = {}
+    for profile in profiles.iterator(chunk_size=BATCH_SIZE):
+        for name, entry in _entries(profile.skills):
+            if name.lower() not in skill_ids:
+                continue
+            links.setdefault((profile.pk, skill_ids[name.lower()]), ApplicantSkill(
+                applicant_id=profile.pk,
+                skill_id=skill_ids[name.lower()],
+                status='verified' if entry.get('status') == 'verified' else 'pending',
+                score=_score(entry.get('last_score')),
+            ))
+    ApplicantSkill.objects.bulk_create(links.values(), batch_size=BATCH_SIZE, ignore_conflicts=True)
+
+    links = {}
+    for internship in internships.iterator(chunk_size=BATCH_SIZE):
+        for kind, raw_skills in (('required', internship.required_skills), ('preferred', internship.preferred_skills)):
+            for name, _ in _entries(raw_skills):
+                links.setdefault((internship.pk, skill_ids[name.lower()]), InternshipSkill(
+                    internship_id=internship.pk, skill_id=skill_ids[name.lower()], kind=kind,
+                ))
+    InternshipSkill.objects.bulk_create(links.values(), batch_size=BATCH_SIZE, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0001_initial'),
+        ('core', '0016_skill_links'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_skill_links, migrations.RunPython.noop),
+    ]
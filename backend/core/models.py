@@ -26,6 +26,13 @@ class ApplicantProfile(models.Model):
     mobile_number = models.CharField(max_length=20, blank=True)
     github_link = models.URLField(blank=True)
     linkedin_link = models.URLField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Applicant rankings order by VSPS (applicants list, recommendations)
+        indexes = [
+            models.Index(fields=['-vsps_score'], name='applicant_vsps_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.email} Profile"
@@ -35,6 +42,7 @@ class RecruiterProfile(models.Model):
     company_name = models.CharField(max_length=255)
     company_website = models.URLField(blank=True)
     is_verified = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
         return self.company_name
@@ -61,6 +69,85 @@ class Internship(models.Model):
     deadline = models.DateField(null=True, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='OPEN')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Facet filters combined with the (created_at, id) keyset ordering of the list
+        indexes = [
+            models.Index(fields=['status', '-created_at', '-id'], name='intern_status_created_idx'),
+            models.Index(fields=['location', '-created_at', '-id'], name='intern_location_created_idx'),
+            models.Index(fields=['work_type', '-created_at', '-id'], name='intern_worktype_created_idx'),
+            models.Index(fields=['stipend'], name='intern_stipend_idx'),
+        ]
+
+class ApplicantSkill(models.Model):
+    """Relational copy of `ApplicantProfile.skills` (see core.skill_links)."""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('verified', 'Verified'),
+    ]
+
+    applicant = models.ForeignKey(ApplicantProfile, on_delete=models.CASCADE, related_name='skill_links')
+    skill = models.ForeignKey('assessments.Skill', on_delete=models.CASCADE, related_name='applicant_links')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    # Latest assessment score for this skill, in percent
+    score = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ('applicant', 'skill')
+        indexes = [
+            # "who has (verified) skill X"
+            models.Index(fields=['skill', 'status', 'applicant'], name='applicant_skill_lookup_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.applicant_id} -> {self.skill_id} ({self.status})"
+
+class InternshipSkill(models.Model):
+    """Relational copy of `Internship.required_skills`/`preferred_skills` (see core.skill_links)."""
+    KIND_CHOICES = [
+        ('required', 'Required'),
+        ('preferred', 'Preferred'),
+    ]
+
+    internship = models.ForeignKey(Internship, on_delete=models.CASCADE, related_name='skill_links')
+    skill = models.ForeignKey('assessments.Skill', on_delete=models.CASCADE, related_name='internship_links')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='required')
+
+    class Meta:
+        unique_together = ('internship', 'skill')
+        indexes = [
+            # "which listings need skill Y"
+            models.Index(fields=['skill', 'kind', 'internship'], name='internship_skill_lookup_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.internship_id} -> {self.skill_id} ({self.kind})"
+
+class InternshipFacetCount(models.Model):
+    """Precomputed listing count per facet value, maintained incrementally (see core.facets)."""
+    facet = models.CharField(max_length=32)
+    value = models.CharField(max_length=255)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('facet', 'value')
+
+    def __str__(self):
+        return f"{self.facet}={self.value}: {self.count}"
+
+class PlatformRollup(models.Model):
+    """Materialized platform analytics figure (see core.analytics)."""
+    metric = models.CharField(max_length=64)
+    bucket = models.CharField(max_length=64)
+    value = models.FloatField(default=0.0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('metric', 'bucket')
+
+    def __str__(self):
+        return f"{self.metric}[{self.bucket}] = {self.value}"
 
 class PlatformSettings(models.Model):
     """Global platform settings"""
@@ -89,15 +176,9 @@ class PlatformSettings(models.Model):
 
     @classmethod
     def get_settings(cls):
-        """Get the singleton platform settings instance"""
-        settings, created = cls.objects.get_or_create(
-            pk=1,
-            defaults={
-                'enforce_2fa_for_admins_recruiters': True,
-                'auto_approve_verified_recruiters': False,
-            },
-        )
-        return settings
+        """Get the singleton platform settings instance (cached, see core.platform_settings)"""
+        from .platform_settings import get_platform_settings
+        return get_platform_settings()
 
     def __str__(self):
         return "Platform Settings"
@@ -117,6 +198,26 @@ class Application(models.Model):
     
     class Meta:
         unique_together = ('internship', 'applicant')
+        indexes = [
+            # Recruiter pipelines filter an internship's applications by status
+            models.Index(fields=['internship', 'status'], name='app_internship_status_idx'),
+            # Applicants list their own applications, newest first
+            models.Index(fields=['applicant', '-applied_at'], name='app_applicant_applied_idx'),
+        ]
 
     def __str__(self):
         return f"{self.applicant.user.email} -> {self.internship.title}"
+
+class InternshipMatch(models.Model):
+    """Applicant found by reverse-matching a newly posted internship."""
+    internship = models.ForeignKey(Internship, on_delete=models.CASCADE, related_name='matches')
+    applicant = models.ForeignKey(ApplicantProfile, on_delete=models.CASCADE, related_name='internship_matches')
+    similarity = models.FloatField(default=0.0)
+    score = models.FloatField(default=0.0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('internship', 'applicant')
+
+    def __str__(self):
+        return f"{self.internship_id} ~ {self.applicant_id} ({self.similarity:.2f})"
@@ -0,0 +1,25 @@
+from rest_framework.pagination import CursorPagination
+
+
+class InternshipCursorPagination(CursorPagination):
+    """Keyset pagination over (created_at, id); page cost is independent of depth."""
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class ApplicantCursorPagination(CursorPagination):
+    """Applicants of one internship, best VSPS first (`vsps_rank` is annotated by the view)."""
+    ordering = ('-vsps_rank', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class ApplicationCursorPagination(CursorPagination):
+    """Applications newest first; matches the (applicant, -applied_at) index."""
+    ordering = ('-applied_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
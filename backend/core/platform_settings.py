@@ -0,0 +1,70 @@
+"""Cached access to the `PlatformSettings` singleton.
+
+The settings are read on every login and by the matching/index code, but
+change only when an admin saves them. Each process keeps the row it last
+loaded together with the version of the shared `platform-settings` counter it
+was loaded under; saves bump the counter, so every worker reloads on its next
+read. A cold process first tries the copy stored in the cache backend under
+the current version and only then queries the database.
+"""
+import copy
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .db_routing import use_primary
+from .versioning import bump_version, get_version
+
+PLATFORM_SETTINGS_NAMESPACE = 'platform-settings'
+SINGLETON_DEFAULTS = {
+    'enforce_2fa_for_admins_recruiters': True,
+    'auto_approve_verified_recruiters': False,
+}
+
+_lock = threading.Lock()
+_cached = {'version': None, 'instance': None}
+
+
+def invalidate_platform_settings():
+    bump_version(PLATFORM_SETTINGS_NAMESPACE)
+    # A reader inside the saving transaction may reload (and share) the
+    # uncommitted row in between; bump again once it is visible to everyone.
+    transaction.on_commit(lambda: bump_version(PLATFORM_SETTINGS_NAMESPACE))
+
+
+def _remember(version, instance):
+    with _lock:
+        _cached['version'] = version
+        _cached['instance'] = instance
+
+
+def get_platform_settings():
+    """
+    Return the singleton settings row, creating it with defaults if missing.
+
+    Callers get their own copy and may modify and save it.
+    """
+    from .models import PlatformSettings
+
+    version = get_version(PLATFORM_SETTINGS_NAMESPACE)
+    with _lock:
+        if _cached['version'] == version:
+            return copy.copy(_cached['instance'])
+
+    cache_key = f'platform-settings:{version}'
+    instance = cache.get(cache_key)
+    if instance is None:
+        with use_primary():
+            instance, _ = PlatformSettings.objects.get_or_create(pk=1, defaults=SINGLETON_DEFAULTS)
+
+        def publish():
+            cache.set(cache_key, instance, timeout=settings.PLATFORM_SETTINGS_CACHE_TIMEOUT)
+            _remember(version, instance)
+
+        # Only share rows that are committed.
+        transaction.on_commit(publish)
+    else:
+        _remember(version, instance)
+    return copy.copy(instance)
@@ -0,0 +1,40 @@
+"""EXPLAIN helpers for asserting that hot queries can use their indexes.
+
+On PostgreSQL the plan comes from `EXPLAIN` with sequential scans
+discouraged, because test tables are tiny and the planner would otherwise
+always prefer a seq scan. The question being answered is "can this query use
+the index", not "is it the cheapest plan for three rows". On SQLite the plan
+comes from `EXPLAIN QUERY PLAN`.
+"""
+from django.db import connections, router
+
+INDEX_MARKERS = {
+    'postgresql': ('Index Scan', 'Index Only Scan', 'Bitmap Index Scan'),
+    'sqlite': ('USING INDEX', 'USING COVERING INDEX'),
+}
+
+
+def explain(queryset):
+    """Return the textual plan of `queryset` on its database."""
+    alias = queryset.db or router.db_for_read(queryset.model)
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        return queryset.explain()
+    with connection.cursor() as cursor:
+        cursor.execute('SET enable_seqscan = off')
+        try:
+            return queryset.explain()
+        finally:
+            cursor.execute('RESET enable_seqscan')
+
+
+def used_indexes(plan, vendor):
+    """Plan lines that read through an index."""
+    markers = INDEX_MARKERS.get(vendor, ())
+    return [line.strip() for line in plan.splitlines() if any(marker in line for marker in markers)]
+
+
+def uses_index(queryset, index_name):
+    """True when the plan of `queryset` reads through `index_name`."""
+    vendor = connections[queryset.db].vendor
+    return any(index_name in line for line in used_indexes(explain(queryset), vendor))
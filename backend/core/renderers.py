@@ -0,0 +1,35 @@
+"""JSON renderer backed by orjson when it is installed.
+
+orjson serializes DRF's plain dict/list payloads several times faster than
+the stdlib encoder. Values it does not handle natively (Decimal, lazy
+translation strings, querysets, ...) and date/time values, whose DRF format
+differs from orjson's, go through DRF's own encoder, so the output matches
+`JSONRenderer`. Indented (browsable API, `; indent=`) or ASCII-only output
+falls back to the stdlib path, as does everything when orjson is missing.
+"""
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+ORJSON_OPTIONS = (
+    (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+)
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    _fallback_encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        rendered = orjson.dumps(data, default=self._fallback_encoder.default, option=ORJSON_OPTIONS)
+        # Same JavaScript-safe escaping as JSONRenderer.
+        if b'\xe2\x80\xa8' in rendered or b'\xe2\x80\xa9' in rendered:
+            rendered = rendered.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return rendered
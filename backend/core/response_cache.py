@@ -0,0 +1,148 @@
+"""Shared response cache for anonymous internship listing endpoints.
+
+Anonymous `list` and `retrieve` responses are cached in the default cache
+(local memory in development, Redis when REDIS_URL is set). List entries are
+keyed on the normalized query string under a version that every internship
+or recruiter change bumps; detail entries carry a per-internship version so a
+save only invalidates the listings it actually touches.
+
+Hit and miss counters live in the same cache so every worker reports into one
+set of numbers.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe, urlencode
+from rest_framework import status
+from rest_framework.response import Response
+
+from .versioning import bump_version, get_version
+
+LIST_NAMESPACE = 'internship-list-responses'
+CACHED_HEADERS = ('ETag', 'Last-Modified')
+STATS_SCOPES = ('list', 'retrieve')
+
+
+def _detail_namespace(pk):
+    return f'internship-response:{pk}'
+
+
+def normalized_query(params):
+    """Sorted, blank-free query string so equivalent URLs share an entry."""
+    pairs = sorted(
+        (key, value)
+        for key, values in params.lists()
+        for value in values
+        if value != ''
+    )
+    return urlencode(pairs)
+
+
+def list_cache_key(request):
+    digest = hashlib.sha1(
+        f'{request.get_host()}|{normalized_query(request.query_params)}'.encode('utf-8')
+    ).hexdigest()
+    return f'response-cache:internships:list:{get_version(LIST_NAMESPACE)}:{digest}'
+
+
+def detail_cache_key(request, pk):
+    version = get_version(_detail_namespace(pk))
+    # ?fields= / ?view= select a different representation of the same listing.
+    digest = hashlib.sha1(normalized_query(request.query_params).encode('utf-8')).hexdigest()[:16]
+    return f'response-cache:internships:detail:{pk}:{version}:{request.get_host()}:{digest}'
+
+
+def _bump(namespaces):
+    for namespace in namespaces:
+        bump_version(namespace)
+
+
+def invalidate_internship_responses(pks=()):
+    """Drop cached listings plus the detail entries of `pks`."""
+    namespaces = [LIST_NAMESPACE] + [_detail_namespace(pk) for pk in pks]
+    # Bump now for readers in this transaction and again once others can see it.
+    _bump(namespaces)
+    transaction.on_commit(lambda: _bump(namespaces))
+
+
+def _stats_key(scope, outcome):
+    return f'response-cache:stats:{scope}:{outcome}'
+
+
+def record(scope, outcome):
+    key = _stats_key(scope, outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def response_cache_stats():
+    """Hit/miss counters per endpoint since the cache was last cleared."""
+    report = {}
+    for scope in STATS_SCOPES:
+        hits = cache.get(_stats_key(scope, 'hit'), 0)
+        misses = cache.get(_stats_key(scope, 'miss'), 0)
+        total = hits + misses
+        report[scope] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / total, 4) if total else None,
+        }
+    return report
+
+
+def reset_response_cache_stats():
+    cache.delete_many([_stats_key(scope, outcome) for scope in STATS_SCOPES for outcome in ('hit', 'miss')])
+
+
+class AnonymousResponseCacheMixin:
+    """
+    Serve anonymous `list`/`retrieve` from the shared cache.
+
+    Authenticated requests always bypass it. Only 200 responses are stored,
+    together with their validators so cached hits still answer 304s.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+        return self._cached_response(
+            'list', list_cache_key(request), lambda: super(AnonymousResponseCacheMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().retrieve(request, *args, **kwargs)
+        pk = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        return self._cached_response(
+            'retrieve',
+            detail_cache_key(request, pk),
+            lambda: super(AnonymousResponseCacheMixin, self).retrieve(request, *args, **kwargs),
+        )
+
+    def _cached_response(self, scope, key, render):
+        entry = cache.get(key)
+        if entry is not None:
+            record(scope, 'hit')
+            data, headers = entry
+            not_modified = get_conditional_response(
+                self.request._request,
+                etag=headers.get('ETag'),
+                last_modified=parse_http_date_safe(headers.get('Last-Modified', '')),
+            )
+            response = Response(status=status.HTTP_304_NOT_MODIFIED) if not_modified else Response(data)
+            for name, value in headers.items():
+                response[name] = value
+            return response
+
+        record(scope, 'miss')
+        response = render()
+        if response.status_code == status.HTTP_200_OK:
+            headers = {name: response[name] for name in CACHED_HEADERS if response.has_header(name)}
+            cache.set(key, (response.data, headers), timeout=settings.RESPONSE_CACHE_TIMEOUT)
+        return response
@@ -0,0 +1,101 @@
+"""Bulk recomputation of applicant recency and VSPS scores.
+
+`recency_score` decays exponentially with the time since the applicant's
+last activity (login, application or assessment attempt), halving every
+`RECENCY_HALF_LIFE_DAYS`. `vsps_score` is re-derived from the stored
+micro-assessment scores with the engine's formula, for applicants whose
+accuracy reached the assessment pass mark (below it, submit keeps the
+previous VSPS and so do we).
+
+Profiles are read in primary-key order, one chunk per query with the latest
+application and attempt as correlated subqueries, scored with NumPy and
+written back with one `bulk_update` (a single UPDATE) per chunk. Rows whose
+scores moved by less than `SCORE_TOLERANCE` are not written. `updated_at`
+is not the activity clock, so it is bumped on written rows to keep the
+profile ETags honest.
+"""
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from assessments.models import AssessmentAttempt
+from ml_engine.recommender import decayed_recency, vsps_scores
+
+from .matching import invalidate_candidate_index
+from .models import ApplicantProfile, Application
+
+PASS_ACCURACY = 0.6  # assessments.views.AssessmentViewSet.submit
+SCORE_TOLERANCE = 1e-4
+SECONDS_PER_DAY = 86400.0
+
+SCORE_COLUMNS = (
+    'pk', 'recency_score', 'vsps_score',
+    'assessment_accuracy', 'assessment_speed_score', 'assessment_skip_penalty',
+)
+ACTIVITY_COLUMNS = ('user__last_login', 'user__date_joined', 'last_applied_at', 'last_assessed_at')
+
+
+def _profile_rows():
+    last_applied = Application.objects.filter(applicant=OuterRef('pk')).order_by('-applied_at').values('applied_at')[:1]
+    last_assessed = (
+        AssessmentAttempt.objects.filter(user=OuterRef('user_id')).order_by('-start_time').values('start_time')[:1]
+    )
+    return (
+        ApplicantProfile.objects.annotate(
+            last_applied_at=Subquery(last_applied), last_assessed_at=Subquery(last_assessed)
+        )
+        .order_by('pk')
+        .values_list(*SCORE_COLUMNS, *ACTIVITY_COLUMNS)
+    )
+
+
+def _timestamps(values):
+    return np.array([value.timestamp() if value is not None else np.nan for value in values], dtype=float)
+
+
+def score_chunk(rows, now, half_life_days):
+    """Return `(pks, recency, vsps, changed)` arrays for rows shaped like `_profile_rows()`."""
+    columns = list(zip(*rows))
+    pks = np.array(columns[0], dtype=np.int64)
+    old_recency, old_vsps, accuracy, speed, skip = (np.array(column, dtype=float) for column in columns[1:6])
+
+    # Latest of the activity columns; date_joined is always set.
+    last_activity = np.fmax.reduce([_timestamps(column) for column in columns[6:]])
+    age_days = (now.timestamp() - last_activity) / SECONDS_PER_DAY
+    recency = decayed_recency(age_days, half_life_days)
+    vsps = np.where(accuracy >= PASS_ACCURACY, vsps_scores(accuracy, speed, skip), old_vsps)
+
+    changed = (np.abs(recency - old_recency) >= SCORE_TOLERANCE) | (np.abs(vsps - old_vsps) >= SCORE_TOLERANCE)
+    return pks, recency, vsps, changed
+
+
+def recompute_profile_scores(chunk_size=5000, half_life_days=None, now=None, dry_run=False):
+    """Recompute every applicant's recency and VSPS; returns `{'profiles': n, 'updated': m}`."""
+    half_life_days = half_life_days or settings.RECENCY_HALF_LIFE_DAYS
+    now = now or timezone.now()
+    rows_query = _profile_rows()
+    stats = {'profiles': 0, 'updated': 0}
+    last_pk = 0
+    while True:
+        rows = list(rows_query.filter(pk__gt=last_pk)[:chunk_size])
+        if not rows:
+            break
+        last_pk = rows[-1][0]
+        pks, recency, vsps, changed = score_chunk(rows, now, half_life_days)
+        stats['profiles'] += len(rows)
+        stats['updated'] += int(changed.sum())
+        if dry_run or not changed.any():
+            continue
+        profiles = [
+            ApplicantProfile(pk=int(pk), recency_score=float(r), vsps_score=float(v), updated_at=now)
+            for pk, r, v in zip(pks[changed], recency[changed], vsps[changed])
+        ]
+        with transaction.atomic():
+            # bulk_update skips auto_now, hence the explicit updated_at.
+            ApplicantProfile.objects.bulk_update(profiles, ['recency_score', 'vsps_score', 'updated_at'])
+
+    if stats['updated'] and not dry_run:
+        invalidate_candidate_index()
+    return stats
@@ -0,0 +1,227 @@
+"""Database-native full-text search over internships.
+
+PostgreSQL: a stored, generated `search_document` tsvector column on
+`core_internship` with a GIN index (migration 0011), queried with
+`websearch_to_tsquery`, ranked with `ts_rank_cd` and highlighted with
+`ts_headline`.
+
+SQLite (local development and tests): an external-content FTS5 table kept in
+sync by triggers, ranked with `bm25()` and highlighted with `highlight()` /
+`snippet()`. SQLite rebuilds tables on many schema changes, which drops the
+triggers, so `ensure_sqlite_search_index` re-installs them after every
+migrate.
+
+Other backends, or SQLite builds without FTS5, fall back to `icontains`.
+"""
+import html
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from .models import Internship
+
+SEARCH_FIELDS = ('title', 'description', 'responsibilities', 'required_skills')
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_STOP = '</mark>'
+# The database brackets matches with these private-use characters; the text
+# is HTML-escaped before they become <mark> tags (see `_highlight_html`).
+MATCH_START = '\ue000'
+MATCH_STOP = '\ue001'
+
+FTS_TABLE = 'core_internship_fts'
+
+POSTGRES_INSTALL = [
+    """
+    ALTER TABLE core_internship ADD COLUMN IF NOT EXISTS search_document tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(required_skills::text, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(responsibilities, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS core_internship_search_gin ON core_internship USING GIN (search_document)",
+]
+POSTGRES_UNINSTALL = [
+    "DROP INDEX IF EXISTS core_internship_search_gin",
+    "ALTER TABLE core_internship DROP COLUMN IF EXISTS search_document",
+]
+
+_COLUMNS = ', '.join(SEARCH_FIELDS)
+_NEW_VALUES = ', '.join(f'new.{field}' for field in SEARCH_FIELDS)
+_OLD_VALUES = ', '.join(f'old.{field}' for field in SEARCH_FIELDS)
+
+SQLITE_TABLE = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"{_COLUMNS}, content='core_internship', content_rowid='id')"
+)
+SQLITE_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON core_internship BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {_COLUMNS}) VALUES (new.id, {_NEW_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON core_internship BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLUMNS}) VALUES ('delete', old.id, {_OLD_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON core_internship BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLUMNS}) VALUES ('delete', old.id, {_OLD_VALUES});
+        INSERT INTO {FTS_TABLE}(rowid, {_COLUMNS}) VALUES (new.id, {_NEW_VALUES});
+    END
+    """,
+]
+SQLITE_UNINSTALL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+_fts5_support = {}
+
+
+def sqlite_has_fts5(conn):
+    if conn.alias not in _fts5_support:
+        with conn.cursor() as cursor:
+            cursor.execute("PRAGMA compile_options")
+            _fts5_support[conn.alias] = any(row[0] == 'ENABLE_FTS5' for row in cursor.fetchall())
+    return _fts5_support[conn.alias]
+
+
+def search_backend(conn=connection):
+    if conn.vendor == 'postgresql':
+        return 'postgresql'
+    if conn.vendor == 'sqlite' and sqlite_has_fts5(conn):
+        return 'sqlite'
+    return 'fallback'
+
+
+def ensure_sqlite_search_index(conn):
+    """Re-create missing FTS5 triggers (after a table rebuild) and reindex."""
+    if search_backend(conn) != 'sqlite':
+        return
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+        if not cursor.fetchone()[0]:
+            # Migration 0011 has not been applied (or was reversed).
+            return
+        cursor.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE %s",
+            [f'{FTS_TABLE}_a_'],
+        )
+        if cursor.fetchone()[0] == len(SQLITE_TRIGGERS):
+            return
+        cursor.execute(SQLITE_TABLE)
+        for statement in SQLITE_TRIGGERS:
+            cursor.execute(statement)
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def install_search_index(schema_editor):
+    conn = schema_editor.connection
+    backend = search_backend(conn)
+    if backend == 'postgresql':
+        for statement in POSTGRES_INSTALL:
+            schema_editor.execute(statement)
+    elif backend == 'sqlite':
+        with conn.cursor() as cursor:
+            cursor.execute(SQLITE_TABLE)
+        ensure_sqlite_search_index(conn)
+
+
+def uninstall_search_index(schema_editor):
+    backend = search_backend(schema_editor.connection)
+    statements = {'postgresql': POSTGRES_UNINSTALL, 'sqlite': SQLITE_UNINSTALL}.get(backend, [])
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def _fts5_query(text):
+    """Turn free text into an FTS5 query of quoted prefix terms (implicit AND)."""
+    terms = re.findall(r'\w+', text, flags=re.UNICODE)
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def _search_postgresql(text, limit, offset):
+    sql = f"""
+        SELECT i.id,
+               ts_rank_cd(i.search_document, q) AS rank,
+               ts_headline('english', i.title, q,
+                           'StartSel={MATCH_START}, StopSel={MATCH_STOP}, HighlightAll=true'),
+               ts_headline('english', i.description, q,
+                           'StartSel={MATCH_START}, StopSel={MATCH_STOP}, MaxFragments=2, MaxWords=24, MinWords=8')
+        FROM core_internship i, websearch_to_tsquery('english', %s) q
+        WHERE i.search_document @@ q
+        ORDER BY rank DESC, i.id DESC
+        LIMIT %s OFFSET %s
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [text, limit, offset])
+        return cursor.fetchall()
+
+
+def _search_sqlite(text, limit, offset):
+    query = _fts5_query(text)
+    if not query:
+        return []
+    # bm25() is lower-is-better; negate it so every backend ranks descending.
+    sql = f"""
+        SELECT rowid,
+               -bm25({FTS_TABLE}, 10.0, 3.0, 1.0, 10.0) AS rank,
+               highlight({FTS_TABLE}, 0, %s, %s),
+               snippet({FTS_TABLE}, 1, %s, %s, '…', 24)
+        FROM {FTS_TABLE}
+        WHERE {FTS_TABLE} MATCH %s
+        ORDER BY rank DESC, rowid DESC
+        LIMIT %s OFFSET %s
+    """
+    params = [MATCH_START, MATCH_STOP, MATCH_START, MATCH_STOP, query, limit, offset]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _search_fallback(text, limit, offset):
+    condition = Q()
+    for term in text.split():
+        term_condition = Q()
+        for field in SEARCH_FIELDS:
+            term_condition |= Q(**{f'{field}__icontains': term})
+        condition &= term_condition
+    ids = Internship.objects.filter(condition).order_by('-created_at', '-id').values_list('id', 'title', 'description')
+    return [(pk, 0.0, title, description) for pk, title, description in ids[offset:offset + limit]]
+
+
+def _highlight_html(value):
+    """Escape recruiter-controlled text, then turn the match markers into <mark> tags."""
+    if value is None:
+        return None
+    escaped = html.escape(value, quote=True)
+    return escaped.replace(MATCH_START, HIGHLIGHT_START).replace(MATCH_STOP, HIGHLIGHT_STOP)
+
+
+def search_internships(text, limit=20, offset=0):
+    """
+    Return ranked hits as `[{'id', 'rank', 'highlights': {'title', 'description'}}]`.
+
+    Highlights are safe HTML: the listing text is escaped and only the
+    `<mark>` tags around matches are markup.
+    """
+    text = (text or '').strip()
+    if not text:
+        return []
+    backend = search_backend()
+    runner = {'postgresql': _search_postgresql, 'sqlite': _search_sqlite}.get(backend, _search_fallback)
+    return [
+        {
+            'id': pk,
+            'rank': float(rank or 0.0),
+            'highlights': {'title': _highlight_html(title_hl), 'description': _highlight_html(description_hl)},
+        }
+        for pk, rank, title_hl, description_hl in runner(text, limit, offset)
+    ]
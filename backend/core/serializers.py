@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from .fieldsets import SparseFieldsetSerializerMixin
 from .models import ApplicantProfile, RecruiterProfile, Internship
 
-class ApplicantProfileSerializer(serializers.ModelSerializer):
+class ApplicantProfileSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     email = serializers.EmailField(source='user.email')
     first_name = serializers.CharField(source='user.first_name', read_only=True)
     last_name = serializers.CharField(source='user.last_name', read_only=True)
@@ -15,6 +16,13 @@ class ApplicantProfileSerializer(serializers.ModelSerializer):
                   'interested_role',
                   'assessment_accuracy', 'assessment_speed_score', 'assessment_skip_penalty',
                   'vsps_score', 'recency_score', 'mobile_number', 'github_link', 'linkedin_link']
+        compact_fields = ['id', 'first_name', 'last_name', 'email', 'skills', 'college', 'vsps_score']
+        field_sources = {
+            'email': ('user__email',),
+            'first_name': ('user__first_name',),
+            'last_name': ('user__last_name',),
+            'education': ('degree',),
+        }
         extra_kwargs = {
             'email': {'required': False},
             # degree/education are optional
@@ -45,14 +53,18 @@ class ApplicantProfileSerializer(serializers.ModelSerializer):
             
         return instance
 
-class RecruiterProfileSerializer(serializers.ModelSerializer):
+class RecruiterProfileSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     email = serializers.EmailField(source='user.email', read_only=True)
+    # Annotated on the admin list; omitted where the queryset does not count.
+    internship_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = RecruiterProfile
-        fields = ['id', 'email', 'company_name', 'company_website', 'is_verified']
+        fields = ['id', 'email', 'company_name', 'company_website', 'is_verified', 'internship_count']
+        compact_fields = ['id', 'company_name', 'is_verified']
+        field_sources = {'email': ('user__email',), 'internship_count': ()}
 
-class InternshipSerializer(serializers.ModelSerializer):
+class InternshipSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     recruiter_name = serializers.CharField(source='recruiter.user.get_full_name', read_only=True)
     company_name = serializers.CharField(source='recruiter.company_name', read_only=True)
     recruiter_email = serializers.EmailField(source='recruiter.user.email', read_only=True)
@@ -86,16 +98,27 @@ class InternshipSerializer(serializers.ModelSerializer):
             'start_date',
             'deadline',
             'created_at',
+            'updated_at',
             'recruiter',
             'recruiter_name',
             'recruiter_email',
             'company_name',
         ]
-        read_only_fields = ['recruiter', 'created_at']
+        read_only_fields = ['recruiter', 'created_at', 'updated_at']
+        # Card view: no long text, no recruiter contact details
+        compact_fields = [
+            'id', 'title', 'company_name', 'location', 'work_type', 'stipend', 'status',
+            'required_skills', 'deadline', 'created_at',
+        ]
+        field_sources = {
+            'recruiter_name': ('recruiter__user__first_name', 'recruiter__user__last_name'),
+            'recruiter_email': ('recruiter__user__email',),
+            'company_name': ('recruiter__company_name',),
+        }
 
-from .models import Application
+from .models import Application, InternshipMatch
 
-class ApplicationSerializer(serializers.ModelSerializer):
+class ApplicationSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     applicant_name = serializers.CharField(source='applicant.user.get_full_name', read_only=True)
     applicant_email = serializers.EmailField(source='applicant.user.email', read_only=True)
     applicant_vsps = serializers.FloatField(source='applicant.vsps_score', read_only=True)
@@ -107,3 +130,16 @@ class ApplicationSerializer(serializers.ModelSerializer):
                   'applicant_name', 'applicant_email', 'applicant_vsps']
         # make status writable; viewset enforces that only recruiters can change it
         read_only_fields = ['applicant', 'applied_at']
+        compact_fields = ['id', 'internship', 'applicant', 'status', 'applied_at']
+        field_sources = {
+            'applicant_name': ('applicant__user__first_name', 'applicant__user__last_name'),
+            'applicant_email': ('applicant__user__email',),
+            'applicant_vsps': ('applicant__vsps_score',),
+        }
+
+class InternshipMatchSerializer(serializers.ModelSerializer):
+    internship = InternshipSerializer(read_only=True)
+
+    class Meta:
+        model = InternshipMatch
+        fields = ['id', 'internship', 'similarity', 'score', 'created_at']
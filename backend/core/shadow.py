@@ -0,0 +1,33 @@
+"""Shadow scoring of live recommendation requests.
+
+`settings.RECOMMENDER_SHADOW` selects the candidate engine configuration and
+the share of requests that are shadowed. The production response is always
+built from the default `RecommendationEngine`.
+"""
+from functools import lru_cache
+
+from django.conf import settings
+
+from ml_engine.recommender import RecommendationEngine, TrustCalculator
+from ml_engine.shadow import ShadowScorer
+
+
+def build_engine(options=None):
+    """Build an engine from a {'confidence_factor': ..., 'vectorizer': {...}} mapping."""
+    options = options or {}
+    return RecommendationEngine(
+        trust_calculator=TrustCalculator(confidence_factor=options.get('confidence_factor', 1.0)),
+        vectorizer_options=options.get('vectorizer'),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_shadow_scorer():
+    config = settings.RECOMMENDER_SHADOW
+    engine_options = config.get('ENGINE') or {}
+    return ShadowScorer(
+        production_factory=RecommendationEngine,
+        shadow_factory=lambda: build_engine(engine_options),
+        sample_rate=config.get('SAMPLE_RATE', 0.0),
+        k=config.get('TOP_K', 10),
+    )
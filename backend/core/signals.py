@@ -0,0 +1,160 @@
+from django.db import connections
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from assessments.catalog import skills_created
+from assessments.models import Skill
+from users.models import User
+from .models import ApplicantProfile, Application, Internship, PlatformSettings, RecruiterProfile
+from .artifacts import invalidate_internship_index
+from .dashboards import invalidate_recruiter_dashboards
+from .facets import apply_facet_delta, internship_facet_pairs, stored_facet_pairs
+from .matching import invalidate_candidate_index, schedule_internship_matching
+from .platform_settings import invalidate_platform_settings
+from .response_cache import invalidate_internship_responses
+from .search import ensure_sqlite_search_index
+from .skill_links import (
+    APPLICANT_SKILL_FIELDS,
+    INTERNSHIP_SKILL_FIELDS,
+    link_applicants_to_skills,
+    sync_applicant_skills,
+    sync_internship_skills,
+)
+from .transitions import applications_status_changed
+
+RECRUITER_USER_FIELDS = frozenset({'first_name', 'last_name', 'email'})
+
+
+@receiver(post_save, sender=Internship)
+def match_new_internship(sender, instance, created, raw=False, **kwargs):
+    """
+    Fan a newly created internship out to matching applicants in the background.
+    """
+    if created and not raw:
+        schedule_internship_matching(instance.pk)
+
+
+@receiver(post_save, sender=ApplicantProfile)
+@receiver(post_delete, sender=ApplicantProfile)
+def refresh_candidate_index(sender, instance, **kwargs):
+    invalidate_candidate_index()
+
+
+@receiver(post_save, sender=Internship)
+@receiver(post_delete, sender=Internship)
+def refresh_internship_index(sender, instance, **kwargs):
+    invalidate_internship_index()
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender, using, **kwargs):
+    """SQLite drops the FTS triggers whenever a migration rebuilds core_internship."""
+    if sender.name == 'core':
+        ensure_sqlite_search_index(connections[using])
+
+
+@receiver(pre_save, sender=Internship)
+def remember_facet_values(sender, instance, raw=False, **kwargs):
+    instance._facet_pairs_before = set() if raw or instance._state.adding else stored_facet_pairs(instance.pk)
+
+
+@receiver(post_save, sender=Internship)
+def update_facet_counts(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    before = getattr(instance, '_facet_pairs_before', set())
+    after = internship_facet_pairs(instance)
+    apply_facet_delta(removed=before - after, added=after - before)
+    instance._facet_pairs_before = after
+
+
+@receiver(post_delete, sender=Internship)
+def remove_facet_counts(sender, instance, **kwargs):
+    apply_facet_delta(removed=internship_facet_pairs(instance))
+
+
+@receiver(post_save, sender=Internship)
+@receiver(post_delete, sender=Internship)
+def refresh_internship_responses(sender, instance, **kwargs):
+    invalidate_internship_responses([instance.pk])
+
+
+@receiver(post_save, sender=RecruiterProfile)
+@receiver(post_delete, sender=RecruiterProfile)
+def refresh_recruiter_internship_responses(sender, instance, **kwargs):
+    """Listings embed the company name, so a recruiter change touches all of theirs."""
+    # On delete the cascade has already removed (and invalidated) the internships.
+    pks = list(Internship.objects.filter(recruiter_id=instance.pk).values_list('pk', flat=True))
+    invalidate_internship_responses(pks)
+
+
+@receiver(post_save, sender=User)
+def touch_recruiter_profile(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """
+    Listings embed the recruiter's name and email, which live on the user, so
+    bump `RecruiterProfile.updated_at` (part of the listing ETags) and drop
+    the cached listing responses. Logins only save `last_login`.
+    """
+    if created or raw or (update_fields is not None and not RECRUITER_USER_FIELDS & set(update_fields)):
+        return
+    if RecruiterProfile.objects.filter(user=instance).update(updated_at=timezone.now()):
+        pks = list(Internship.objects.filter(recruiter__user=instance).values_list('pk', flat=True))
+        invalidate_internship_responses(pks)
+
+
+@receiver(post_save, sender=Internship)
+@receiver(post_delete, sender=Internship)
+def refresh_recruiter_dashboard_for_internship(sender, instance, **kwargs):
+    invalidate_recruiter_dashboards([instance.recruiter_id])
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def refresh_recruiter_dashboard_for_application(sender, instance, **kwargs):
+    if Application.internship.is_cached(instance):
+        recruiter_id = instance.internship.recruiter_id
+    else:
+        recruiter_id = Internship.objects.filter(pk=instance.internship_id).values_list('recruiter_id', flat=True).first()
+    invalidate_recruiter_dashboards([recruiter_id])
+
+
+@receiver(applications_status_changed)
+def refresh_recruiter_dashboard_for_transitions(sender, recruiter_id, **kwargs):
+    invalidate_recruiter_dashboards([recruiter_id])
+
+
+@receiver(post_save, sender=ApplicantProfile)
+def sync_applicant_skill_links(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Dual-write: keep ApplicantSkill rows in step with `ApplicantProfile.skills`."""
+    if raw or (update_fields is not None and not APPLICANT_SKILL_FIELDS & set(update_fields)):
+        return
+    sync_applicant_skills([instance], fresh=created)
+
+
+@receiver(post_save, sender=Internship)
+def sync_internship_skill_links(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Dual-write: keep InternshipSkill rows in step with the internship's skill lists."""
+    if raw or (update_fields is not None and not INTERNSHIP_SKILL_FIELDS & set(update_fields)):
+        return
+    sync_internship_skills([instance], fresh=created)
+
+
+@receiver(post_save, sender=Skill)
+def link_applicants_to_new_skill(sender, instance, created, raw=False, **kwargs):
+    """Profiles may have listed the skill before it joined the catalog."""
+    if created and not raw:
+        link_applicants_to_skills([instance.name])
+
+
+@receiver(skills_created)
+def link_applicants_to_new_skills(sender, names, **kwargs):
+    link_applicants_to_skills(names)
+
+
+@receiver(post_save, sender=PlatformSettings)
+@receiver(post_delete, sender=PlatformSettings)
+def refresh_platform_settings(sender, instance, created=False, **kwargs):
+    # Nothing can be cached before the singleton exists; reading creates it.
+    if not created:
+        invalidate_platform_settings()
@@ -0,0 +1,147 @@
+"""Relational skill links for applicant profiles and internships.
+
+`ApplicantProfile.skills` and `Internship.required_skills`/`preferred_skills`
+stay the source of truth during the dual-write period: every save re-derives
+the `ApplicantSkill`/`InternshipSkill` rows from the JSON lists (see the
+post_save signals), and bulk paths that skip signals call the `sync_*`
+functions themselves. Skill-based filters then join through these tables on
+`(skill, status|kind, owner)` indexes instead of scanning JSON text.
+
+Names are resolved through the cached skill catalog. Internship skills that
+are not in it yet are added (and get questions generated) exactly as when a
+listing is posted. Applicant skills are self-reported free text, so they only
+link to skills already in the catalog. Whenever a skill joins the catalog
+later (a listing or an assessment adds it), the profiles that already list it
+are linked by `link_applicants_to_skills`, so the link table stays complete.
+The `sync_skill_links` command re-derives every row, e.g. after raw SQL
+updates to the JSON columns.
+"""
+import json
+
+from django.db.models import Q
+
+from assessments.catalog import normalize_skill_name, resolve_skill_ids, skill_key
+from assessments.utils import schedule_question_generation
+from .models import ApplicantProfile, ApplicantSkill, InternshipSkill
+
+APPLICANT_SKILL_FIELDS = frozenset({'skills'})
+INTERNSHIP_SKILL_FIELDS = frozenset({'required_skills', 'preferred_skills'})
+
+
+def _entries(raw_skills):
+    """Yield `(name, entry)` for a JSON skill list of strings and/or dicts."""
+    for raw in raw_skills or []:
+        if isinstance(raw, dict):
+            name, entry = normalize_skill_name(raw.get('name')), raw
+        else:
+            name, entry = normalize_skill_name(raw), {}
+        if name:
+            yield name, entry
+
+
+def _score(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def applicant_skill_values(profile):
+    """`{skill key: (name, {'status', 'score'})}` derived from `profile.skills`."""
+    values = {}
+    for name, entry in _entries(profile.skills):
+        values.setdefault(name.lower(), (name, {
+            'status': 'verified' if entry.get('status') == 'verified' else 'pending',
+            'score': _score(entry.get('last_score')),
+        }))
+    return values
+
+
+def internship_skill_values(internship):
+    """`{skill key: (name, {'kind'})}`; a skill listed as both required and preferred is required."""
+    values = {}
+    for kind, raw_skills in (('required', internship.required_skills), ('preferred', internship.preferred_skills)):
+        for name, _ in _entries(raw_skills):
+            values.setdefault(name.lower(), (name, {'kind': kind}))
+    return values
+
+
+def _sync_links(model, owner_field, desired_by_owner, fresh, create_skills):
+    """
+    Make the link rows of each owner match `desired_by_owner`
+    (`{owner pk: {skill key: (name, values)}}`) with one bulk insert, update
+    and delete. Skills missing from the catalog are added when
+    `create_skills` and skipped otherwise. Returns the number of catalog
+    skills created.
+    """
+    names = [name for desired in desired_by_owner.values() for name, _ in desired.values()]
+    ids, created = resolve_skill_ids(names, create=create_skills)
+    schedule_question_generation(created)
+    skill_ids = {name.lower(): pk for name, pk in ids.items()}
+    wanted = {
+        (owner, skill_ids[key]): values
+        for owner, desired in desired_by_owner.items()
+        for key, (_, values) in desired.items()
+        if key in skill_ids
+    }
+
+    value_fields = sorted({field for values in wanted.values() for field in values})
+    existing = {}
+    if not fresh:
+        links = model.objects.filter(**{f'{owner_field}__in': list(desired_by_owner)})
+        existing = {(getattr(link, f'{owner_field}_id'), link.skill_id): link for link in links}
+
+    to_create, to_update = [], []
+    for (owner, skill_id), values in wanted.items():
+        link = existing.get((owner, skill_id))
+        if link is None:
+            to_create.append(model(**{f'{owner_field}_id': owner, 'skill_id': skill_id}, **values))
+        elif any(getattr(link, field) != value for field, value in values.items()):
+            for field, value in values.items():
+                setattr(link, field, value)
+            to_update.append(link)
+    stale = [link.pk for key, link in existing.items() if key not in wanted]
+
+    if stale:
+        model.objects.filter(pk__in=stale).delete()
+    if to_update:
+        model.objects.bulk_update(to_update, value_fields)
+    if to_create:
+        # A concurrent save of the same owner may have inserted the row already.
+        model.objects.bulk_create(to_create, ignore_conflicts=True)
+    return len(created)
+
+
+def sync_applicant_skills(profiles, fresh=False):
+    """Re-derive `ApplicantSkill` rows for `profiles`; `fresh` skips reading rows new profiles cannot have."""
+    desired = {profile.pk: applicant_skill_values(profile) for profile in profiles if profile.pk is not None}
+    return _sync_links(ApplicantSkill, 'applicant', desired, fresh, create_skills=False) if desired else 0
+
+
+def sync_internship_skills(internships, fresh=False):
+    """Re-derive `InternshipSkill` rows for `internships`; returns the number of catalog skills created."""
+    desired = {internship.pk: internship_skill_values(internship) for internship in internships if internship.pk is not None}
+    return _sync_links(InternshipSkill, 'internship', desired, fresh, create_skills=True) if desired else 0
+
+
+def link_applicants_to_skills(names):
+    """
+    Link the profiles that already list any of the skill `names` newly added
+    to the catalog; returns the number of profiles re-derived.
+    """
+    keys = {key for key in map(skill_key, names) if key}
+    if not keys:
+        return 0
+    # Text prefilter on the JSON column (stored escaped on SQLite, raw on
+    # Postgres); the exact, whitespace-insensitive match happens below.
+    candidates = Q()
+    for key in keys:
+        word = key.split()[0]
+        candidates |= Q(skills__icontains=word) | Q(skills__icontains=json.dumps(word)[1:-1])
+    profiles = [
+        profile for profile in ApplicantProfile.objects.filter(candidates).only('pk', 'skills')
+        if keys & applicant_skill_values(profile).keys()
+    ]
+    if profiles:
+        sync_applicant_skills(profiles)
+    return len(profiles)
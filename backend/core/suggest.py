@@ -0,0 +1,70 @@
+"""Read-only profile hints for the login and signup email fields.
+
+The lookup is one query on the lowercased, indexed email (see
+`users.models`) joined to the profile, and never creates a profile for a user
+who has none; the hint is then built from the user alone. Answers, including
+"no such user", are cached for `PROFILE_SUGGEST_CACHE_TIMEOUT` seconds
+because autocomplete repeats the same address while the user types.
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+MISSING = 'missing'
+
+
+def _cache_key(kind, email):
+    digest = hashlib.sha1(email.encode('utf-8')).hexdigest()
+    return f'profile-suggest:{kind}:{digest}'
+
+
+def _applicant_hint(user):
+    profile = getattr(user, 'applicant_profile', None)
+    return {
+        'role': user.role,
+        'student_name': (user.get_full_name() or user.email),
+        'college': (profile.college if profile else '') or '',
+        'degree': (profile.degree if profile else '') or '',
+        'major': (profile.major if profile else '') or '',
+        'interested_role': (profile.interested_role if profile else '') or '',
+    }
+
+
+def _recruiter_hint(user):
+    profile = getattr(user, 'recruiter_profile', None)
+    if profile is None:
+        return {
+            'role': user.role,
+            'company_name': user.first_name or user.email,
+            'company_website': '',
+            'is_verified': False,
+        }
+    return {
+        'role': user.role,
+        'company_name': profile.company_name or '',
+        'company_website': profile.company_website or '',
+        'is_verified': profile.is_verified,
+    }
+
+
+HINTS = {
+    'applicant': ('applicant_profile', _applicant_hint),
+    'recruiter': ('recruiter_profile', _recruiter_hint),
+}
+
+
+def profile_suggestion(kind, email):
+    """Return the `kind` ('applicant' or 'recruiter') hint for `email`, or None if no user has it."""
+    email = email.strip().lower()
+    key = _cache_key(kind, email)
+    cached = cache.get(key)
+    if cached is not None:
+        return None if cached == MISSING else cached
+
+    relation, build = HINTS[kind]
+    user = get_user_model().objects.select_related(relation).filter(email__lower=email).first()
+    hint = build(user) if user is not None else None
+    cache.set(key, MISSING if hint is None else hint, timeout=settings.PROFILE_SUGGEST_CACHE_TIMEOUT)
+    return hint
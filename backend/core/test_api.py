@@ -1,5 +1,9 @@
+import csv
+import json
+
 import pytest
 from django.test import TestCase, Client
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
@@ -43,6 +47,19 @@ class ApplicantProfileAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['vsps_score'], 0.75)
 
+    def test_own_applicant_profile_honours_etag(self):
+        """Test conditional GET on /me/ and that a PATCH invalidates it"""
+        self.client.force_authenticate(user=self.applicant_user)
+        etag = self.client.get('/api/applicants/me/')['ETag']
+
+        response = self.client.get('/api/applicants/me/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.patch('/api/applicants/me/', {'education': 'B.Tech'})
+        response = self.client.get('/api/applicants/me/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['education'], 'B.Tech')
+
     def test_update_own_applicant_profile(self):
         """Test updating own applicant profile"""
         self.client.force_authenticate(user=self.applicant_user)
@@ -115,6 +132,18 @@ class RecruiterProfileAPITests(APITestCase):
         self.recruiter_profile.refresh_from_db()
         self.assertTrue(self.recruiter_profile.is_verified)
 
+    def test_admin_recruiter_list_counts_internships(self):
+        """Test that admins get listing counts per recruiter without loading the listings"""
+        Internship.objects.create(title='Backend', recruiter=self.recruiter_profile)
+        Internship.objects.create(title='Frontend', recruiter=self.recruiter_profile)
+        self.client.force_authenticate(user=make_user('admin@example.com', 'ADMIN'))
+
+        response = self.client.get('/api/recruiters/')
+
+        self.assertEqual(response.data[0]['internship_count'], 2)
+        compact = self.client.get('/api/recruiters/?fields=internship_count')
+        self.assertEqual(compact.data[0], {'id': self.recruiter_profile.id, 'internship_count': 2})
+
     def test_recruiter_cannot_verify_themselves(self):
         """Test that recruiters cannot verify themselves"""
         self.client.force_authenticate(user=self.recruiter_user)
@@ -150,7 +179,105 @@ class InternshipAPITests(APITestCase):
         response = self.client.get('/api/internships/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_internships_list_is_keyset_paginated(self):
+        """Test that the list is paginated by created_at/id and follows next links"""
+        for index in range(4):
+            Internship.objects.create(title=f'Intern {index}', recruiter=self.recruiter_profile)
+
+        seen = []
+        url = '/api/internships/?page_size=2'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 2)
+            seen.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+
+        expected = list(Internship.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_internships_list_filters_by_recruiter_and_ids(self):
+        """Test the ?recruiter= and ?ids= lookups the dashboards page through"""
+        other_profile = RecruiterProfile.objects.create(user=make_user('other@example.com', 'RECRUITER'), company_name='Other')
+        other = Internship.objects.create(title='Designer', recruiter=other_profile)
+
+        response = self.client.get(f'/api/internships/?recruiter={other_profile.id}')
+        self.assertEqual([item['id'] for item in response.data['results']], [other.id])
+
+        response = self.client.get(f'/api/internships/?ids={self.internship.id},{other.id},{other.id}')
+        self.assertEqual({item['id'] for item in response.data['results']}, {self.internship.id, other.id})
+
+        self.assertEqual(self.client.get('/api/internships/?ids=1,x').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get('/api/internships/?recruiter=me').status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_internships_list_query_count_is_constant(self):
+        """Test that recruiter fields do not trigger per-row queries"""
+        for index in range(10):
+            other_user = make_user(f'recruiter{index}@example.com', 'RECRUITER')
+            other_profile = RecruiterProfile.objects.create(user=other_user, company_name=f'Corp {index}')
+            Internship.objects.create(title=f'Intern {index}', recruiter=other_profile)
+
+        # One aggregate for the ETag, one joined SELECT for the page.
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/internships/')
+
+        self.assertEqual(len(response.data['results']), 11)
+        self.assertEqual(response.data['results'][0]['company_name'], 'Corp 9')
+
+    def test_internship_detail_honours_etag(self):
+        """Test that a matching If-None-Match returns 304 without a body"""
+        # Authenticated, so the anonymous response cache does not answer first.
+        self.client.force_authenticate(user=self.recruiter_user)
+        url = f'/api/internships/{self.internship.id}/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Last-Modified', response)
+        etag = response['ETag']
+
+        with self.assertNumQueries(1):
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached.content, b'')
+
+        self.recruiter_profile.company_name = 'Renamed Corp'
+        self.recruiter_profile.save()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data['company_name'], 'Renamed Corp')
+
+    def test_internship_etags_track_recruiter_user_changes(self):
+        """Test that renaming the recruiter's user changes the listing ETags"""
+        url = f'/api/internships/{self.internship.id}/'
+        list_etag = self.client.get('/api/internships/')['ETag']
+        detail_etag = self.client.get(url)['ETag']
+
+        self.recruiter_user.last_login = timezone.now()
+        self.recruiter_user.save(update_fields=['last_login'])
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=detail_etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.recruiter_user.first_name = 'Renamed'
+        self.recruiter_user.save()
+        self.assertEqual(self.client.get('/api/internships/', HTTP_IF_NONE_MATCH=list_etag).status_code, status.HTTP_200_OK)
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertIn('Renamed', changed.data['recruiter_name'])
+
+    def test_internship_list_etag_tracks_filters_and_changes(self):
+        """Test that the list ETag changes with query params and with row updates"""
+        etag = self.client.get('/api/internships/')['ETag']
+        self.assertEqual(
+            self.client.get('/api/internships/', HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+        self.assertNotEqual(self.client.get('/api/internships/?status=OPEN')['ETag'], etag)
+
+        Internship.objects.create(title='Data Analyst', recruiter=self.recruiter_profile)
+        self.assertEqual(
+            self.client.get('/api/internships/', HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_200_OK,
+        )
 
     def test_recruiter_can_create_internship(self):
         """Test that recruiters can create internships"""
@@ -213,6 +340,30 @@ class InternshipAPITests(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_applicant_can_apply_to_many_internships(self):
+        """Test bulk apply reports an outcome per requested id"""
+        applicant_user = make_user('applicant@example.com', 'APPLICANT')
+        applicant_profile = ApplicantProfile.objects.create(user=applicant_user)
+        second = Internship.objects.create(title='Data Intern', recruiter=self.recruiter_profile)
+        Application.objects.create(internship=self.internship, applicant=applicant_profile)
+
+        self.client.force_authenticate(user=applicant_user)
+        with self.assertNumQueries(6):
+            response = self.client.post(
+                '/api/internships/apply-bulk/',
+                {'internship_ids': [self.internship.id, second.id, 999999, 'abc', True, 1.9, f' {second.id} ']},
+                format='json',
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['applied'], 1)
+        outcomes = [result['status'] for result in response.data['results']]
+        self.assertEqual(outcomes, ['already_applied', 'applied', 'not_found'] + ['invalid'] * 4)
+        self.assertEqual(
+            response.data['results'][1]['application'],
+            Application.objects.get(internship=second, applicant=applicant_profile).id,
+        )
+
     def test_recruiter_cannot_apply_to_internship(self):
         """Test that recruiters cannot apply to internships"""
         self.client.force_authenticate(user=self.recruiter_user)
@@ -253,8 +404,30 @@ class ApplicationAPITests(APITestCase):
         response = self.client.get('/api/applications/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['status'], 'PENDING')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['status'], 'PENDING')
+
+    def test_recruiter_pipeline_is_paginated_and_filtered_by_status(self):
+        """Test the recruiter application list: status filter, cursor pages, constant queries"""
+        for index in range(3):
+            user = User.objects.create_user(
+                username=f'pipeline{index}', email=f'pipeline{index}@example.com', password='pass', role=User.Role.APPLICANT
+            )
+            profile = ApplicantProfile.objects.create(user=user)
+            Application.objects.create(internship=self.internship, applicant=profile, status='REVIEWED')
+        self.client.force_authenticate(user=self.recruiter_user)
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/applications/', {'status': 'reviewed', 'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['status'] for row in response.data['results']], ['REVIEWED', 'REVIEWED'])
+        self.assertEqual(response.data['results'][0]['applicant_email'], 'pipeline2@example.com')
+
+        second = self.client.get(response.data['next'])
+        self.assertEqual(len(second.data['results']), 1)
+        self.assertIsNone(second.data['next'])
+
+        self.assertEqual(self.client.get('/api/applications/', {'status': 'lost'}).status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_recruiter_can_view_internship_applicants(self):
         """Test that recruiters can view applicants for their internships"""
@@ -262,6 +435,73 @@ class ApplicationAPITests(APITestCase):
         response = self.client.get(f'/api/internships/{self.internship.id}/applicants/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['applicant_email'], 'applicant@example.com')
+
+    def test_internship_applicants_are_paginated_by_vsps(self):
+        """Test applicant pages are ordered by VSPS and use a constant number of queries"""
+        for index in range(4):
+            user = make_user(f'student{index}@example.com', 'APPLICANT')
+            profile = ApplicantProfile.objects.create(user=user, vsps_score=0.2 * (index + 1))
+            Application.objects.create(internship=self.internship, applicant=profile)
+
+        self.client.force_authenticate(user=self.recruiter_user)
+        scores = []
+        url = f'/api/internships/{self.internship.id}/applicants/?page_size=2'
+        while url:
+            # internship lookup + one joined page query, regardless of page size
+            with self.assertNumQueries(2):
+                response = self.client.get(url)
+            scores.extend(item['applicant_vsps'] for item in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(len(scores), 5)
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_recruiter_can_export_applicants(self):
+        """Test streaming CSV and JSONL applicant exports"""
+        self.applicant_profile.skills = [{'name': 'Python'}, 'SQL']
+        self.applicant_profile.save()
+        self.client.force_authenticate(user=self.recruiter_user)
+        url = f'/api/internships/{self.internship.id}/applicants/export/'
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertTrue(lines[0].startswith('application_id,status,applied_at'))
+        self.assertIn('applicant@example.com', lines[1])
+        self.assertIn('Python; SQL', lines[1])
+
+        response = self.client.get(url, {'file_format': 'jsonl'})
+        records = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(records[0]['email'], 'applicant@example.com')
+        self.assertEqual(records[0]['skills'], ['Python', 'SQL'])
+
+    def test_csv_export_neutralizes_formulas(self):
+        """Test that cells starting with formula characters are quoted in CSV only"""
+        self.applicant_user.first_name = '=HYPERLINK("http://evil.test")'
+        self.applicant_user.save()
+        self.applicant_profile.college = '@SUM(A1)'
+        self.applicant_profile.save()
+        self.client.force_authenticate(user=self.recruiter_user)
+        url = f'/api/internships/{self.internship.id}/applicants/export/'
+
+        lines = b''.join(self.client.get(url).streaming_content).decode().splitlines()
+        row = next(csv.DictReader(lines))
+        self.assertEqual(row['first_name'], '\'=HYPERLINK("http://evil.test")')
+        self.assertEqual(row['college'], "'@SUM(A1)")
+
+        response = self.client.get(url, {'file_format': 'jsonl'})
+        record = json.loads(b''.join(response.streaming_content).decode().splitlines()[0])
+        self.assertEqual(record['college'], '@SUM(A1)')
+
+    def test_other_recruiter_cannot_export_applicants(self):
+        """Test exports are limited to the listing's recruiter"""
+        other = make_user('other@example.com', 'RECRUITER')
+        RecruiterProfile.objects.create(user=other, company_name='Other Corp')
+        self.client.force_authenticate(user=other)
+        response = self.client.get(f'/api/internships/{self.internship.id}/applicants/export/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_recruiter_can_review_application(self):
         """Test that recruiters can review applications"""
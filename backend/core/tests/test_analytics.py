@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from assessments.models import AssessmentAttempt
+from core.analytics import APPLICATIONS_PER_DAY, get_platform_analytics, refresh_platform_rollups
+from core.models import ApplicantProfile, RecruiterProfile, Internship, Application, PlatformRollup
+
+User = get_user_model()
+
+
+def _user(name, role):
+    return User.objects.create_user(username=name, email=f"{name}@test.com", password="pass", role=role)
+
+
+@pytest.fixture
+def platform(db):
+    recruiter = RecruiterProfile.objects.create(user=_user("recruiter", "RECRUITER"), company_name="Test Corp")
+    internship = Internship.objects.create(recruiter=recruiter, title="Backend")
+    Internship.objects.create(recruiter=recruiter, title="Closed", status="CLOSED")
+    applicants = []
+    for index, vsps in enumerate([0.05, 0.55, 1.0]):
+        user = _user(f"student{index}", "APPLICANT")
+        applicants.append(ApplicantProfile.objects.create(user=user, vsps_score=vsps))
+        AssessmentAttempt.objects.create(user=user, status="COMPLETED" if index else "FAILED")
+    for applicant in applicants:
+        Application.objects.create(internship=internship, applicant=applicant)
+    return internship, applicants
+
+
+@pytest.mark.django_db
+def test_refresh_materializes_platform_figures(platform):
+    """Test that rollups hold the grouped counts and the endpoint reads them in one query"""
+    refresh_platform_rollups()
+
+    with CaptureQueriesContext(connection) as queries:
+        analytics = get_platform_analytics(days=7)
+
+    assert len(queries) == 1
+    assert analytics["users_by_role"] == {"RECRUITER": 1, "APPLICANT": 3}
+    assert analytics["internships_by_status"] == {"OPEN": 1, "CLOSED": 1}
+    assert analytics["applications_by_status"] == {"PENDING": 3}
+    assert analytics["applications_per_day"][-1] == {"date": timezone.now().date().isoformat(), "count": 3}
+    assert len(analytics["applications_per_day"]) == 7
+    assert analytics["assessments"]["pass_rate"] == pytest.approx(2 / 3, abs=1e-4)
+    histogram = {entry["bucket"]: entry["count"] for entry in analytics["vsps_distribution"]}
+    assert histogram["0.0-0.1"] == 1 and histogram["0.5-0.6"] == 1 and histogram["0.9-1.0"] == 1
+
+
+@pytest.mark.django_db
+def test_incremental_refresh_only_recounts_recent_days(platform):
+    """Test that days before the watermark are kept as stored"""
+    internship, applicants = platform
+    refresh_platform_rollups()
+    old_day = (timezone.now() - timedelta(days=10)).date().isoformat()
+    PlatformRollup.objects.create(metric=APPLICATIONS_PER_DAY, bucket=old_day, value=42)
+
+    extra = ApplicantProfile.objects.create(user=_user("late", "APPLICANT"))
+    Application.objects.create(internship=internship, applicant=extra)
+    refresh_platform_rollups()
+
+    per_day = dict(PlatformRollup.objects.filter(metric=APPLICATIONS_PER_DAY).values_list("bucket", "value"))
+    assert per_day[old_day] == 42
+    assert per_day[timezone.now().date().isoformat()] == 4
+
+    call_command("refresh_analytics", "--full", stdout=None)
+    assert not PlatformRollup.objects.filter(metric=APPLICATIONS_PER_DAY, bucket=old_day).exists()
+
+
+@pytest.mark.django_db
+def test_analytics_endpoint_is_admin_only(platform):
+    """Test admin access to the analytics endpoint"""
+    client = APIClient()
+    client.force_authenticate(user=User.objects.get(username="student0"))
+    assert client.get("/api/platform-settings/analytics/").status_code == 403
+
+    client.force_authenticate(user=_user("admin", "ADMIN"))
+    response = client.get("/api/platform-settings/analytics/", {"days": 3})
+    assert response.status_code == 200
+    assert len(response.data["applications_per_day"]) == 3
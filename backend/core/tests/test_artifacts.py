@@ -0,0 +1,69 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from core.artifacts import ARTIFACT_CACHE_KEY, get_internship_index_artifact
+from core.models import RecruiterProfile, Internship
+from ml_engine.recommender import Internship as MLInternship, export_internship_index
+
+User = get_user_model()
+
+
+def test_exported_index_round_trips_to_tfidf_vectors():
+    """Test that the delta-encoded artifact decodes back to the server TF-IDF rows"""
+    internships = [
+        MLInternship(id=1, title="Backend Intern", description="Python Django REST"),
+        MLInternship(id=2, title="Data Intern", description="Python Pandas SQL"),
+    ]
+    artifact = export_internship_index(internships)
+    expected = TfidfVectorizer().fit_transform([i.text_for_vectorization() for i in internships]).toarray()
+
+    for row, encoded in enumerate(artifact["internships"]):
+        decoded = [0.0] * len(artifact["vocab"])
+        term = 0
+        for delta, weight in zip(encoded["terms"], encoded["weights"]):
+            term += delta
+            decoded[term] = weight / artifact["weight_scale"]
+        assert max(abs(a - b) for a, b in zip(decoded, expected[row])) < 1e-4
+
+
+@pytest.mark.django_db
+def test_index_artifact_endpoint_supports_etags():
+    """Test that the artifact is revalidated with If-None-Match"""
+    recruiter_user = User.objects.create_user(
+        username="recruiter", email="rec@test.com", password="pass", role="RECRUITER"
+    )
+    recruiter_profile = RecruiterProfile.objects.create(user=recruiter_user, company_name="Test Corp")
+    Internship.objects.create(recruiter=recruiter_profile, title="Backend Intern", required_skills=["Python"])
+
+    client = APIClient()
+    response = client.get("/api/internships/index-artifact/")
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert len(response.json()["internships"]) == 1
+
+    response = client.get("/api/internships/index-artifact/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    Internship.objects.create(recruiter=recruiter_profile, title="Data Intern", required_skills=["SQL"])
+    response = client.get("/api/internships/index-artifact/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_artifact_cache_keeps_one_entry(django_capture_on_commit_callbacks):
+    """Test that rebuilt artifacts replace the cached one instead of piling up per version"""
+    recruiter_user = User.objects.create_user(username="recruiter", email="rec@test.com", role="RECRUITER")
+    recruiter_profile = RecruiterProfile.objects.create(user=recruiter_user, company_name="Test Corp")
+    first_etag, _ = get_internship_index_artifact()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        Internship.objects.create(recruiter=recruiter_profile, title="Backend Intern", required_skills=["Python"])
+    assert callbacks  # the second, post-commit bump
+
+    etag, body = get_internship_index_artifact()
+    assert etag != first_etag
+    assert cache.get(ARTIFACT_CACHE_KEY)[1:] == (etag, body)
@@ -0,0 +1,88 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.dashboards import compute_recruiter_dashboard
+from core.models import ApplicantProfile, RecruiterProfile, Internship, Application
+
+User = get_user_model()
+
+
+@pytest.fixture
+def recruiter_profile(db):
+    user = User.objects.create_user(username="recruiter", email="rec@test.com", password="pass", role="RECRUITER")
+    return RecruiterProfile.objects.create(user=user, company_name="Test Corp")
+
+
+def _applicant(index, vsps):
+    user = User.objects.create_user(
+        username=f"student{index}", email=f"student{index}@test.com", password="pass", role="APPLICANT"
+    )
+    return ApplicantProfile.objects.create(user=user, vsps_score=vsps)
+
+
+@pytest.mark.django_db
+def test_dashboard_aggregates_in_one_query(recruiter_profile):
+    """Test per-listing counts, average VSPS and totals"""
+    busy = Internship.objects.create(recruiter=recruiter_profile, title="Busy")
+    quiet = Internship.objects.create(recruiter=recruiter_profile, title="Quiet")
+    Application.objects.create(internship=busy, applicant=_applicant(1, 0.4), status="PENDING")
+    Application.objects.create(internship=busy, applicant=_applicant(2, 0.8), status="ACCEPTED")
+
+    with CaptureQueriesContext(connection) as queries:
+        dashboard = compute_recruiter_dashboard(recruiter_profile.pk)
+
+    assert len(queries) == 1
+    rows = {row["id"]: row for row in dashboard["internships"]}
+    assert rows[busy.pk]["applications"] == {"total": 2, "pending": 1, "reviewed": 0, "accepted": 1, "rejected": 0}
+    assert rows[busy.pk]["average_vsps"] == pytest.approx(0.6)
+    assert rows[quiet.pk]["applications"]["total"] == 0
+    assert rows[quiet.pk]["average_vsps"] is None
+    assert dashboard["totals"]["applications"] == 2
+    assert dashboard["totals"]["internships"] == 2
+
+
+@pytest.mark.django_db
+def test_dashboard_endpoint_is_cached_and_invalidated(recruiter_profile):
+    """Test that the cached dashboard refreshes on application changes"""
+    internship = Internship.objects.create(recruiter=recruiter_profile, title="Backend")
+    client = APIClient()
+    client.force_authenticate(user=recruiter_profile.user)
+
+    assert client.get("/api/recruiters/dashboard/").data["totals"]["applications"] == 0
+    with CaptureQueriesContext(connection) as queries:
+        client.get("/api/recruiters/dashboard/")
+    assert len(queries) == 0
+
+    application = Application.objects.create(internship=internship, applicant=_applicant(1, 0.5))
+    assert client.get("/api/recruiters/dashboard/").data["totals"]["pending"] == 1
+
+    application.status = "REJECTED"
+    application.save()
+    totals = client.get("/api/recruiters/dashboard/").data["totals"]
+    assert totals["pending"] == 0 and totals["rejected"] == 1
+
+
+@pytest.mark.django_db
+def test_bulk_apply_invalidates_dashboard(recruiter_profile):
+    """Test that bulk_create applications still refresh the recruiter's dashboard"""
+    internship = Internship.objects.create(recruiter=recruiter_profile, title="Backend")
+    recruiter_client = APIClient()
+    recruiter_client.force_authenticate(user=recruiter_profile.user)
+    recruiter_client.get("/api/recruiters/dashboard/")
+
+    applicant_client = APIClient()
+    applicant_client.force_authenticate(user=_applicant(1, 0.5).user)
+    applicant_client.post("/api/internships/apply-bulk/", {"internship_ids": [internship.pk]}, format="json")
+
+    assert recruiter_client.get("/api/recruiters/dashboard/").data["totals"]["applications"] == 1
+
+
+@pytest.mark.django_db
+def test_dashboard_requires_recruiter():
+    """Test that applicants cannot read recruiter dashboards"""
+    client = APIClient()
+    client.force_authenticate(user=_applicant(1, 0.5).user)
+    assert client.get("/api/recruiters/dashboard/").status_code == 403
@@ -0,0 +1,103 @@
+import contextvars
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from core.db_routing import ReplicaRouter, is_pinned, use_primary
+from core.facets import get_facet_counts
+from core.models import RecruiterProfile, Internship
+
+User = get_user_model()
+
+DATABASES = ["default", "replica"]
+
+
+@pytest.fixture
+def replica(settings):
+    settings.DATABASE_REPLICAS = ["replica"]
+    return "replica"
+
+
+def _copy(objects, using="replica"):
+    """Copy rows as they are now to the replica (bulk_create skips the signals)."""
+    for obj in objects:
+        type(obj).objects.using(using).bulk_create([obj])
+
+
+@pytest.mark.django_db(databases=DATABASES)
+def test_safe_reads_use_the_replica(replica):
+    """Test that list reads are served from the replica and writes go to the primary"""
+    user = User.objects.create_user(username="recruiter", email="rec@test.com", role="RECRUITER")
+    recruiter = RecruiterProfile.objects.create(user=user, company_name="Corp")
+    internship = Internship.objects.create(recruiter=recruiter, title="Primary title")
+    _copy([user, recruiter])
+    internship.title = "Replica title"
+    _copy([internship])
+
+    response = APIClient().get("/api/internships/")
+
+    assert [row["title"] for row in response.data["results"]] == ["Replica title"]
+    assert Internship.objects.using("default").get().title == "Primary title"
+
+
+@pytest.mark.django_db(databases=DATABASES)
+def test_own_writes_pin_reads_to_the_primary(replica):
+    """Test read-your-writes: after a PATCH the client's reads go to the primary until the pin expires"""
+    user = User.objects.create_user(username="recruiter", email="rec@test.com", role="RECRUITER")
+    recruiter = RecruiterProfile.objects.create(user=user, company_name="Corp")
+    internship = Internship.objects.create(recruiter=recruiter, title="Old title")
+    _copy([user, recruiter, internship])
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.patch(f"/api/internships/{internship.pk}/", {"title": "New title"}, format="json")
+    assert response.status_code == 200
+    assert response.cookies["db_primary_pin"]["max-age"] == 15
+
+    cache.clear()
+    assert client.get("/api/internships/").data["results"][0]["title"] == "New title"
+
+    del client.cookies["db_primary_pin"]
+    cache.clear()
+    assert client.get("/api/internships/").data["results"][0]["title"] == "Old title"
+
+
+def test_router_without_replicas_and_use_primary(settings):
+    router = ReplicaRouter()
+    settings.DATABASE_REPLICAS = []
+    assert router.db_for_read(Internship) == "default"
+
+    settings.DATABASE_REPLICAS = ["replica"]
+    with use_primary():
+        assert is_pinned()
+        assert router.db_for_read(Internship) == "default"
+
+
+@pytest.mark.django_db(databases=DATABASES)
+def test_only_executed_writes_pin(replica):
+    """Test that a get_or_create that finds its row does not pin, but an INSERT does"""
+    user = User.objects.create_user(username="recruiter", email="rec@test.com", role="RECRUITER")
+
+    def lookup_then_create():
+        RecruiterProfile.objects.get_or_create(user=user, defaults={"company_name": "Corp"})
+        created = is_pinned()
+        RecruiterProfile.objects.get_or_create(user=user, defaults={"company_name": "Corp"})
+        return created
+
+    assert contextvars.Context().run(lookup_then_create) is True
+    assert contextvars.Context().run(
+        lambda: RecruiterProfile.objects.get_or_create(user=user) and is_pinned()
+    ) is False
+
+
+@pytest.mark.django_db(databases=DATABASES)
+def test_versioned_cache_fills_read_the_primary(replica):
+    """Test that facet counts cached under a new version come from the primary"""
+    user = User.objects.create_user(username="recruiter", email="rec@test.com", role="RECRUITER")
+    Internship.objects.create(recruiter=RecruiterProfile.objects.create(user=user, company_name="Corp"), title="Backend", location="Pune")
+
+    facets = contextvars.Context().run(get_facet_counts)
+
+    assert facets["location"] == [{"value": "Pune", "count": 1}]
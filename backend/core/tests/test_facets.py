@@ -0,0 +1,96 @@
+import importlib
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from core.facets import facet_pairs, get_facet_counts, rebuild_facet_counts, stipend_bucket, stipend_bucket_range
+from core.models import RecruiterProfile, Internship, InternshipFacetCount
+
+User = get_user_model()
+
+
+def _counts(facet):
+    return {entry["value"]: entry["count"] for entry in get_facet_counts()[facet]}
+
+
+@pytest.fixture
+def recruiter_profile(db):
+    user = User.objects.create_user(username="recruiter", email="rec@test.com", password="pass", role="RECRUITER")
+    return RecruiterProfile.objects.create(user=user, company_name="Test Corp")
+
+
+def test_stipend_buckets():
+    """Test stipend bucketing"""
+    assert stipend_bucket(None) == "unspecified"
+    assert stipend_bucket(0) == "unpaid"
+    assert stipend_bucket(4999) == "1-4999"
+    assert stipend_bucket(15000) == "10000-19999"
+    assert stipend_bucket(50000) == "20000+"
+
+
+def test_bucket_ranges_agree_with_bucketing():
+    """Test that every stipend lands inside the range of the bucket it is counted in"""
+    for stipend in (-5, 0, 1, 4999, 5000, 19999, 20000, 10**6):
+        lower, upper = stipend_bucket_range(stipend_bucket(stipend))
+        assert (lower is None or stipend >= lower) and (upper is None or stipend <= upper)
+
+
+def test_facet_migration_matches_live_bucketing():
+    migration = importlib.import_module("core.migrations.0012_internship_facets")
+    values = {
+        "location": "Pune", "work_type": "REMOTE", "status": "OPEN", "stipend": 7000,
+        "required_skills": ["Python", {"name": " SQL "}, ""],
+    }
+    assert migration.facet_pairs(values) == facet_pairs(values)
+
+
+@pytest.mark.django_db
+def test_facet_counts_follow_saves_and_deletes(recruiter_profile):
+    """Test that facet counts are maintained incrementally"""
+    first = Internship.objects.create(
+        recruiter=recruiter_profile, title="A", location="Remote", stipend=8000, required_skills=["Python", "SQL"]
+    )
+    Internship.objects.create(
+        recruiter=recruiter_profile, title="B", location="Pune", stipend=8000, required_skills=["python"]
+    )
+    assert _counts("location") == {"Remote": 1, "Pune": 1}
+    assert _counts("skill") == {"python": 2, "sql": 1}
+    assert _counts("stipend") == {"5000-9999": 2}
+
+    first.location = "Pune"
+    first.status = "CLOSED"
+    first.required_skills = ["SQL"]
+    first.save()
+    assert _counts("location") == {"Pune": 2}
+    assert _counts("status") == {"OPEN": 1, "CLOSED": 1}
+    assert _counts("skill") == {"python": 1, "sql": 1}
+
+    first.delete()
+    assert _counts("location") == {"Pune": 1}
+    assert _counts("skill") == {"python": 1}
+
+    incremental = set(InternshipFacetCount.objects.filter(count__gt=0).values_list("facet", "value", "count"))
+    rebuild_facet_counts()
+    assert set(InternshipFacetCount.objects.values_list("facet", "value", "count")) == incremental
+
+
+@pytest.mark.django_db
+def test_facets_endpoint_and_filters(recruiter_profile):
+    """Test the facets endpoint and the matching list filters"""
+    Internship.objects.create(recruiter=recruiter_profile, title="A", work_type="Remote", stipend=None)
+    Internship.objects.create(recruiter=recruiter_profile, title="B", work_type="On-site", stipend=25000,
+                              required_skills=["Go"])
+
+    client = APIClient()
+    response = client.get("/api/internships/facets/")
+    assert response.status_code == 200
+    assert {"value": "Remote", "count": 1} in response.data["work_type"]
+
+    response = client.get("/api/internships/", {"stipend": "20000+"})
+    assert [item["title"] for item in response.data["results"]] == ["B"]
+    response = client.get("/api/internships/", {"stipend": "unspecified", "work_type": "Remote"})
+    assert [item["title"] for item in response.data["results"]] == ["A"]
+    response = client.get("/api/internships/", {"skill": "go"})
+    assert [item["title"] for item in response.data["results"]] == ["B"]
+    assert client.get("/api/internships/", {"stipend": "lots"}).status_code == 400
@@ -0,0 +1,73 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models import ApplicantProfile, RecruiterProfile, Internship, Application
+
+User = get_user_model()
+
+
+@pytest.fixture
+def internship(db):
+    user = User.objects.create_user(
+        username="recruiter", email="rec@test.com", password="pass", role="RECRUITER", first_name="Rita"
+    )
+    recruiter = RecruiterProfile.objects.create(user=user, company_name="Test Corp")
+    return Internship.objects.create(
+        recruiter=recruiter, title="Backend", description="long text", responsibilities="more text", location="Pune"
+    )
+
+
+def _listing_sql(queries):
+    return next(query["sql"] for query in queries.captured_queries if 'FROM "core_internship"' in query["sql"] and "ORDER BY" in query["sql"])
+
+
+@pytest.mark.django_db
+def test_compact_view_skips_text_columns_and_user_join(internship):
+    """Test that ?view=compact trims both the payload and the SQL projection"""
+    with CaptureQueriesContext(connection) as queries:
+        response = APIClient().get("/api/internships/", {"view": "compact"})
+
+    row = response.data["results"][0]
+    assert set(row) == {
+        "id", "title", "company_name", "location", "work_type", "stipend", "status",
+        "required_skills", "deadline", "created_at",
+    }
+    assert row["company_name"] == "Test Corp"
+    sql = _listing_sql(queries)
+    assert '"description"' not in sql and '"responsibilities"' not in sql
+    assert "users_user" not in sql
+
+
+@pytest.mark.django_db
+def test_fields_parameter_selects_fields(internship):
+    """Test explicit ?fields= on list and detail, and unknown names"""
+    client = APIClient()
+    row = client.get("/api/internships/", {"fields": "title,recruiter_name"}).data["results"][0]
+    assert row == {"id": internship.pk, "title": "Backend", "recruiter_name": "Rita"}
+
+    detail = client.get(f"/api/internships/{internship.pk}/", {"fields": "location"}).data
+    assert detail == {"id": internship.pk, "location": "Pune"}
+    # The anonymous response cache keeps one entry per representation.
+    assert "description" in client.get(f"/api/internships/{internship.pk}/").data
+
+    response = client.get("/api/internships/", {"fields": "title,salary"})
+    assert response.status_code == 400
+    assert "salary" in str(response.data["fields"])
+
+
+@pytest.mark.django_db
+def test_sparse_application_list(internship):
+    """Test ?fields= on the recruiter application list"""
+    student = User.objects.create_user(username="student", email="student@test.com", password="pass", role="APPLICANT")
+    Application.objects.create(internship=internship, applicant=ApplicantProfile.objects.create(user=student))
+    client = APIClient()
+    client.force_authenticate(user=internship.recruiter.user)
+
+    response = client.get("/api/applications/", {"fields": "status,applicant_email"})
+
+    assert response.data["results"] == [
+        {"id": response.data["results"][0]["id"], "status": "PENDING", "applicant_email": "student@test.com"}
+    ]
@@ -0,0 +1,108 @@
+import io
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from assessments.models import Question, Skill
+from core.facets import get_facet_counts
+from core.ingest import ingest_internships
+from core.models import RecruiterProfile, Internship
+
+User = get_user_model()
+
+CSV_BODY = (
+    "title,location,stipend,required_skills,description\n"
+    "Backend Intern,Remote,8000,Python;Django,APIs\n"
+    ",Pune,5000,Python,missing title\n"
+    "Data Intern,Pune,not-a-number,SQL,bad stipend\n"
+    "ML Intern,,,\"[\"\"Python\"\", \"\"PyTorch\"\"]\",\n"
+)
+
+
+@pytest.fixture
+def recruiter_profile(db):
+    user = User.objects.create_user(username="recruiter", email="rec@test.com", password="pass", role="RECRUITER")
+    return RecruiterProfile.objects.create(user=user, company_name="Test Corp")
+
+
+@pytest.mark.django_db
+def test_csv_ingest_reports_bad_rows_and_keeps_good_ones(recruiter_profile, settings, django_capture_on_commit_callbacks):
+    """Test chunked CSV ingest with a per-line error report"""
+    settings.SKILL_QUESTION_GENERATION_ASYNC = False
+    settings.INTERNSHIP_MATCH_ASYNC = False
+
+    with django_capture_on_commit_callbacks(execute=True):
+        report = ingest_internships(io.StringIO(CSV_BODY), "csv", recruiter_profile, chunk_size=2)
+
+    assert report["created"] == 2
+    assert report["failed"] == 2
+    assert [entry["line"] for entry in report["errors"]] == [3, 4]
+    assert "title" in report["errors"][0]["errors"]
+    assert "stipend" in report["errors"][1]["errors"]
+
+    ml = Internship.objects.get(title="ML Intern")
+    assert ml.required_skills == ["Python", "PyTorch"]
+    assert ml.location == "Remote"
+    assert set(Skill.objects.values_list("name", flat=True)) == {"Python", "Django", "PyTorch"}
+    # Questions are generated after commit even though bulk_create skips post_save.
+    assert Question.objects.filter(skill__name="PyTorch").exists()
+    locations = {entry["value"]: entry["count"] for entry in get_facet_counts()["location"]}
+    assert locations == {"Remote": 2}
+
+
+@pytest.mark.django_db
+def test_jsonl_ingest_endpoint(recruiter_profile):
+    """Test the upload endpoint with JSONL input"""
+    lines = [
+        json.dumps({"title": "Frontend Intern", "required_skills": ["React"], "description": "UI"}),
+        "{not json",
+        json.dumps(["not", "an", "object"]),
+    ]
+    upload = SimpleUploadedFile("listings.jsonl", "\n".join(lines).encode("utf-8"))
+    client = APIClient()
+    client.force_authenticate(user=recruiter_profile.user)
+
+    response = client.post("/api/internships/bulk/", {"file": upload}, format="multipart")
+
+    assert response.status_code == 201
+    assert response.data["created"] == 1
+    assert [entry["line"] for entry in response.data["errors"]] == [2, 3]
+    assert Internship.objects.get().recruiter == recruiter_profile
+
+
+@pytest.mark.django_db
+def test_ingest_command(recruiter_profile, tmp_path):
+    """Test the management command reads a file and writes a report"""
+    source = tmp_path / "listings.csv"
+    source.write_text(CSV_BODY, encoding="utf-8")
+    report_path = tmp_path / "report.json"
+
+    call_command(
+        "ingest_internships", str(source), recruiter="rec@test.com", report=str(report_path), stdout=io.StringIO()
+    )
+
+    assert Internship.objects.count() == 2
+    assert json.loads(report_path.read_text())["failed"] == 2
+
+
+@pytest.mark.django_db
+def test_ingest_endpoint_reports_undecodable_upload(recruiter_profile):
+    """Test a cp1252 byte past the first decoded block: earlier rows stay, the rest is reported"""
+    rows = [f"Intern {index},Remote,{'x' * 200}" for index in range(60)]
+    body = ("title,location,description\n" + "\n".join(rows) + "\n").encode("utf-8") + "Café Intern,Pune,\n".encode("cp1252")
+    client = APIClient()
+    client.force_authenticate(user=recruiter_profile.user)
+
+    response = client.post("/api/internships/bulk/", {"file": SimpleUploadedFile("listings.csv", body)}, format="multipart")
+
+    assert response.status_code == 201
+    assert 0 < response.data["created"] < 61
+    assert response.data["failed"] == 1
+    error = response.data["errors"][0]
+    assert error["line"] == response.data["created"] + 2
+    assert "UTF-8" in error["errors"]["non_field_errors"][0]
+    assert Internship.objects.count() == response.data["created"]
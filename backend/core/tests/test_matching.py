@@ -0,0 +1,82 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from core.matching import match_internship
+from core.models import ApplicantProfile, RecruiterProfile, Internship, InternshipMatch
+from ml_engine.recommender import CandidateIndex, CandidateProfile, MicroAssessment, Internship as MLInternship
+
+User = get_user_model()
+
+
+def _candidate(candidate_id, skills):
+    return CandidateProfile(
+        id=candidate_id,
+        skills=skills,
+        micro_assessment=MicroAssessment(accuracy=0.9, speed_score=0.8, skip_penalty=0.0),
+    )
+
+
+def test_candidate_index_returns_candidates_above_threshold():
+    """Test that one internship is matched against the whole candidate matrix"""
+    index = CandidateIndex().fit([
+        _candidate(1, ["Python", "Django"]),
+        _candidate(2, ["React", "TypeScript"]),
+        _candidate(3, ["Python", "Pandas"]),
+    ])
+    internship = MLInternship(id=10, title="Backend Intern", description="Python Django APIs")
+
+    results = index.match(internship, min_similarity=0.1)
+
+    ids = [result["candidate"].id for result in results]
+    assert ids[0] == 1
+    assert 2 not in ids
+    assert all(result["cosine_similarity"] > 0.1 for result in results)
+
+
+def test_candidate_index_empty():
+    """Test that an empty index never matches"""
+    index = CandidateIndex().fit([])
+    internship = MLInternship(id=10, title="Backend Intern", description="Python")
+    assert index.match(internship) == []
+
+
+@override_settings(INTERNSHIP_MATCH_ASYNC=False, INTERNSHIP_MATCH_MIN_SIMILARITY=0.1)
+class InternshipMatchingTests(TestCase):
+    """Test the internship create hook"""
+
+    def setUp(self):
+        recruiter_user = User.objects.create_user(
+            username="recruiter", email="rec@test.com", password="pass", role="RECRUITER"
+        )
+        self.recruiter_profile = RecruiterProfile.objects.create(user=recruiter_user, company_name="Test Corp")
+        python_user = User.objects.create_user(
+            username="py", email="py@test.com", password="pass", role="APPLICANT"
+        )
+        self.python_profile = ApplicantProfile.objects.create(
+            user=python_user, skills=["Python", {"name": "Django", "status": "verified"}]
+        )
+        react_user = User.objects.create_user(
+            username="js", email="js@test.com", password="pass", role="APPLICANT"
+        )
+        self.react_profile = ApplicantProfile.objects.create(user=react_user, skills=["React"])
+
+    def test_new_internship_is_matched_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            internship = Internship.objects.create(
+                recruiter=self.recruiter_profile,
+                title="Backend Intern",
+                description="Build services",
+                required_skills=["Python", "Django"],
+            )
+
+        matched = list(InternshipMatch.objects.filter(internship=internship).values_list('applicant_id', flat=True))
+        self.assertEqual(matched, [self.python_profile.id])
+
+    def test_matching_is_idempotent(self):
+        internship = Internship.objects.create(
+            recruiter=self.recruiter_profile, title="Frontend Intern", required_skills=["React"]
+        )
+        match_internship(internship.id)
+        match_internship(internship.id)
+        self.assertEqual(InternshipMatch.objects.filter(internship=internship).count(), 1)
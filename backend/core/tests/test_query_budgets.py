@@ -0,0 +1,131 @@
+"""
+Query-count budgets for the router endpoints.
+
+Every endpoint is requested at several data sizes; the number of queries must
+not grow with the number of rows returned (an N+1 would). Counts and timings
+are collected per endpoint and size, and written as JSON to the path in the
+QUERY_BUDGET_REPORT environment variable when it is set (CI uploads it as an
+artifact).
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from assessments.models import AssessmentAttempt, Question, Skill
+from core.models import ApplicantProfile, Application, Internship, InternshipMatch, RecruiterProfile
+
+User = get_user_model()
+
+SIZES = (2, 6, 12)
+
+# name -> (role of the requesting user, path; `{internship}` is the first listing)
+ENDPOINTS = {
+    "applicants": ("RECRUITER", "/api/applicants/"),
+    "applicants-matches": ("APPLICANT", "/api/applicants/matches/"),
+    "recruiters": ("ADMIN", "/api/recruiters/"),
+    "internships": (None, "/api/internships/?page_size=100"),
+    "internships-authenticated": ("APPLICANT", "/api/internships/?page_size=100"),
+    "internship-applicants": ("RECRUITER", "/api/internships/{internship}/applicants/?page_size=200"),
+    "applications-applicant": ("APPLICANT", "/api/applications/"),
+    "applications-recruiter": ("RECRUITER", "/api/applications/"),
+    "applications-admin": ("ADMIN", "/api/applications/"),
+    "skills": ("APPLICANT", "/api/skills/"),
+    "assessment-attempts": ("ADMIN", "/api/assessments/attempts/"),
+    "questions": ("ADMIN", "/api/questions/"),
+    "admin-users": ("ADMIN", "/api/users/"),
+}
+
+_report = {}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def write_report():
+    yield
+    path = os.environ.get("QUERY_BUDGET_REPORT")
+    if path and _report:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps({"sizes": SIZES, "endpoints": _report}, indent=2, sort_keys=True))
+
+
+def _user(name, role):
+    # No password: hashing would dominate the run time.
+    return User.objects.create_user(username=name, email=f"{name}@test.com", role=role, first_name=name.title())
+
+
+class Platform:
+    """Grows every table the endpoints read by the same number of rows."""
+
+    def __init__(self):
+        self.size = 0
+        self.admin = _user("admin", "ADMIN")
+        self.recruiter = RecruiterProfile.objects.create(user=_user("recruiter", "RECRUITER"), company_name="Test Corp")
+        self.applicant = ApplicantProfile.objects.create(user=_user("student", "APPLICANT"))
+        self.internships = []
+
+    def grow(self, size):
+        for index in range(self.size, size):
+            skill = Skill.objects.bulk_create([Skill(name=f"Skill {index}")])[0]
+            Question.objects.create(skill=skill, text=f"Question {index}", options=["a", "b"], correct_option=0)
+            internship = Internship.objects.create(
+                recruiter=self.recruiter, title=f"Listing {index}", required_skills=[skill.name]
+            )
+            self.internships.append(internship)
+            RecruiterProfile.objects.create(user=_user(f"recruiter{index}", "RECRUITER"), company_name=f"Corp {index}")
+
+            student = ApplicantProfile.objects.create(user=_user(f"student{index}", "APPLICANT"), skills=[skill.name])
+            Application.objects.create(internship=self.internships[0], applicant=student)
+            Application.objects.create(internship=internship, applicant=self.applicant)
+            InternshipMatch.objects.create(internship=internship, applicant=self.applicant, similarity=0.5, score=0.5)
+            attempt = AssessmentAttempt.objects.create(user=student.user, status="COMPLETED", score=0.8)
+            attempt.skills_assessed.add(skill)
+        self.size = size
+
+    def client_for(self, role):
+        client = APIClient()
+        user = {"ADMIN": self.admin, "RECRUITER": self.recruiter.user, "APPLICANT": self.applicant.user}.get(role)
+        if user is not None:
+            client.force_authenticate(user=user)
+        return client
+
+
+def _rows(data):
+    return len(data["results"]) if isinstance(data, dict) and "results" in data else len(data)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", sorted(ENDPOINTS))
+def test_query_count_does_not_grow_with_rows(name):
+    """Test that each endpoint costs the same number of queries at every data size"""
+    role, path = ENDPOINTS[name]
+    platform = Platform()
+    measurements = []
+    for size in SIZES:
+        platform.grow(size)
+        client = platform.client_for(role)
+        url = path.format(internship=platform.internships[0].pk)
+        # Measure the uncached path; response and dashboard caches would hide an N+1.
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = client.get(url)
+            elapsed = time.perf_counter() - started
+        assert response.status_code == 200, (name, response.status_code)
+        measurements.append({
+            "size": size,
+            "rows": _rows(response.data),
+            "queries": len(queries),
+            "ms": round(elapsed * 1000, 2),
+        })
+    _report[name] = measurements
+
+    assert measurements[-1]["rows"] > measurements[0]["rows"], f"{name} does not return more rows as data grows"
+    counts = [measurement["queries"] for measurement in measurements]
+    assert len(set(counts)) == 1, f"{name} query count grows with rows: {measurements}"
@@ -0,0 +1,65 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection, models
+
+from core.query_plans import explain, uses_index
+from core.models import ApplicantProfile, RecruiterProfile, Internship, Application
+
+User = get_user_model()
+
+postgres_only = pytest.mark.skipif(connection.vendor != "postgresql", reason="GIN indexes exist on PostgreSQL only")
+
+
+@pytest.fixture
+def data(db):
+    recruiter = RecruiterProfile.objects.create(
+        user=User.objects.create_user(username="recruiter", email="Rec@Test.com", password="pass", role="RECRUITER"),
+        company_name="Test Corp",
+    )
+    internship = Internship.objects.create(recruiter=recruiter, title="Backend", required_skills=["Python"])
+    for index in range(3):
+        user = User.objects.create_user(
+            username=f"student{index}", email=f"student{index}@test.com", password="pass", role="APPLICANT"
+        )
+        applicant = ApplicantProfile.objects.create(user=user, vsps_score=index / 3, skills=["Python"])
+        Application.objects.create(internship=internship, applicant=applicant)
+    return internship
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "build, index_name",
+    [
+        (lambda internship: Application.objects.filter(internship=internship, status="PENDING"), "app_internship_status_idx"),
+        (lambda internship: Application.objects.filter(applicant_id=1).order_by("-applied_at"), "app_applicant_applied_idx"),
+        (lambda internship: ApplicantProfile.objects.order_by("-vsps_score")[:10], "applicant_vsps_idx"),
+        (
+            lambda internship: Internship.objects.filter(status="OPEN").order_by("-created_at", "-id")[:20],
+            "intern_status_created_idx",
+        ),
+        (lambda internship: User.objects.filter(email__lower="rec@test.com"), "user_email_lower_idx"),
+    ],
+    ids=["application-status", "applicant-applications", "vsps-ranking", "open-listings", "email-lookup"],
+)
+def test_hot_queries_use_their_indexes(data, build, index_name):
+    """Test that each hot query can be answered through its index"""
+    queryset = build(data)
+    assert uses_index(queryset, index_name), explain(queryset)
+
+
+@postgres_only
+@pytest.mark.django_db
+def test_skill_containment_uses_gin_index(data):
+    """Test JSON containment queries use the GIN indexes"""
+    listings = Internship.objects.filter(required_skills__contains=["Python"])
+    applicants = ApplicantProfile.objects.filter(skills__contains=["Python"])
+    assert uses_index(listings, "core_internship_skills_gin"), explain(listings)
+    assert uses_index(applicants, "core_applicant_skills_gin"), explain(applicants)
+
+
+@pytest.mark.django_db
+def test_email_lower_lookup_is_case_insensitive(data):
+    """Test the lower() email lookup used with the functional index"""
+    assert User.objects.get(email__lower="REC@test.com".lower()).username == "recruiter"
+    # Registered on User.email only, not on every EmailField.
+    assert models.EmailField().get_lookup("lower") is None
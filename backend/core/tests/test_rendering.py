@@ -0,0 +1,103 @@
+import gzip
+import io
+import json
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from core.compression import CompressionMiddleware, accepted_encodings
+from core.models import ApplicantProfile, RecruiterProfile, Internship
+from core.renderers import FastJSONRenderer
+
+User = get_user_model()
+
+
+def test_fast_renderer_matches_stdlib_output():
+    """Test that the orjson path renders exactly what DRF's JSONRenderer does"""
+    data = {
+        "when": datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=dt_timezone.utc),
+        "amount": Decimal("12.50"),
+        "label": gettext_lazy("Pending"),
+        "token": uuid.UUID(int=7),
+        "nested": [{"ok": True, "none": None}, "line\u2028break"],
+        3: "int key",
+    }
+    fast = FastJSONRenderer().render(data)
+    assert json.loads(fast) == json.loads(JSONRenderer().render(data))
+    assert b"\\u2028" in fast
+    assert FastJSONRenderer().render(None) == b""
+
+
+def _middleware(body, accept):
+    request = RequestFactory().get("/api/internships/", HTTP_ACCEPT_ENCODING=accept)
+    return CompressionMiddleware(lambda request: HttpResponse(body, content_type="application/json"))(request)
+
+
+def test_compression_threshold_and_gzip(settings):
+    """Test that only responses above the threshold are compressed"""
+    settings.RESPONSE_COMPRESSION_MIN_BYTES = 1024
+    body = json.dumps([{"title": "Backend intern", "index": index} for index in range(200)]).encode()
+
+    small = _middleware(b'{"ok": true}', "gzip")
+    assert not small.has_header("Content-Encoding")
+
+    large = _middleware(body, "gzip, deflate")
+    assert large["Content-Encoding"] == "gzip"
+    assert gzip.decompress(large.content) == body
+    assert "Accept-Encoding" in large["Vary"]
+
+    assert not _middleware(body, "identity").has_header("Content-Encoding")
+
+
+def test_brotli_is_preferred_when_available(settings):
+    """Test br negotiation (needs the optional brotli package)"""
+    brotli = pytest.importorskip("brotli")
+    body = json.dumps([{"title": "Backend intern", "index": index} for index in range(200)]).encode()
+
+    response = _middleware(body, "gzip, br")
+    assert response["Content-Encoding"] == "br"
+    assert brotli.decompress(response.content) == body
+    assert _middleware(body, "gzip, br;q=0")["Content-Encoding"] == "gzip"
+
+
+def test_credentialed_responses_are_never_brotli(settings):
+    """Test that authenticated responses keep gzip's random-length padding (BREACH)"""
+    pytest.importorskip("brotli")
+    body = json.dumps([{"title": "Backend intern", "index": index} for index in range(200)]).encode()
+    request = RequestFactory().get("/api/applicants/me/", HTTP_ACCEPT_ENCODING="br, gzip", HTTP_AUTHORIZATION="Bearer token")
+    middleware = CompressionMiddleware(lambda request: HttpResponse(body, content_type="application/json"))
+    response = middleware(request)
+
+    assert response["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.content) == body
+
+
+def test_accepted_encodings_honours_zero_quality():
+    assert accepted_encodings("gzip;q=0.5, br;q=0, identity") == {"gzip", "identity"}
+
+
+@pytest.mark.django_db
+def test_benchmark_command_reports_both_payloads():
+    """Test the benchmark command on a small data set"""
+    recruiter = RecruiterProfile.objects.create(
+        user=User.objects.create_user(username="recruiter", email="rec@test.com", role="RECRUITER"), company_name="Corp"
+    )
+    Internship.objects.create(recruiter=recruiter, title="Backend", required_skills=["Python"])
+    ApplicantProfile.objects.create(
+        user=User.objects.create_user(username="student", email="student@test.com", role="APPLICANT"), skills=["Python"]
+    )
+
+    out = io.StringIO()
+    call_command("benchmark_responses", "--iterations", "1", stdout=out)
+
+    report = out.getvalue()
+    assert "internships: 1 rows" in report
+    assert "recommendations:" in report
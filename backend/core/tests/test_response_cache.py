@@ -0,0 +1,98 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models import RecruiterProfile, Internship
+from core.response_cache import normalized_query, reset_response_cache_stats, response_cache_stats
+
+User = get_user_model()
+
+
+@pytest.fixture
+def recruiter_profile(db):
+    cache.clear()
+    user = User.objects.create_user(username="recruiter", email="rec@test.com", password="pass", role="RECRUITER")
+    return RecruiterProfile.objects.create(user=user, company_name="Test Corp")
+
+
+@pytest.fixture
+def internship(recruiter_profile):
+    return Internship.objects.create(recruiter=recruiter_profile, title="Backend Intern", location="Remote")
+
+
+def test_normalized_query_ignores_order_and_blanks():
+    """Test that equivalent query strings share a cache key"""
+    from django.http import QueryDict
+
+    assert normalized_query(QueryDict("status=OPEN&location=Remote&skill=")) == normalized_query(
+        QueryDict("location=Remote&status=OPEN")
+    )
+
+
+@pytest.mark.django_db
+def test_anonymous_list_is_served_from_cache(internship):
+    """Test that a repeated anonymous list request skips the database"""
+    client = APIClient()
+    reset_response_cache_stats()
+    first = client.get("/api/internships/?location=Remote")
+    with CaptureQueriesContext(connection) as queries:
+        second = client.get("/api/internships/?location=Remote")
+
+    assert len(queries) == 0
+    assert second.data == first.data
+    assert second["ETag"] == first["ETag"]
+    assert response_cache_stats()["list"] == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+    not_modified = client.get("/api/internships/?location=Remote", HTTP_IF_NONE_MATCH=first["ETag"])
+    assert not_modified.status_code == 304
+
+
+@pytest.mark.django_db
+def test_internship_save_invalidates_list_and_its_detail_only(recruiter_profile, internship):
+    """Test precise invalidation of detail entries"""
+    other = Internship.objects.create(recruiter=recruiter_profile, title="Data Intern")
+    client = APIClient()
+    client.get(f"/api/internships/{internship.pk}/")
+    client.get(f"/api/internships/{other.pk}/")
+    client.get("/api/internships/")
+    reset_response_cache_stats()
+
+    internship.title = "Platform Intern"
+    internship.save()
+
+    assert client.get(f"/api/internships/{internship.pk}/").data["title"] == "Platform Intern"
+    assert client.get(f"/api/internships/{other.pk}/").data["title"] == "Data Intern"
+    titles = {item["title"] for item in client.get("/api/internships/").data["results"]}
+    assert titles == {"Platform Intern", "Data Intern"}
+
+    stats = response_cache_stats()
+    assert stats["retrieve"]["hits"] == 1 and stats["retrieve"]["misses"] == 1
+    assert stats["list"]["misses"] == 1
+
+
+@pytest.mark.django_db
+def test_recruiter_change_invalidates_their_internships(recruiter_profile, internship):
+    """Test that embedded recruiter fields never go stale"""
+    client = APIClient()
+    client.get(f"/api/internships/{internship.pk}/")
+
+    recruiter_profile.company_name = "Renamed Corp"
+    recruiter_profile.save()
+
+    assert client.get(f"/api/internships/{internship.pk}/").data["company_name"] == "Renamed Corp"
+
+
+@pytest.mark.django_db
+def test_authenticated_requests_bypass_cache(recruiter_profile, internship):
+    """Test that only anonymous requests use the cache"""
+    client = APIClient()
+    client.force_authenticate(user=recruiter_profile.user)
+    reset_response_cache_stats()
+    client.get("/api/internships/")
+    client.get("/api/internships/")
+
+    assert response_cache_stats()["list"]["hits"] == 0
+    assert response_cache_stats()["list"]["misses"] == 0
@@ -0,0 +1,71 @@
+import io
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.models import ApplicantProfile, RecruiterProfile, Internship, Application
+from core.scoring import recompute_profile_scores
+from ml_engine.recommender import MicroAssessment, decayed_recency, vsps_scores
+
+User = get_user_model()
+
+
+def test_vectorized_scores_match_the_engine():
+    accuracy, speed, skip = np.array([0.9, 0.4, 1.5]), np.array([0.5, 1.0, 0.2]), np.array([0.0, 0.3, -1.0])
+    expected = [MicroAssessment(a, s, p).vsps() for a, s, p in zip(accuracy, speed, skip)]
+    assert np.allclose(vsps_scores(accuracy, speed, skip), expected)
+    assert np.allclose(decayed_recency(np.array([-1.0, 0.0, 30.0, 60.0]), 30.0), [1.0, 1.0, 0.5, 0.25])
+
+
+def _applicant(name, joined, **scores):
+    user = User.objects.create_user(username=name, email=f"{name}@test.com", role="APPLICANT")
+    User.objects.filter(pk=user.pk).update(date_joined=joined)
+    return ApplicantProfile.objects.create(user=user, **scores)
+
+
+@pytest.mark.django_db
+def test_recompute_decays_recency_and_refreshes_vsps():
+    """Test decay from the latest activity, the pass-mark rule and chunked writes"""
+    now = timezone.now()
+    idle = _applicant("idle", now - timedelta(days=60))
+    active = _applicant("active", now - timedelta(days=90))
+    recruiter = RecruiterProfile.objects.create(
+        user=User.objects.create_user(username="recruiter", email="rec@test.com", role="RECRUITER"), company_name="Corp"
+    )
+    application = Application.objects.create(internship=Internship.objects.create(recruiter=recruiter, title="Backend"), applicant=active)
+    Application.objects.filter(pk=application.pk).update(applied_at=now - timedelta(days=30))
+    passed = _applicant("passed", now, assessment_accuracy=1.0, assessment_speed_score=1.0, vsps_score=0.5)
+    failed = _applicant("failed", now, assessment_accuracy=0.4, assessment_speed_score=1.0, vsps_score=0.7)
+
+    with CaptureQueriesContext(connection) as queries:
+        stats = recompute_profile_scores(chunk_size=2, half_life_days=30, now=now)
+
+    assert stats == {"profiles": 4, "updated": 3}
+    scores = {p.pk: p for p in ApplicantProfile.objects.all()}
+    assert scores[idle.pk].recency_score == pytest.approx(0.25)
+    assert scores[active.pk].recency_score == pytest.approx(0.5)
+    assert scores[passed.pk].vsps_score == pytest.approx(0.9)
+    assert scores[failed.pk].vsps_score == pytest.approx(0.7)
+    assert scores[idle.pk].updated_at == now
+    updates = [query["sql"] for query in queries.captured_queries if query["sql"].startswith('UPDATE "core_applicantprofile"')]
+    assert len(updates) == 2
+
+    # Nothing moved since, so a second run writes nothing.
+    assert recompute_profile_scores(chunk_size=2, half_life_days=30, now=now)["updated"] == 0
+
+
+@pytest.mark.django_db
+def test_recompute_scores_command_dry_run():
+    profile = _applicant("idle", timezone.now() - timedelta(days=30))
+    out = io.StringIO()
+
+    call_command("recompute_scores", "--dry-run", "--half-life-days", "30", stdout=out)
+
+    assert "Scored 1 profiles, would update 1" in out.getvalue()
+    assert ApplicantProfile.objects.get(pk=profile.pk).recency_score == 1.0
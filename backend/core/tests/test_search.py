@@ -0,0 +1,90 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from core.models import RecruiterProfile, Internship
+from core.search import search_internships
+
+User = get_user_model()
+
+
+@pytest.fixture
+def recruiter_profile(db):
+    user = User.objects.create_user(username="recruiter", email="rec@test.com", password="pass", role="RECRUITER")
+    return RecruiterProfile.objects.create(user=user, company_name="Test Corp")
+
+
+@pytest.mark.django_db
+def test_search_ranks_and_highlights(recruiter_profile):
+    """Test that search matches title, description and skills"""
+    backend = Internship.objects.create(
+        recruiter=recruiter_profile,
+        title="Django Backend Intern",
+        description="Build REST APIs with Django",
+        required_skills=["Python", "Django"],
+    )
+    Internship.objects.create(
+        recruiter=recruiter_profile,
+        title="Data Intern",
+        description="Dashboards in SQL",
+        required_skills=["Python"],
+    )
+    Internship.objects.create(recruiter=recruiter_profile, title="Design Intern", description="Figma")
+
+    hits = search_internships("django")
+    assert [hit["id"] for hit in hits] == [backend.id]
+    assert "<mark>" in hits[0]["highlights"]["title"]
+
+    assert len(search_internships("python")) == 2
+
+
+@pytest.mark.django_db
+def test_search_highlights_escape_listing_text(recruiter_profile):
+    """Test that only the match markers are markup in highlights"""
+    Internship.objects.create(
+        recruiter=recruiter_profile,
+        title="<img src=x onerror=alert(1)> Golang Intern",
+        description="Golang & <script>alert('x')</script> services",
+    )
+
+    highlights = search_internships("golang")[0]["highlights"]
+
+    assert highlights["title"] == "&lt;img src=x onerror=alert(1)&gt; <mark>Golang</mark> Intern"
+    assert "<script>" not in highlights["description"]
+    assert "&amp; &lt;script&gt;" in highlights["description"]
+    assert "<mark>Golang</mark>" in highlights["description"]
+
+
+@pytest.mark.django_db
+def test_search_index_follows_updates_and_deletes(recruiter_profile):
+    """Test that the index stays in sync with the internship table"""
+    internship = Internship.objects.create(recruiter=recruiter_profile, title="Kotlin Intern")
+    assert len(search_internships("kotlin")) == 1
+
+    internship.title = "Swift Intern"
+    internship.save()
+    assert search_internships("kotlin") == []
+    assert len(search_internships("swift")) == 1
+
+    internship.delete()
+    assert search_internships("swift") == []
+
+
+@pytest.mark.django_db
+def test_search_endpoint_is_paginated(recruiter_profile):
+    """Test the /api/internships/search/ action"""
+    for index in range(3):
+        Internship.objects.create(recruiter=recruiter_profile, title=f"Rust Intern {index}")
+
+    client = APIClient()
+    response = client.get("/api/internships/search/", {"q": "rust", "page_size": 2})
+    assert response.status_code == 200
+    assert len(response.data["results"]) == 2
+    assert response.data["results"][0]["company_name"] == "Test Corp"
+    assert "search" in response.data["results"][0]
+
+    response = client.get(response.data["next"])
+    assert len(response.data["results"]) == 1
+    assert response.data["next"] is None
+
+    assert client.get("/api/internships/search/").status_code == 400
@@ -0,0 +1,43 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models import PlatformSettings
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_settings_are_read_once_per_version(django_capture_on_commit_callbacks):
+    """Test that repeated reads are served from memory until the row is saved"""
+    with django_capture_on_commit_callbacks(execute=True):
+        first = PlatformSettings.get_settings()
+    assert first.enforce_2fa_for_admins_recruiters is True
+
+    with CaptureQueriesContext(connection) as queries:
+        PlatformSettings.get_settings()
+    assert len(queries) == 0
+
+    first.enforce_2fa_for_admins_recruiters = False
+    assert PlatformSettings.get_settings().enforce_2fa_for_admins_recruiters is True
+
+    with django_capture_on_commit_callbacks(execute=True):
+        first.save()
+    assert PlatformSettings.get_settings().enforce_2fa_for_admins_recruiters is False
+
+
+@pytest.mark.django_db
+def test_settings_endpoint_update_is_visible_immediately(django_capture_on_commit_callbacks):
+    """Test that an admin update invalidates the cached settings"""
+    client = APIClient()
+    client.force_authenticate(
+        user=User.objects.create_user(username="admin", email="admin@test.com", password="pass", role="ADMIN")
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        assert client.get("/api/platform-settings/settings/").data["auto_approve_verified_recruiters"] is False
+        client.patch("/api/platform-settings/update_settings/", {"auto_approve_verified_recruiters": True}, format="json")
+
+    assert client.get("/api/platform-settings/settings/").data["auto_approve_verified_recruiters"] is True
+    assert PlatformSettings.objects.get().auto_approve_verified_recruiters is True
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from core.models import ApplicantProfile, RecruiterProfile, Internship
+from ml_engine.recommender import CandidateProfile, MicroAssessment, RecommendationEngine, Internship as MLInternship
+from ml_engine.shadow import ShadowScorer, jaccard_at_k, ndcg_at_k
+
+User = get_user_model()
+
+
+def test_ranking_overlap_metrics():
+    """Test Jaccard@k and NDCG@k against the production ranking"""
+    assert jaccard_at_k([1, 2, 3], [1, 2, 3], 3) == 1.0
+    assert jaccard_at_k([1, 2], [3, 4], 2) == 0.0
+    assert abs(jaccard_at_k([1, 2, 3], [1, 2, 4], 3) - 0.5) < 0.001
+    assert abs(ndcg_at_k([1, 2, 3], [1, 2, 3], 3) - 1.0) < 0.001
+    assert ndcg_at_k([1, 2, 3], [3, 2, 1], 3) < 1.0
+    assert ndcg_at_k([1, 2, 3], [4, 5, 6], 3) == 0.0
+
+
+def test_shadow_does_not_change_production_results():
+    """Test that a failing shadow engine is recorded but never surfaces"""
+    def broken_engine():
+        raise RuntimeError("boom")
+
+    scorer = ShadowScorer(
+        production_factory=RecommendationEngine,
+        shadow_factory=broken_engine,
+        sample_rate=1.0,
+        run_in_background=False,
+    )
+    candidate = CandidateProfile(
+        id=1, skills=["Python"], micro_assessment=MicroAssessment(accuracy=1.0, speed_score=1.0, skip_penalty=0.0)
+    )
+    internships = [
+        MLInternship(id=1, title="Python Intern", description="Python"),
+        MLInternship(id=2, title="Design Intern", description="Figma"),
+    ]
+
+    results = scorer.recommend(candidate, internships)
+
+    assert [item["internship"].id for item in results] == [1, 2]
+    summary = scorer.summary()
+    assert summary["samples"] == 1
+    assert summary["errors"] == 1
+
+
+def test_shadow_records_latency_and_overlap():
+    """Test that sampled requests record latency deltas and overlap"""
+    scorer = ShadowScorer(
+        production_factory=RecommendationEngine,
+        shadow_factory=lambda: RecommendationEngine(vectorizer_options={"sublinear_tf": True}),
+        sample_rate=0.5,
+        k=2,
+        run_in_background=False,
+        rng=random.Random(7),
+    )
+    candidate = CandidateProfile(
+        id=1, skills=["Python"], micro_assessment=MicroAssessment(accuracy=1.0, speed_score=1.0, skip_penalty=0.0)
+    )
+    internships = [MLInternship(id=i, title=f"Intern {i}", description="Python" * i) for i in range(1, 4)]
+
+    for _ in range(20):
+        scorer.recommend(candidate, internships)
+
+    summary = scorer.summary()
+    assert 0 < summary["samples"] < 20
+    assert summary["errors"] == 0
+    assert 0.0 <= summary["jaccard_at_k_mean"] <= 1.0
+    assert "latency_delta_ms_p95" in summary
+
+
+@pytest.mark.django_db
+def test_recommendations_endpoint():
+    """Test that applicants get ranked recommendations"""
+    recruiter_user = User.objects.create_user(
+        username="recruiter", email="rec@test.com", password="pass", role="RECRUITER"
+    )
+    recruiter_profile = RecruiterProfile.objects.create(user=recruiter_user, company_name="Test Corp")
+    Internship.objects.create(recruiter=recruiter_profile, title="Design Intern", required_skills=["Figma"])
+    python_internship = Internship.objects.create(
+        recruiter=recruiter_profile, title="Backend Intern", required_skills=["Python", "Django"]
+    )
+    applicant_user = User.objects.create_user(
+        username="student", email="student@test.com", password="pass", role="APPLICANT"
+    )
+    ApplicantProfile.objects.create(
+        user=applicant_user, skills=["Python"], assessment_accuracy=0.9, assessment_speed_score=0.8
+    )
+
+    client = APIClient()
+    client.force_authenticate(user=applicant_user)
+    response = client.get("/api/internships/recommendations/")
+
+    assert response.status_code == 200
+    assert response.data[0]["id"] == python_internship.id
+    assert response.data[0]["recommendation"]["final_score"] > 0
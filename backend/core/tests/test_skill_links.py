@@ -0,0 +1,130 @@
+import io
+from importlib import import_module
+
+import pytest
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from assessments.models import Skill
+from core.ingest import ingest_internships
+from core.models import ApplicantProfile, ApplicantSkill, RecruiterProfile, Internship, InternshipSkill
+
+User = get_user_model()
+
+
+@pytest.fixture
+def recruiter_profile(db):
+    user = User.objects.create_user(username="recruiter", email="rec@test.com", password="pass", role="RECRUITER")
+    return RecruiterProfile.objects.create(user=user, company_name="Test Corp")
+
+
+def _applicant(name, skills):
+    user = User.objects.create_user(username=name, email=f"{name}@test.com", password="pass", role="APPLICANT")
+    return ApplicantProfile.objects.create(user=user, skills=skills)
+
+
+def _links(internship):
+    return dict(internship.skill_links.values_list("skill__name", "kind"))
+
+
+@pytest.mark.django_db
+def test_internship_links_follow_skill_lists(recruiter_profile, settings):
+    """Test that saves keep InternshipSkill rows in step, required winning over preferred"""
+    settings.SKILL_QUESTION_GENERATION_ASYNC = False
+    internship = Internship.objects.create(
+        recruiter=recruiter_profile, title="Backend", required_skills=["Python", " django "], preferred_skills=["python", "Docker"]
+    )
+    assert _links(internship) == {"Python": "required", "django": "required", "Docker": "preferred"}
+
+    internship.required_skills = ["Docker"]
+    internship.preferred_skills = []
+    internship.save()
+    assert _links(internship) == {"Docker": "required"}
+
+    internship.title = "Platform"
+    internship.save(update_fields=["title"])
+    assert _links(internship) == {"Docker": "required"}
+
+
+@pytest.mark.django_db
+def test_applicant_links_carry_verification(settings):
+    """Test status and score copied from the assessment entries of ApplicantProfile.skills"""
+    Skill.objects.bulk_create([Skill(name="SQL"), Skill(name="Python")])
+    profile = _applicant("student", ["SQL", {"name": "Python", "status": "verified", "last_score": 82.5}, "Basket weaving"])
+
+    assert not Skill.objects.filter(name__iexact="basket weaving").exists()
+    rows = {link.skill.name: (link.status, link.score) for link in profile.skill_links.select_related("skill")}
+    assert rows == {"SQL": ("pending", None), "Python": ("verified", 82.5)}
+
+    profile.skills = [{"name": "python", "status": "pending", "last_score": 40}]
+    profile.save()
+    assert list(profile.skill_links.values_list("skill__name", "status", "score")) == [("Python", "pending", 40.0)]
+
+
+@pytest.mark.django_db
+def test_skill_filters_join_through_links(recruiter_profile, settings):
+    """Test the internship and applicant skill filters"""
+    settings.SKILL_QUESTION_GENERATION_ASYNC = False
+    go = Internship.objects.create(recruiter=recruiter_profile, title="Go", required_skills=["Go"])
+    Internship.objects.create(recruiter=recruiter_profile, title="Preferred", preferred_skills=["Go"])
+    verified = _applicant("verified", [{"name": "Go", "status": "verified"}])
+    _applicant("pending", ["go"])
+
+    client = APIClient()
+    response = client.get("/api/internships/", {"skill": "GO"})
+    assert [row["id"] for row in response.data["results"]] == [go.pk]
+    assert client.get("/api/internships/", {"skill": "Cobol"}).data["results"] == []
+
+    client.force_authenticate(user=recruiter_profile.user)
+    assert len(client.get("/api/applicants/", {"skill": "go"}).data) == 2
+    assert [row["id"] for row in client.get("/api/applicants/", {"skill": "go", "verified": "true"}).data] == [verified.pk]
+
+
+@pytest.mark.django_db
+def test_new_catalog_skills_link_applicants_that_listed_them(recruiter_profile):
+    """Test that skills joining the catalog after a profile listed them are linked"""
+    early = _applicant("early", [{"name": "rust", "status": "verified"}, "Café  Latte"])
+    _applicant("other", ["Rusty nails"])
+    assert not early.skill_links.exists()
+
+    Internship.objects.create(recruiter=recruiter_profile, title="Systems", required_skills=["Rust"])
+    Skill.objects.create(name="Café Latte")
+
+    assert sorted(early.skill_links.values_list("skill__name", "status")) == [("Café Latte", "pending"), ("Rust", "verified")]
+    assert ApplicantSkill.objects.count() == 2
+    client = APIClient()
+    client.force_authenticate(user=recruiter_profile.user)
+    assert [row["id"] for row in client.get("/api/applicants/", {"skill": "Rust"}).data] == [early.pk]
+
+
+@pytest.mark.django_db
+def test_ingest_writes_links_for_bulk_created_listings(recruiter_profile, settings):
+    """Test that bulk_create in ingest still produces skill links"""
+    settings.SKILL_QUESTION_GENERATION_ASYNC = False
+    settings.INTERNSHIP_MATCH_ASYNC = False
+    body = "title,required_skills,preferred_skills\nBackend,Python;Django,Docker\n"
+
+    report = ingest_internships(io.StringIO(body), "csv", recruiter_profile)
+
+    assert report["skills_created"] == 3
+    internship = Internship.objects.get(title="Backend")
+    assert _links(internship) == {"Python": "required", "Django": "required", "Docker": "preferred"}
+
+
+@pytest.mark.django_db
+def test_backfill_migration_derives_links(recruiter_profile):
+    """Test the data migration on rows written before the link tables existed"""
+    Skill.objects.create(name="Python")
+    internship = Internship.objects.create(recruiter=recruiter_profile, title="Backend", required_skills=["python", "Rust"])
+    profile = _applicant("student", [{"name": "Rust", "status": "verified", "last_score": 90}, "Knitting"])
+    InternshipSkill.objects.all().delete()
+    ApplicantSkill.objects.all().delete()
+
+    migration = import_module("core.migrations.0017_backfill_skill_links")
+    migration.backfill_skill_links(apps, None)
+
+    assert _links(internship) == {"Python": "required", "Rust": "required"}
+    assert list(profile.skill_links.values_list("skill__name", "status", "score")) == [("Rust", "verified", 90.0)]
+    assert Skill.objects.filter(name__iexact="rust").count() == 1
+    assert not Skill.objects.filter(name__iexact="knitting").exists()
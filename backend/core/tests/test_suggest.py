@@ -0,0 +1,55 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models import ApplicantProfile, RecruiterProfile
+from core.throttles import SuggestRateThrottle
+
+User = get_user_model()
+
+
+@pytest.fixture
+def student(db):
+    user = User.objects.create_user(
+        username="student", email="Student@Test.com", password="pass", role="APPLICANT", first_name="Stu"
+    )
+    ApplicantProfile.objects.create(user=user, college="IIT")
+    return user
+
+
+@pytest.mark.django_db
+def test_suggest_is_read_only(student):
+    """Test that a user without a recruiter profile gets a hint but no new profile"""
+    response = APIClient().get("/api/recruiters/suggest/", {"email": "student@test.com"})
+
+    assert response.status_code == 200
+    assert response.data["company_name"] == "Stu"
+    assert not RecruiterProfile.objects.exists()
+
+
+@pytest.mark.django_db
+def test_suggest_is_cached_including_misses(student):
+    """Test that repeated lookups, found or not, are answered from the cache"""
+    client = APIClient()
+    assert client.get("/api/applicants/suggest/", {"email": " STUDENT@test.com"}).data["college"] == "IIT"
+    assert client.get("/api/applicants/suggest/", {"email": "nobody@test.com"}).status_code == 404
+
+    with CaptureQueriesContext(connection) as queries:
+        assert client.get("/api/applicants/suggest/", {"email": "student@test.com"}).data["student_name"] == "Stu"
+        assert client.get("/api/applicants/suggest/", {"email": "nobody@test.com"}).status_code == 404
+    assert len(queries) == 0
+
+
+@pytest.mark.django_db
+def test_suggest_is_throttled_per_ip(student, monkeypatch):
+    """Test the per-IP suggest rate limit"""
+    monkeypatch.setattr(SuggestRateThrottle, "THROTTLE_RATES", {"suggest": "2/min"})
+    client = APIClient()
+    for _ in range(2):
+        assert client.get("/api/applicants/suggest/", {"email": "student@test.com"}).status_code == 200
+    assert client.get("/api/recruiters/suggest/", {"email": "student@test.com"}).status_code == 429
+
+    other_ip = client.get("/api/applicants/suggest/", {"email": "student@test.com"}, REMOTE_ADDR="10.0.0.2")
+    assert other_ip.status_code == 200
@@ -0,0 +1,128 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.dashboards import get_recruiter_dashboard
+from core.models import ApplicantProfile, RecruiterProfile, Internship, Application
+from core.transitions import applications_status_changed
+
+User = get_user_model()
+
+
+def _recruiter(name):
+    user = User.objects.create_user(username=name, email=f"{name}@test.com", role="RECRUITER")
+    return RecruiterProfile.objects.create(user=user, company_name=name.title())
+
+
+@pytest.fixture
+def pipeline(db):
+    recruiter = _recruiter("recruiter")
+    internship = Internship.objects.create(recruiter=recruiter, title="Backend")
+    applications = []
+    for index, current in enumerate(["PENDING", "PENDING", "REVIEWED", "ACCEPTED"]):
+        user = User.objects.create_user(username=f"student{index}", email=f"s{index}@test.com", role="APPLICANT")
+        applications.append(
+            Application.objects.create(internship=internship, applicant=ApplicantProfile.objects.create(user=user), status=current)
+        )
+    other = Internship.objects.create(recruiter=_recruiter("other"), title="Frontend")
+    foreign = Application.objects.create(internship=other, applicant=applications[0].applicant)
+    return recruiter, applications, foreign
+
+
+@pytest.mark.django_db
+def test_bulk_status_updates_owned_applications_in_one_statement(pipeline):
+    """Test outcomes per id, a single UPDATE and one batched event"""
+    recruiter, applications, foreign = pipeline
+    client = APIClient()
+    client.force_authenticate(user=recruiter.user)
+    events = []
+
+    def listener(sender, **kwargs):
+        events.append(kwargs)
+
+    applications_status_changed.connect(listener)
+    try:
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(
+                "/api/applications/bulk-status/",
+                {"application_ids": [app.pk for app in applications] + [foreign.pk, "x"], "status": "ACCEPTED"},
+                format="json",
+            )
+    finally:
+        applications_status_changed.disconnect(listener)
+
+    assert response.status_code == 200
+    assert response.data["updated"] == 3
+    assert [result["status"] for result in response.data["results"]] == [
+        "updated", "updated", "updated", "unchanged", "not_found", "invalid",
+    ]
+    statements = [query["sql"] for query in queries.captured_queries if "core_application" in query["sql"]]
+    assert len(statements) == 2
+    assert statements[1].startswith("UPDATE")
+
+    assert Application.objects.get(pk=foreign.pk).status == "PENDING"
+    assert set(Application.objects.filter(pk__in=[app.pk for app in applications]).values_list("status", flat=True)) == {"ACCEPTED"}
+    assert len(events) == 1
+    assert events[0]["recruiter_id"] == recruiter.pk
+    assert len(events[0]["transitions"]) == 3
+
+
+@pytest.mark.django_db
+def test_bulk_status_rejects_disallowed_transitions_and_refreshes_dashboard(pipeline):
+    """Test that nothing returns to PENDING and the dashboard counts follow the update"""
+    recruiter, applications, _ = pipeline
+    assert get_recruiter_dashboard(recruiter.pk)["totals"]["pending"] == 2
+    client = APIClient()
+    client.force_authenticate(user=recruiter.user)
+
+    response = client.post(
+        "/api/applications/bulk-status/", {"application_ids": [applications[2].pk], "status": "pending"}, format="json"
+    )
+    assert response.data["results"] == [{"application": applications[2].pk, "status": "not_allowed"}]
+
+    client.post(
+        "/api/applications/bulk-status/", {"application_ids": [app.pk for app in applications[:2]], "status": "REVIEWED"}, format="json"
+    )
+    totals = get_recruiter_dashboard(recruiter.pk)["totals"]
+    assert totals["pending"] == 0 and totals["reviewed"] == 3
+
+    assert client.post("/api/applications/bulk-status/", {"application_ids": [1], "status": "HIRED"}, format="json").status_code == 400
+    applicant = APIClient()
+    applicant.force_authenticate(user=applications[0].applicant.user)
+    assert applicant.post(
+        "/api/applications/bulk-status/", {"application_ids": [applications[0].pk], "status": "ACCEPTED"}, format="json"
+    ).status_code == 403
+
+
+@pytest.mark.django_db
+def test_single_patch_uses_the_same_transitions(pipeline):
+    recruiter, applications, _ = pipeline
+    client = APIClient()
+    client.force_authenticate(user=recruiter.user)
+    reviewed = applications[2]
+
+    response = client.patch(f"/api/applications/{reviewed.pk}/", {"status": "PENDING"}, format="json")
+    assert response.status_code == 400
+    assert "REVIEWED" in str(response.data["status"])
+
+    assert client.patch(f"/api/applications/{reviewed.pk}/", {"status": "ACCEPTED"}, format="json").status_code == 200
+    assert Application.objects.get(pk=reviewed.pk).status == "ACCEPTED"
+
+
+@pytest.mark.django_db
+def test_bulk_status_rejects_malformed_input(pipeline):
+    """Test a non-object body and ids that are neither ints nor digit strings"""
+    recruiter, applications, _ = pipeline
+    client = APIClient()
+    client.force_authenticate(user=recruiter.user)
+
+    assert client.post("/api/applications/bulk-status/", [applications[0].pk], format="json").status_code == 400
+
+    response = client.post(
+        "/api/applications/bulk-status/",
+        {"application_ids": [True, 1.9, str(applications[0].pk)], "status": "REVIEWED"},
+        format="json",
+    )
+    assert [result["status"] for result in response.data["results"]] == ["invalid", "invalid", "updated"]
@@ -0,0 +1,9 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SuggestRateThrottle(SimpleRateThrottle):
+    """Per-client-IP limit for the anonymous profile suggest lookups, signed in or not."""
+    scope = 'suggest'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
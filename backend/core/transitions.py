@@ -0,0 +1,67 @@
+"""Bulk application status transitions.
+
+A recruiter triaging a pipeline moves many applications to one status at
+once. The requested rows, their current status and their owner are read in
+one query (locked for the rest of the transaction), the allowed ones are
+moved with a single `UPDATE ... WHERE id IN (...)`, and one
+`applications_status_changed` event describes the whole batch. `update()`
+skips post_save, so listeners of that event (see signals.py) take over what
+the per-row signals do for a single PATCH, such as refreshing the recruiter
+dashboard.
+"""
+from django.db import transaction
+from django.dispatch import Signal
+
+from .models import Application
+
+# Decisions can be reconsidered, but nothing goes back to PENDING.
+ALLOWED_TRANSITIONS = {
+    'PENDING': {'REVIEWED', 'ACCEPTED', 'REJECTED'},
+    'REVIEWED': {'ACCEPTED', 'REJECTED'},
+    'ACCEPTED': {'REVIEWED', 'REJECTED'},
+    'REJECTED': {'REVIEWED', 'ACCEPTED'},
+}
+
+
+def is_allowed_transition(current, new_status):
+    return current == new_status or new_status in ALLOWED_TRANSITIONS.get(current, ())
+
+
+# Sent once per batch with `recruiter_id`, `status` (the new one) and
+# `transitions`, a list of `(application_id, internship_id, old_status)`.
+applications_status_changed = Signal()
+
+
+def transition_applications(recruiter_user, application_ids, new_status):
+    """
+    Move the recruiter's applications to `new_status`.
+
+    Returns `{application_id: outcome}` with `updated`, `unchanged`,
+    `not_allowed` (from the current status) or `not_found` (missing or
+    belonging to another recruiter) for every requested id.
+    """
+    ids = set(application_ids)
+    with transaction.atomic():
+        rows = (
+            Application.objects.select_for_update(of=('self',))
+            .filter(pk__in=ids, internship__recruiter__user=recruiter_user)
+            .values_list('pk', 'internship_id', 'status', 'internship__recruiter_id')
+        )
+        outcomes = dict.fromkeys(ids, 'not_found')
+        transitions = []
+        recruiter_id = None
+        for pk, internship_id, current, recruiter_id in rows:
+            if current == new_status:
+                outcomes[pk] = 'unchanged'
+            elif not is_allowed_transition(current, new_status):
+                outcomes[pk] = 'not_allowed'
+            else:
+                outcomes[pk] = 'updated'
+                transitions.append((pk, internship_id, current))
+
+        if transitions:
+            Application.objects.filter(pk__in=[pk for pk, _, _ in transitions]).update(status=new_status)
+            applications_status_changed.send(
+                sender=Application, recruiter_id=recruiter_id, status=new_status, transitions=transitions
+            )
+    return outcomes
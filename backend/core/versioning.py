@@ -0,0 +1,36 @@
+"""Cache-backed version counters shared by every worker process.
+
+A namespace version is bumped whenever the data behind it changes. Readers
+compare the version they built a local structure against with the current
+one and rebuild when it moved, so invalidation reaches all processes that
+share the cache backend.
+"""
+import time
+
+from django.core.cache import cache
+
+
+def _version_key(namespace):
+    return f'version:{namespace}'
+
+
+def get_version(namespace):
+    """Return the current version for `namespace`, initialising it if missing."""
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        # Seed with a timestamp so an evicted counter never restarts at a
+        # value a reader may still hold.
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace):
+    """Invalidate everything derived from `namespace`."""
+    key = _version_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        return cache.get(key)
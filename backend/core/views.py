@@ -2,9 +2,21 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
-from .models import ApplicantProfile, RecruiterProfile, Internship, Application
-from assessments.models import Skill
-from .serializers import ApplicantProfileSerializer, RecruiterProfileSerializer, InternshipSerializer, ApplicationSerializer
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from urllib.parse import urlencode
+from .models import ApplicantProfile, RecruiterProfile, Internship, Application, InternshipMatch
+from .conditional import ConditionalGetMixin, make_etag, not_modified, set_validators
+from .dashboards import get_recruiter_dashboard, invalidate_recruiter_dashboards
+from .fieldsets import SparseFieldsetViewMixin
+from .pagination import ApplicantCursorPagination, ApplicationCursorPagination, InternshipCursorPagination
+from .response_cache import AnonymousResponseCacheMixin
+from .serializers import ApplicantProfileSerializer, RecruiterProfileSerializer, InternshipSerializer, ApplicationSerializer, InternshipMatchSerializer
+from .suggest import profile_suggestion
+from .throttles import SuggestRateThrottle
+from .transitions import ALLOWED_TRANSITIONS, is_allowed_transition, transition_applications
 from users.models import User
 
 class IsRecruiter(permissions.BasePermission):
@@ -15,14 +27,46 @@ class IsApplicant(permissions.BasePermission):
     def has_permission(self, request, view):
         return request.user.is_authenticated and request.user.role == User.Role.APPLICANT
 
-class ApplicantProfileViewSet(viewsets.ModelViewSet):
+def _strict_id(raw_id):
+    """An int or a digit string as an id; anything else (bools, floats, junk) is None."""
+    if isinstance(raw_id, bool):
+        return None
+    if isinstance(raw_id, int):
+        return raw_id
+    if isinstance(raw_id, str) and raw_id.isascii() and raw_id.isdigit():
+        return int(raw_id)
+    return None
+
+def _suggest_response(request, kind):
+    """Read-only, cached login/signup hint; never creates a profile."""
+    email = (request.query_params.get('email') or '').strip()
+    if not email:
+        return Response({'detail': 'Email query parameter is required.'}, status=status.HTTP_400_BAD_REQUEST)
+    hint = profile_suggestion(kind, email)
+    if hint is None:
+        return Response({'detail': 'Profile not found.'}, status=status.HTTP_404_NOT_FOUND)
+    return Response(hint)
+
+class ApplicantProfileViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     serializer_class = ApplicantProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         if self.request.user.role == User.Role.APPLICANT:
             return ApplicantProfile.objects.filter(user=self.request.user)
-        return ApplicantProfile.objects.all()
+        queryset = ApplicantProfile.objects.select_related('user')
+        skill = (self.request.query_params.get('skill') or '').strip()
+        if skill:
+            from assessments.catalog import resolve_skill_ids
+
+            ids, _ = resolve_skill_ids([skill], create=False)
+            if not ids:
+                return queryset.none()
+            links = {'skill_links__skill_id': next(iter(ids.values()))}
+            if self.request.query_params.get('verified') in ('1', 'true'):
+                links['skill_links__status'] = 'verified'
+            queryset = queryset.filter(**links)
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -31,44 +75,47 @@ class ApplicantProfileViewSet(viewsets.ModelViewSet):
     def me(self, request):
         profile, created = ApplicantProfile.objects.get_or_create(user=request.user)
         if request.method == 'GET':
-            serializer = self.get_serializer(profile)
-            return Response(serializer.data)
+            user = request.user
+            etag = make_etag('applicant-me', profile.pk, profile.updated_at, user.email, user.first_name, user.last_name)
+            response = not_modified(request, etag, profile.updated_at)
+            if response is None:
+                serializer = self.get_serializer(profile)
+                response = Response(serializer.data)
+            return set_validators(response, etag, profile.updated_at)
         elif request.method == 'PATCH':
             serializer = self.get_serializer(profile, data=request.data, partial=True)
             serializer.is_valid(raise_exception=True)
             serializer.save()
             return Response(serializer.data)
 
-    @action(detail=False, methods=['GET'], permission_classes=[permissions.AllowAny], url_path='suggest')
-    def suggest(self, request):
-        email = (request.query_params.get('email') or '').strip()
-        if not email:
-            return Response({'detail': 'Email query parameter is required.'}, status=status.HTTP_400_BAD_REQUEST)
-        try:
-            user = User.objects.get(email__iexact=email)
-        except User.DoesNotExist:
-            return Response({'detail': 'Profile not found.'}, status=status.HTTP_404_NOT_FOUND)
-
-        profile, _ = ApplicantProfile.objects.get_or_create(user=user)
-        return Response(
-            {
-                'role': user.role,
-                'student_name': (user.get_full_name() or user.email),
-                'college': profile.college or '',
-                'degree': profile.degree or '',
-                'major': profile.major or '',
-                'interested_role': profile.interested_role or '',
-            }
+    @action(detail=False, methods=['GET'], permission_classes=[IsApplicant])
+    def matches(self, request):
+        """Internships that were reverse-matched to the current applicant when posted."""
+        matches = (
+            InternshipMatch.objects.filter(applicant__user=request.user)
+            .select_related('internship__recruiter__user')
+            .order_by('-created_at')[:50]
         )
+        return Response(InternshipMatchSerializer(matches, many=True).data)
+
+    @action(
+        detail=False,
+        methods=['GET'],
+        permission_classes=[permissions.AllowAny],
+        throttle_classes=[SuggestRateThrottle],
+        url_path='suggest',
+    )
+    def suggest(self, request):
+        return _suggest_response(request, 'applicant')
 
-class RecruiterProfileViewSet(viewsets.ModelViewSet):
+class RecruiterProfileViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     serializer_class = RecruiterProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         if self.request.user.role == User.Role.RECRUITER:
             return RecruiterProfile.objects.filter(user=self.request.user)
-        return RecruiterProfile.objects.all()
+        return RecruiterProfile.objects.select_related('user').annotate(internship_count=Count('internships'))
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -79,85 +126,156 @@ class RecruiterProfileViewSet(viewsets.ModelViewSet):
             return Response({'detail': 'Cannot verify yourself'}, status=status.HTTP_403_FORBIDDEN)
         return super().update(request, *args, **kwargs)
 
-    @action(detail=False, methods=['GET'], permission_classes=[permissions.AllowAny], url_path='suggest')
+    @action(
+        detail=False,
+        methods=['GET'],
+        permission_classes=[permissions.AllowAny],
+        throttle_classes=[SuggestRateThrottle],
+        url_path='suggest',
+    )
     def suggest(self, request):
-        email = (request.query_params.get('email') or '').strip()
-        if not email:
-            return Response({'detail': 'Email query parameter is required.'}, status=status.HTTP_400_BAD_REQUEST)
-        try:
-            user = User.objects.get(email__iexact=email)
-        except User.DoesNotExist:
-            return Response({'detail': 'Profile not found.'}, status=status.HTTP_404_NOT_FOUND)
+        return _suggest_response(request, 'recruiter')
 
-        profile, _ = RecruiterProfile.objects.get_or_create(
-            user=user,
-            defaults={'company_name': user.first_name or user.email, 'company_website': ''},
-        )
-        return Response(
-            {
-                'role': user.role,
-                'company_name': profile.company_name or '',
-                'company_website': profile.company_website or '',
-                'is_verified': profile.is_verified,
-            }
-        )
+    @action(detail=False, methods=['GET'], permission_classes=[IsRecruiter])
+    def dashboard(self, request):
+        """Per-listing application counts by status, average VSPS and latest application."""
+        try:
+            recruiter_profile = request.user.recruiter_profile
+        except RecruiterProfile.DoesNotExist:
+            return Response({"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(get_recruiter_dashboard(recruiter_profile.pk))
 
     @action(detail=False, methods=['GET', 'PATCH'])
     def me(self, request):
         profile, created = RecruiterProfile.objects.get_or_create(user=request.user)
         if request.method == 'GET':
-            serializer = self.get_serializer(profile)
-            return Response(serializer.data)
+            etag = make_etag('recruiter-me', profile.pk, profile.updated_at, request.user.email)
+            response = not_modified(request, etag, profile.updated_at)
+            if response is None:
+                serializer = self.get_serializer(profile)
+                response = Response(serializer.data)
+            return set_validators(response, etag, profile.updated_at)
         elif request.method == 'PATCH':
             serializer = self.get_serializer(profile, data=request.data, partial=True)
             serializer.is_valid(raise_exception=True)
             serializer.save()
             return Response(serializer.data)
 
-class InternshipViewSet(viewsets.ModelViewSet):
-    queryset = Internship.objects.all()
+class InternshipViewSet(AnonymousResponseCacheMixin, ConditionalGetMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
+    # InternshipSerializer reads recruiter.company_name and recruiter.user.*
+    queryset = Internship.objects.select_related('recruiter__user')
     serializer_class = InternshipSerializer
+    pagination_class = InternshipCursorPagination
+    conditional_timestamp_fields = ('updated_at', 'recruiter__updated_at')
+    BULK_APPLY_LIMIT = 50
     
     def get_permissions(self):
         # allow anonymous access to list and retrieve
-        if self.action in ['create', 'update', 'partial_update', 'destroy', 'applicants']:
+        if self.action in ['create', 'update', 'partial_update', 'destroy', 'applicants', 'export_applicants', 'bulk_ingest']:
             return [IsRecruiter()]
-        if self.action in ['list', 'retrieve', 'recommendations']:
+        if self.action in ['list', 'retrieve', 'search', 'facets', 'index_artifact']:
             from rest_framework.permissions import AllowAny
             return [AllowAny()]
         return [permissions.IsAuthenticated()]
 
-    def perform_create(self, serializer):
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = self._apply_lookup_filters(queryset, self.request.query_params)
+            queryset = self._apply_facet_filters(queryset, self.request.query_params)
+        return queryset
+
+    def _apply_lookup_filters(self, queryset, params):
+        """`?recruiter=<id>` (one recruiter's listings) and `?ids=1,2` (the listings a page of applications points at)."""
+        recruiter = params.get('recruiter')
+        if recruiter:
+            if _strict_id(recruiter) is None:
+                raise ValidationError({'recruiter': 'Must be a recruiter id.'})
+            queryset = queryset.filter(recruiter_id=int(recruiter))
+        raw_ids = [value.strip() for value in (params.get('ids') or '').split(',') if value.strip()]
+        if raw_ids:
+            ids = {_strict_id(value) for value in raw_ids}
+            if None in ids:
+                raise ValidationError({'ids': 'Must be a comma-separated list of internship ids.'})
+            if len(ids) > self.pagination_class.max_page_size:
+                raise ValidationError({'ids': f'At most {self.pagination_class.max_page_size} ids per request.'})
+            queryset = queryset.filter(pk__in=ids)
+        return queryset
+
+    def _apply_facet_filters(self, queryset, params):
+        """Filters matching the facet counts; each is backed by a composite index."""
+        from .facets import stipend_bucket_range
+
+        for field in ('location', 'work_type', 'status'):
+            value = params.get(field)
+            if value:
+                queryset = queryset.filter(**{field: value})
+        bucket = params.get('stipend')
+        if bucket == 'unspecified':
+            queryset = queryset.filter(stipend__isnull=True)
+        elif bucket:
+            bounds = stipend_bucket_range(bucket)
+            if bounds is None:
+                raise ValidationError({'stipend': 'Unknown stipend bucket.'})
+            lower, upper = bounds
+            if lower is not None:
+                queryset = queryset.filter(stipend__gte=lower)
+            if upper is not None:
+                queryset = queryset.filter(stipend__lte=upper)
+        skill = (params.get('skill') or '').strip()
+        if skill:
+            from assessments.catalog import resolve_skill_ids
+
+            ids, _ = resolve_skill_ids([skill], create=False)
+            if not ids:
+                return queryset.none()
+            # Indexed join through InternshipSkill rather than a JSON text scan.
+            queryset = queryset.filter(
+                skill_links__skill_id=next(iter(ids.values())), skill_links__kind='required'
+            )
+        return queryset
+
+    def _resolve_recruiter(self):
         user = self.request.user
         if user.role == User.Role.ADMIN:
             recruiter_id = self.request.data.get('recruiter_id')
             if not recruiter_id:
                 raise ValidationError({'recruiter_id': 'This field is required for admin-created listings.'})
             try:
-                recruiter_profile = RecruiterProfile.objects.get(pk=recruiter_id)
+                return RecruiterProfile.objects.get(pk=recruiter_id)
             except RecruiterProfile.DoesNotExist:
                 raise ValidationError({'recruiter_id': 'Recruiter not found.'})
-        else:
-            recruiter_profile = RecruiterProfile.objects.get(user=user)
-        instance = serializer.save(recruiter=recruiter_profile)
-        self._sync_skill_catalog(instance.required_skills)
-        return instance
+        return RecruiterProfile.objects.get(user=user)
 
-    def perform_update(self, serializer):
-        instance = serializer.save()
-        self._sync_skill_catalog(instance.required_skills)
-
-    def _sync_skill_catalog(self, skills):
-        if not skills:
-            return
-        for skill in skills:
-            label = ''
-            if isinstance(skill, str):
-                label = skill.strip()
-            elif isinstance(skill, dict):
-                label = (skill.get('name') or '').strip()
-            if label:
-                Skill.objects.get_or_create(name=label)
+    def perform_create(self, serializer):
+        recruiter_profile = self._resolve_recruiter()
+        # New skills reach the catalog through the InternshipSkill dual-write signal.
+        return serializer.save(recruiter=recruiter_profile)
+
+    @action(detail=False, methods=['POST'], url_path='bulk')
+    def bulk_ingest(self, request):
+        """
+        Import many listings from an uploaded CSV or JSONL file.
+
+        Valid rows are created even when others fail; the response reports
+        every rejected line with its validation errors.
+        """
+        from .ingest import FORMATS, detect_format, ingest_internships, text_stream
+
+        file = request.FILES.get('file')
+        if not file:
+            return Response({"detail": "No file uploaded."}, status=status.HTTP_400_BAD_REQUEST)
+        fmt = request.data.get('format') or detect_format(file.name)
+        if fmt not in FORMATS:
+            return Response(
+                {"detail": f"Unsupported format. Use one of: {', '.join(FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        recruiter_profile = self._resolve_recruiter()
+        report = ingest_internships(text_stream(file.file), fmt, recruiter_profile)
+        response_status = status.HTTP_201_CREATED if report['created'] else status.HTTP_400_BAD_REQUEST
+        return Response(report, status=response_status)
 
     @action(detail=True, methods=['POST'])
     def apply(self, request, pk=None):
@@ -172,66 +290,182 @@ class InternshipViewSet(viewsets.ModelViewSet):
         except ApplicantProfile.DoesNotExist:
             return Response({"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
             
-        if Application.objects.filter(internship=internship, applicant=profile).exists():
+        # Rely on unique_together instead of a racy exists() check.
+        try:
+            with transaction.atomic():
+                application = Application.objects.create(internship=internship, applicant=profile)
+        except IntegrityError:
             return Response({"error": "Already applied"}, status=status.HTTP_400_BAD_REQUEST)
-            
-        application = Application.objects.create(internship=internship, applicant=profile)
         return Response(ApplicationSerializer(application).data, status=status.HTTP_201_CREATED)
 
-    @action(detail=True, methods=['GET'])
-    def applicants(self, request, pk=None):
+    @action(detail=False, methods=['POST'], url_path='apply-bulk')
+    def apply_bulk(self, request):
+        """
+        Apply to several internships at once.
+
+        Body: `{"internship_ids": [...]}`. Every id gets an outcome:
+        `applied`, `already_applied`, `not_found` or `invalid`.
+        """
+        user = request.user
+        if user.role != User.Role.APPLICANT:
+            return Response({"error": "Only applicants can apply"}, status=status.HTTP_403_FORBIDDEN)
+
+        raw_ids = request.data.get('internship_ids')
+        if not isinstance(raw_ids, list) or not raw_ids:
+            return Response({"internship_ids": "Provide a non-empty list of internship ids."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(raw_ids) > self.BULK_APPLY_LIMIT:
+            return Response(
+                {"internship_ids": f"At most {self.BULK_APPLY_LIMIT} internships per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            profile = user.applicant_profile
+        except ApplicantProfile.DoesNotExist:
+            return Response({"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        requested = [(raw_id, _strict_id(raw_id)) for raw_id in raw_ids]
+        ids = {pk for _, pk in requested if pk is not None}
+
+        with transaction.atomic():
+            recruiters = dict(Internship.objects.filter(pk__in=ids).values_list('pk', 'recruiter_id'))
+            existing = set(recruiters)
+            already = set(
+                Application.objects.filter(applicant=profile, internship_id__in=existing).values_list('internship_id', flat=True)
+            )
+            Application.objects.bulk_create(
+                [Application(internship_id=pk, applicant=profile) for pk in existing - already],
+                ignore_conflicts=True,
+            )
+            application_ids = dict(
+                Application.objects.filter(applicant=profile, internship_id__in=existing).values_list('internship_id', 'pk')
+            )
+            # bulk_create skips post_save, so refresh the affected dashboards here.
+            invalidate_recruiter_dashboards(recruiters[pk] for pk in existing - already)
+
+        results = []
+        for raw_id, pk in requested:
+            if pk is None:
+                results.append({"internship": raw_id, "status": "invalid"})
+            elif pk not in existing:
+                results.append({"internship": pk, "status": "not_found"})
+            else:
+                results.append({
+                    "internship": pk,
+                    "status": "already_applied" if pk in already else "applied",
+                    "application": application_ids.get(pk),
+                })
+        applied = sum(1 for result in results if result["status"] == "applied")
+        return Response(
+            {"applied": applied, "results": results},
+            status=status.HTTP_201_CREATED if applied else status.HTTP_200_OK,
+        )
+
+    def _owned_internship(self, request):
+        """Return `(internship, None)` for the requesting recruiter's listing, else `(None, error response)`."""
         internship = self.get_object()
-        
         try:
             recruiter_profile = request.user.recruiter_profile
-            if internship.recruiter != recruiter_profile:
-                return Response({"error": "Not authorized"}, status=status.HTTP_403_FORBIDDEN)
+            if internship.recruiter_id != recruiter_profile.pk:
+                return None, Response({"error": "Not authorized"}, status=status.HTTP_403_FORBIDDEN)
         except RecruiterProfile.DoesNotExist:
-            return Response({"error": "Profile not found"}, status=status.HTTP_403_FORBIDDEN)
-            
-        applications = Application.objects.filter(internship=internship).order_by('-applicant__vsps_score')
-        serializer = ApplicationSerializer(applications, many=True)
-        return Response(serializer.data)
+            return None, Response({"error": "Profile not found"}, status=status.HTTP_403_FORBIDDEN)
+        return internship, None
 
-class IsAdminPermission(permissions.BasePermission):
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and getattr(request.user, 'role', None) == User.Role.ADMIN
+    @action(detail=True, methods=['GET'])
+    def applicants(self, request, pk=None):
+        """Applications to this listing, best VSPS first, cursor-paginated."""
+        internship, error = self._owned_internship(request)
+        if error:
+            return error
+
+        applications = (
+            Application.objects.filter(internship=internship)
+            .select_related('applicant__user')
+            .annotate(vsps_rank=F('applicant__vsps_score'))
+        )
+        paginator = ApplicantCursorPagination()
+        page = paginator.paginate_queryset(applications, request, view=self)
+        serializer = ApplicationSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=['GET'], url_path='applicants/export')
+    def export_applicants(self, request, pk=None):
+        """
+        Stream every applicant as CSV (default) or JSONL (`?file_format=jsonl`).
+        """
+        from .exports import EXPORT_FORMATS, stream_applicants
+
+        export_format = request.query_params.get('file_format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {"file_format": f"Use one of: {', '.join(EXPORT_FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        internship, error = self._owned_internship(request)
+        if error:
+            return error
+        return stream_applicants(internship, export_format)
 
+    @action(detail=False, methods=['GET'])
+    def facets(self, request):
+        """Listing counts per location, work type, status, stipend bucket and skill."""
+        from .facets import get_facet_counts
+        return Response(get_facet_counts())
 
-class PlatformSettingsViewSet(viewsets.ViewSet):
-    permission_classes = [IsAdminPermission]
+    @action(detail=False, methods=['GET'])
+    def search(self, request):
+        """Ranked full-text search with highlighted title/description fragments."""
+        from .search import search_internships
 
-    @action(detail=False, methods=['GET'], url_path='settings')
-    def get_settings(self, request):
-        """Get current platform settings"""
-        from .models import PlatformSettings
-        settings = PlatformSettings.get_settings()
-        return Response({
-            'enforce_2fa_for_admins_recruiters': settings.enforce_2fa_for_admins_recruiters,
-            'auto_approve_verified_recruiters': settings.auto_approve_verified_recruiters
-        })
+        query = (request.query_params.get('q') or '').strip()
+        if not query:
+            return Response({'detail': 'The q query parameter is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            page = max(1, int(request.query_params.get('page', 1)))
+            page_size = max(1, min(int(request.query_params.get('page_size', 20)), 100))
+        except (TypeError, ValueError):
+            return Response({'detail': 'page and page_size must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Fetch one extra hit to know whether there is a next page without counting.
+        hits = search_internships(query, limit=page_size + 1, offset=(page - 1) * page_size)
+        has_next = len(hits) > page_size
+        hits = hits[:page_size]
+
+        internships = self.get_queryset().in_bulk([hit['id'] for hit in hits])
+        results = []
+        for hit in hits:
+            internship = internships.get(hit['id'])
+            if internship is None:
+                continue
+            data = self.get_serializer(internship).data
+            data['search'] = {'rank': hit['rank'], 'highlights': hit['highlights']}
+            results.append(data)
+
+        def page_url(number):
+            return request.build_absolute_uri(
+                f"{request.path}?{urlencode({'q': query, 'page': number, 'page_size': page_size})}"
+            )
 
-    @action(detail=False, methods=['PATCH'])
-    def update_settings(self, request):
-        """Update platform settings"""
-        from .models import PlatformSettings
-        settings = PlatformSettings.get_settings()
-        
-        enforce_2fa = request.data.get('enforce_2fa_for_admins_recruiters')
-        auto_approve = request.data.get('auto_approve_verified_recruiters')
-        
-        if enforce_2fa is not None:
-            settings.enforce_2fa_for_admins_recruiters = enforce_2fa
-        if auto_approve is not None:
-            settings.auto_approve_verified_recruiters = auto_approve
-            
-        settings.save()
-        
         return Response({
-            'enforce_2fa_for_admins_recruiters': settings.enforce_2fa_for_admins_recruiters,
-            'auto_approve_verified_recruiters': settings.auto_approve_verified_recruiters
+            'next': page_url(page + 1) if has_next else None,
+            'previous': page_url(page - 1) if page > 1 else None,
+            'results': results,
         })
 
+    @action(detail=False, methods=['GET'], url_path='index-artifact')
+    def index_artifact(self, request):
+        """Precomputed IDF table and delta-encoded sparse internship vectors."""
+        from .artifacts import get_internship_index_artifact
+
+        etag, body = get_internship_index_artifact()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
+
     @action(detail=False, methods=['GET'])
     def recommendations(self, request):
         user = request.user
@@ -243,43 +477,22 @@ class PlatformSettingsViewSet(viewsets.ViewSet):
         except ApplicantProfile.DoesNotExist:
             return Response({"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        from ml_engine.recommender import RecommendationEngine, CandidateProfile, MicroAssessment, Internship as MLInternship
-        
-        skills_list = []
-        for s in profile.skills:
-            if isinstance(s, dict):
-                skills_list.append(s.get('name', ''))
-            else:
-                skills_list.append(str(s))
-        
-        candidate = CandidateProfile(
-            id=user.id,
-            skills=skills_list,
-            micro_assessment=MicroAssessment(
-                accuracy=profile.assessment_accuracy,
-                speed_score=profile.assessment_speed_score,
-                skip_penalty=profile.assessment_skip_penalty
-            ),
-            recency_score=profile.recency_score
-        )
+        from .matching import candidate_from_profile, internship_to_ml
+        from .models import PlatformSettings
+        from .shadow import get_shadow_scorer
+
+        candidate = candidate_from_profile(profile)
+        platform_settings = PlatformSettings.get_settings()
 
-        db_internships = Internship.objects.all()
+        db_internships = Internship.objects.select_related('recruiter__user')
         ml_internships = []
         internship_map = {}
 
         for i in db_internships:
-            ml_i = MLInternship(
-                id=i.id,
-                title=i.title,
-                description=i.description,
-                recruiter_rating=i.recruiter_rating,
-                recency_score=i.recency_score
-            )
-            ml_internships.append(ml_i)
+            ml_internships.append(internship_to_ml(i, platform_settings))
             internship_map[i.id] = i
 
-        engine = RecommendationEngine()
-        results = engine.recommend(candidate, ml_internships)
+        results = get_shadow_scorer().recommend(candidate, ml_internships)
 
         response_data = []
         for res in results:
@@ -298,30 +511,150 @@ class PlatformSettingsViewSet(viewsets.ViewSet):
         
         return Response(response_data)
 
+class IsAdminPermission(permissions.BasePermission):
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and getattr(request.user, 'role', None) == User.Role.ADMIN
+
 
-class ApplicationViewSet(viewsets.ModelViewSet):
+class PlatformSettingsViewSet(viewsets.ViewSet):
+    permission_classes = [IsAdminPermission]
+
+    @action(detail=False, methods=['GET'], url_path='settings')
+    def get_settings(self, request):
+        """Get current platform settings"""
+        from .models import PlatformSettings
+        settings = PlatformSettings.get_settings()
+        return Response({
+            'enforce_2fa_for_admins_recruiters': settings.enforce_2fa_for_admins_recruiters,
+            'auto_approve_verified_recruiters': settings.auto_approve_verified_recruiters
+        })
+
+    @action(detail=False, methods=['PATCH'])
+    def update_settings(self, request):
+        """Update platform settings"""
+        from .models import PlatformSettings
+        settings = PlatformSettings.get_settings()
+        
+        enforce_2fa = request.data.get('enforce_2fa_for_admins_recruiters')
+        auto_approve = request.data.get('auto_approve_verified_recruiters')
+        
+        if enforce_2fa is not None:
+            settings.enforce_2fa_for_admins_recruiters = enforce_2fa
+        if auto_approve is not None:
+            settings.auto_approve_verified_recruiters = auto_approve
+            
+        settings.save()
+        
+        return Response({
+            'enforce_2fa_for_admins_recruiters': settings.enforce_2fa_for_admins_recruiters,
+            'auto_approve_verified_recruiters': settings.auto_approve_verified_recruiters
+        })
+
+    @action(detail=False, methods=['GET'], url_path='shadow-report')
+    def shadow_report(self, request):
+        """Latency and ranking overlap of the shadowed recommendation engine (this process)."""
+        from .shadow import get_shadow_scorer
+        return Response(get_shadow_scorer().summary())
+
+    @action(detail=False, methods=['GET'])
+    def analytics(self, request):
+        """Platform-wide figures from the rollup table (see `refresh_analytics`)."""
+        from .analytics import get_platform_analytics
+        try:
+            days = min(max(int(request.query_params.get('days', 30)), 1), 365)
+        except ValueError:
+            return Response({'days': 'Must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(get_platform_analytics(days=days))
+
+    @action(detail=False, methods=['GET'], url_path='cache-stats')
+    def cache_stats(self, request):
+        """Hit/miss counters of the anonymous internship response cache."""
+        from .response_cache import response_cache_stats
+        return Response(response_cache_stats())
+
+
+class ApplicationViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     serializer_class = ApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ApplicationCursorPagination
+    BULK_STATUS_LIMIT = 500
+    # Exactly what ApplicationSerializer reads, in one join for every role
+    # (narrowed further for ?fields= / ?view=compact).
+    list_fields = (
+        'id', 'internship_id', 'applicant_id', 'status', 'applied_at',
+        'applicant__id', 'applicant__vsps_score',
+        'applicant__user__id', 'applicant__user__first_name', 'applicant__user__last_name', 'applicant__user__email',
+    )
 
     def get_queryset(self):
         user = self.request.user
+        queryset = Application.objects.select_related('applicant__user').only(*self.list_fields)
+        # Filter through the user rather than loading their profile first.
         if user.role == User.Role.APPLICANT:
-            try:
-                return Application.objects.filter(applicant=user.applicant_profile)
-            except ApplicantProfile.DoesNotExist:
-                return Application.objects.none()
+            queryset = queryset.filter(applicant__user=user)
         elif user.role == User.Role.RECRUITER:
-            try:
-                return Application.objects.filter(internship__recruiter=user.recruiter_profile)
-            except RecruiterProfile.DoesNotExist:
-                return Application.objects.none()
-        elif user.role == User.Role.ADMIN:
-            return Application.objects.select_related('internship', 'applicant').all()
-        return Application.objects.none()
+            queryset = queryset.filter(internship__recruiter__user=user)
+        elif user.role != User.Role.ADMIN:
+            return Application.objects.none()
+        return self._apply_filters(queryset)
+
+    def _apply_filters(self, queryset):
+        """`?status=PENDING,REVIEWED` and `?internship=<id>`, served by the (internship, status) index."""
+        params = self.request.query_params
+        statuses = [value.strip().upper() for value in (params.get('status') or '').split(',') if value.strip()]
+        if statuses:
+            valid = {choice for choice, _ in Application.STATUS_CHOICES}
+            unknown = sorted(set(statuses) - valid)
+            if unknown:
+                raise ValidationError({'status': f'Unknown status: {", ".join(unknown)}.'})
+            queryset = queryset.filter(status__in=statuses)
+        internship = params.get('internship')
+        if internship:
+            if not internship.isdigit():
+                raise ValidationError({'internship': 'Must be an internship id.'})
+            queryset = queryset.filter(internship_id=int(internship))
+        return queryset
+
+    @action(detail=False, methods=['POST'], url_path='bulk-status', permission_classes=[IsRecruiter])
+    def bulk_status(self, request):
+        """
+        Move many of the recruiter's applications to one status.
+
+        Body: `{"application_ids": [...], "status": "REJECTED"}`. Every id gets
+        an outcome: `updated`, `unchanged`, `not_allowed`, `not_found` or `invalid`.
+        """
+        if not isinstance(request.data, dict):
+            return Response({"detail": "Expected a JSON object."}, status=status.HTTP_400_BAD_REQUEST)
+        new_status = str(request.data.get('status') or '').upper()
+        if new_status not in {choice for choice, _ in Application.STATUS_CHOICES}:
+            return Response({"status": "Unknown status."}, status=status.HTTP_400_BAD_REQUEST)
+        raw_ids = request.data.get('application_ids')
+        if not isinstance(raw_ids, list) or not raw_ids:
+            return Response({"application_ids": "Provide a non-empty list of application ids."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(raw_ids) > self.BULK_STATUS_LIMIT:
+            return Response(
+                {"application_ids": f"At most {self.BULK_STATUS_LIMIT} applications per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        requested = [(raw_id, _strict_id(raw_id)) for raw_id in raw_ids]
+        outcomes = transition_applications(request.user, {pk for _, pk in requested if pk is not None}, new_status)
+
+        results = [
+            {"application": raw_id, "status": "invalid"} if pk is None else {"application": pk, "status": outcomes[pk]}
+            for raw_id, pk in requested
+        ]
+        updated = sum(1 for outcome in outcomes.values() if outcome == 'updated')
+        return Response({"updated": updated, "results": results})
 
     def perform_update(self, serializer):
         # only recruiters can change status
         if self.request.user.role == User.Role.RECRUITER:
+            current = serializer.instance.status
+            new_status = serializer.validated_data.get('status', current)
+            if not is_allowed_transition(current, new_status):
+                allowed = ', '.join(sorted(ALLOWED_TRANSITIONS.get(current, ()))) or 'none'
+                raise ValidationError({'status': f'Cannot move from {current} to {new_status} (allowed: {allowed}).'})
             serializer.save()
         else:
             from rest_framework.exceptions import PermissionDenied
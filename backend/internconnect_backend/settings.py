@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import json
 import os
 from pathlib import Path
 from urllib.parse import urlparse
@@ -57,9 +58,11 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # Added CORS
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Serve static files in container
+    'core.compression.CompressionMiddleware',  # brotli/gzip above RESPONSE_COMPRESSION_MIN_BYTES
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
+    'core.db_routing.ReplicaPinningMiddleware',  # before anything that queries the database
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -99,13 +102,75 @@ if os.getenv('DB_HOST'):
             'PORT': os.getenv('DB_PORT', '5432'),
         }
     }
+    # Streaming replicas of the primary, e.g. DB_REPLICA_HOSTS=replica-0,replica-1
+    for index, host in enumerate(filter(None, (h.strip() for h in os.getenv('DB_REPLICA_HOSTS', '').split(',')))):
+        DATABASES[f'replica_{index}'] = {**DATABASES['default'], 'HOST': host, 'TEST': {'MIRROR': 'default'}}
 else:
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+        },
+        # A second SQLite file standing in for a replica (only used when
+        # DB_SQLITE_REPLICA is set, and by the router tests).
+        'replica': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.getenv('DB_SQLITE_REPLICA') or BASE_DIR / 'db.replica.sqlite3',
+        },
+    }
+
+# Read-replica routing (core.db_routing): safe reads go to these aliases
+# unless the request or the client's recent writes pin them to `default`.
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith('replica_')]
+if os.getenv('DB_SQLITE_REPLICA') and 'replica' in DATABASES:
+    DATABASE_REPLICAS = ['replica']
+DATABASE_ROUTERS = ['core.db_routing.ReplicaRouter']
+DATABASE_REPLICA_PIN_COOKIE = 'db_primary_pin'
+# Longer than the expected replication lag.
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv('DATABASE_REPLICA_PIN_SECONDS', '15'))
+
+# Cache
+# Shared Redis when REDIS_URL is set (Docker/Kubernetes), otherwise
+# per-process local memory for local development.
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
         }
     }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds an anonymous internship list/detail response stays cached; saves
+# invalidate entries earlier through signals.
+RESPONSE_CACHE_TIMEOUT = int(os.getenv('RESPONSE_CACHE_TIMEOUT', '300'))
+
+# Seconds a recruiter dashboard aggregate stays cached; application and
+# internship changes invalidate it earlier, applicant VSPS changes do not.
+RECRUITER_DASHBOARD_CACHE_TIMEOUT = int(os.getenv('RECRUITER_DASHBOARD_CACHE_TIMEOUT', '300'))
+
+# Seconds the facet counts stay cached per version; changes bump the version
+# earlier, the timeout only keeps superseded versions from piling up.
+FACET_COUNTS_CACHE_TIMEOUT = int(os.getenv('FACET_COUNTS_CACHE_TIMEOUT', '3600'))
+
+# Seconds the shared copy of the PlatformSettings row stays cached per version.
+PLATFORM_SETTINGS_CACHE_TIMEOUT = int(os.getenv('PLATFORM_SETTINGS_CACHE_TIMEOUT', '3600'))
+
+# Seconds a login/signup profile hint (or "no such user") stays cached.
+PROFILE_SUGGEST_CACHE_TIMEOUT = int(os.getenv('PROFILE_SUGGEST_CACHE_TIMEOUT', '60'))
+
+# Applicant recency_score halves every this many days without activity
+# (recomputed by `manage.py recompute_scores`).
+RECENCY_HALF_LIFE_DAYS = float(os.getenv('RECENCY_HALF_LIFE_DAYS', '30'))
+
+# Responses at least this large are brotli/gzip-compressed (core.compression).
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', '1024'))
+RESPONSE_COMPRESSION_BROTLI_QUALITY = int(os.getenv('RESPONSE_COMPRESSION_BROTLI_QUALITY', '5'))
 
 
 # Password validation
@@ -159,7 +224,16 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
-    ]
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        # orjson when installed, DRF's stdlib JSON otherwise
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        # Login/signup email autocomplete (core.throttles.SuggestRateThrottle)
+        'suggest': os.getenv('PROFILE_SUGGEST_RATE', '60/min'),
+    },
 }
 
 from datetime import timedelta
@@ -205,3 +279,23 @@ GITHUB_REDIRECT_URI = os.getenv('GITHUB_REDIRECT_URI', 'http://localhost:8000/au
 
 RECAPTCHA_SITE_KEY = os.getenv('RECAPTCHA_SITE_KEY', '6LdJKvgrAAAAALtqDBLwM9NndI1qPBXOaPLSd6_w')
 RECAPTCHA_SECRET_KEY = os.getenv('RECAPTCHA_SECRET_KEY', '6LdJKvgrAAAAAG-W-6tpzKFbTOGaZJjCjlWLQl4t')
+
+# Reverse matching of newly posted internships against stored applicants
+INTERNSHIP_MATCH_MIN_SIMILARITY = float(os.getenv('INTERNSHIP_MATCH_MIN_SIMILARITY', '0.2'))
+INTERNSHIP_MATCH_LIMIT = int(os.getenv('INTERNSHIP_MATCH_LIMIT', '500'))
+INTERNSHIP_MATCH_ASYNC = os.getenv('INTERNSHIP_MATCH_ASYNC', 'True').lower() in ('1', 'true', 'yes')
+
+# Question generation for skills created in bulk (ingest, catalog sync) runs
+# after commit, off the request thread unless disabled.
+SKILL_QUESTION_GENERATION_ASYNC = os.getenv('SKILL_QUESTION_GENERATION_ASYNC', 'True').lower() in ('1', 'true', 'yes')
+
+# Internship bulk ingest: rows validated and inserted per chunk
+INTERNSHIP_INGEST_CHUNK_SIZE = int(os.getenv('INTERNSHIP_INGEST_CHUNK_SIZE', '500'))
+
+# Shadow scoring: run a candidate engine configuration next to production on a
+# sampled share of recommendation requests (ENGINE: confidence_factor, vectorizer)
+RECOMMENDER_SHADOW = {
+    'SAMPLE_RATE': float(os.getenv('RECOMMENDER_SHADOW_SAMPLE_RATE', '0')),
+    'TOP_K': int(os.getenv('RECOMMENDER_SHADOW_TOP_K', '10')),
+    'ENGINE': json.loads(os.getenv('RECOMMENDER_SHADOW_ENGINE', '{}')),
+}
@@ -55,6 +55,27 @@ class MicroAssessment:
     return _clamp(raw_vsps)
 
 
+def vsps_scores(accuracy: np.ndarray, speed_score: np.ndarray, skip_penalty: np.ndarray) -> np.ndarray:
+  """
+  Vectorized `MicroAssessment.vsps` over arrays of micro-assessment scores.
+  """
+  raw_vsps = (
+    0.6 * np.clip(accuracy, 0.0, 1.0)
+    + 0.3 * np.clip(speed_score, 0.0, 1.0)
+    - 0.1 * np.clip(skip_penalty, 0.0, 1.0)
+  )
+  return np.clip(raw_vsps, 0.0, 1.0)
+
+
+def decayed_recency(age_days: np.ndarray, half_life_days: float) -> np.ndarray:
+  """
+  Exponential recency decay: 1.0 for activity now, 0.5 after `half_life_days`.
+
+  Negative ages (clock skew) count as now.
+  """
+  return np.exp2(-np.maximum(age_days, 0.0) / half_life_days)
+
+
 @dataclass
 class CandidateProfile:
   """
@@ -150,8 +171,14 @@ class RecommendationEngine:
   - Combines cosine similarity, VSPS and TrustScore into a final score.
   """
 
-  def __init__(self, trust_calculator: Optional[TrustCalculator] = None) -> None:
-    self.vectorizer = TfidfVectorizer()
+  def __init__(
+    self,
+    trust_calculator: Optional[TrustCalculator] = None,
+    vectorizer_options: Optional[Dict[str, Any]] = None,
+  ) -> None:
+    # vectorizer_options lets alternative configurations (e.g. sublinear_tf,
+    # ngram_range) be evaluated without changing the production defaults.
+    self.vectorizer = TfidfVectorizer(**(vectorizer_options or {}))
     self.trust_calculator = trust_calculator or TrustCalculator()
 
   def _build_tfidf(
@@ -238,6 +265,164 @@ class RecommendationEngine:
     return recommendations
 
 
+class CandidateIndex:
+  """
+  Reverse (percolator-style) index over stored candidate profiles.
+
+  The candidate skill texts are vectorized once into a sparse TF-IDF matrix.
+  Matching a new internship then costs a single sparse matrix-vector product
+  instead of one `RecommendationEngine.recommend` call per candidate.
+
+  Rows are L2-normalized by the vectorizer, so the product is the cosine
+  similarity over the candidate vocabulary.
+  """
+
+  def __init__(self, trust_calculator: Optional[TrustCalculator] = None) -> None:
+    self.vectorizer = TfidfVectorizer()
+    self.trust_calculator = trust_calculator or TrustCalculator()
+    self.candidates: List[CandidateProfile] = []
+    self.matrix = None
+    self._vsps = np.zeros(0)
+    self._accuracy = np.zeros(0)
+    self._recency = np.zeros(0)
+
+  def fit(self, candidates: List[CandidateProfile]) -> "CandidateIndex":
+    """
+    Build the candidate matrix and the per-candidate score vectors.
+    """
+    self.candidates = list(candidates)
+    documents = [candidate.skills_as_text() for candidate in self.candidates]
+
+    if documents and any(document.strip() for document in documents):
+      try:
+        self.matrix = self.vectorizer.fit_transform(documents)
+      except ValueError:
+        # Every document was stop words / single characters.
+        self.matrix = None
+    else:
+      self.matrix = None
+
+    self._vsps = np.array([c.micro_assessment.vsps() for c in self.candidates], dtype=float)
+    self._accuracy = np.clip(
+      np.array([c.micro_assessment.accuracy for c in self.candidates], dtype=float), 0.0, 1.0
+    )
+    self._recency = np.array([c.normalized_recency() for c in self.candidates], dtype=float)
+    return self
+
+  def _trust_scores(self, recruiter_rating: Optional[float]) -> np.ndarray:
+    """
+    Vectorized equivalent of `TrustCalculator.compute_trust` for every candidate.
+    """
+    if recruiter_rating is not None:
+      adjusted_rr = _clamp(_clamp(recruiter_rating) * self.trust_calculator.confidence_factor)
+      trust = 0.4 * self._accuracy + 0.4 * adjusted_rr + 0.2 * self._recency
+    else:
+      trust = 0.7 * self._accuracy + 0.3 * self._recency
+    return np.clip(trust, 0.0, 1.0)
+
+  def match(
+    self,
+    internship: Internship,
+    min_similarity: float = 0.0,
+    top_k: Optional[int] = None,
+  ) -> List[Dict[str, Any]]:
+    """
+    Score one internship against every indexed candidate.
+
+    Returns candidates whose cosine similarity is strictly above
+    `min_similarity`, ranked by FinalScore then similarity:
+    {
+      "candidate": CandidateProfile,
+      "cosine_similarity": float,
+      "vsps": float,
+      "trust_score": float,
+      "final_score": float,
+    }
+    """
+    if self.matrix is None or not self.candidates:
+      return []
+
+    internship_vector = self.vectorizer.transform([internship.text_for_vectorization()])
+    similarities = (self.matrix @ internship_vector.T).toarray().ravel()
+    similarities = np.clip(similarities, 0.0, 1.0)
+
+    trust_scores = self._trust_scores(internship.recruiter_rating)
+    final_scores = np.clip(similarities * self._vsps * trust_scores, 0.0, 1.0)
+
+    selected = np.flatnonzero(similarities > min_similarity)
+    order = np.lexsort((-similarities[selected], -final_scores[selected]))
+    selected = selected[order]
+    if top_k is not None:
+      selected = selected[:top_k]
+
+    return [
+      {
+        "candidate": self.candidates[index],
+        "cosine_similarity": float(similarities[index]),
+        "vsps": float(self._vsps[index]),
+        "trust_score": float(trust_scores[index]),
+        "final_score": float(final_scores[index]),
+      }
+      for index in selected
+    ]
+
+
+ARTIFACT_FORMAT = "tfidf-delta-v1"
+ARTIFACT_WEIGHT_SCALE = 65535
+
+
+def export_internship_index(internships: List[Internship], idf_precision: int = 5) -> Dict[str, Any]:
+  """
+  Export a compact, precomputed TF-IDF index over internships.
+
+  Uses the same TfidfVectorizer defaults as `RecommendationEngine`
+  (lowercase, token pattern, smooth IDF, L2 rows), so clients can score
+  locally without re-tokenizing every listing or recomputing document
+  frequencies. The IDF is fitted on internships only; the server also folds
+  the candidate document in, which shifts weights only marginally.
+
+  Each internship row is stored sparsely: term indices are delta-encoded in
+  ascending order and L2-normalized weights are quantized to integers in
+  [0, ARTIFACT_WEIGHT_SCALE].
+  """
+  vectorizer = TfidfVectorizer()
+  documents = [internship.text_for_vectorization() for internship in internships]
+  artifact: Dict[str, Any] = {
+    "format": ARTIFACT_FORMAT,
+    "token_pattern": vectorizer.token_pattern,
+    "weight_scale": ARTIFACT_WEIGHT_SCALE,
+    "vocab": [],
+    "idf": [],
+    "internships": [],
+  }
+  if not documents:
+    return artifact
+
+  try:
+    matrix = vectorizer.fit_transform(documents).tocsr()
+  except ValueError:
+    # Empty vocabulary: nothing is scorable.
+    artifact["internships"] = [{"id": i.id, "terms": [], "weights": []} for i in internships]
+    return artifact
+
+  matrix.sort_indices()
+  artifact["vocab"] = vectorizer.get_feature_names_out().tolist()
+  artifact["idf"] = np.round(vectorizer.idf_, idf_precision).tolist()
+
+  for row, internship in enumerate(internships):
+    start, end = matrix.indptr[row], matrix.indptr[row + 1]
+    indices = matrix.indices[start:end]
+    weights = np.rint(matrix.data[start:end] * ARTIFACT_WEIGHT_SCALE).astype(int)
+    artifact["internships"].append(
+      {
+        "id": internship.id,
+        "terms": np.diff(indices, prepend=0).tolist(),
+        "weights": weights.tolist(),
+      }
+    )
+  return artifact
+
+
 def example_usage() -> None:
   """
   Standalone example to demonstrate the engine.
@@ -0,0 +1,191 @@
+"""Shadow scoring harness for recommendation engine configurations.
+
+A `ShadowScorer` serves every request from the production engine and, for a
+sampled share of requests, also runs a candidate configuration on the same
+inputs. The candidate never affects the returned ranking; only its latency
+delta and its overlap with the production ranking are recorded.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .recommender import CandidateProfile, Internship, RecommendationEngine
+
+logger = logging.getLogger(__name__)
+
+EngineFactory = Callable[[], RecommendationEngine]
+
+
+def _ranked_ids(results: Sequence[Dict[str, Any]]) -> List[Any]:
+  return [item["internship"].id for item in results]
+
+
+def jaccard_at_k(production_ids: Sequence[Any], shadow_ids: Sequence[Any], k: int) -> float:
+  """
+  |top-k(production) ∩ top-k(shadow)| / |top-k(production) ∪ top-k(shadow)|.
+  Two empty rankings are considered identical.
+  """
+  production_top = set(production_ids[:k])
+  shadow_top = set(shadow_ids[:k])
+  union = production_top | shadow_top
+  if not union:
+    return 1.0
+  return len(production_top & shadow_top) / len(union)
+
+
+def ndcg_at_k(production_ids: Sequence[Any], shadow_ids: Sequence[Any], k: int) -> float:
+  """
+  NDCG@k of the shadow ranking, using the production ranking as ground truth.
+
+  The item at production rank r (0-based, r < k) has graded relevance k - r;
+  items outside the production top-k are irrelevant.
+  """
+  gains = {item_id: k - rank for rank, item_id in enumerate(production_ids[:k])}
+  if not gains:
+    return 1.0 if not shadow_ids[:k] else 0.0
+
+  def dcg(ids: Sequence[Any]) -> float:
+    return sum(
+      ((2 ** gains.get(item_id, 0)) - 1) / math.log2(rank + 2)
+      for rank, item_id in enumerate(ids[:k])
+    )
+
+  ideal = dcg(production_ids)
+  if ideal == 0:
+    return 0.0
+  return dcg(shadow_ids) / ideal
+
+
+@dataclass
+class ShadowRecord:
+  """
+  Outcome of one shadowed request. Latencies are in milliseconds;
+  a positive latency_delta_ms means the shadow engine was slower.
+  """
+
+  k: int
+  production_ms: float
+  shadow_ms: Optional[float] = None
+  latency_delta_ms: Optional[float] = None
+  jaccard_at_k: Optional[float] = None
+  ndcg_at_k: Optional[float] = None
+  error: Optional[str] = None
+
+
+class ShadowScorer:
+  """
+  Runs a candidate engine in shadow of the production engine.
+
+  Engines are created through factories because `RecommendationEngine`
+  refits its vectorizer on every call and must not be shared across threads.
+  Records are kept in a bounded in-process buffer and logged, so they can be
+  aggregated per process or from the logs.
+  """
+
+  def __init__(
+    self,
+    production_factory: EngineFactory,
+    shadow_factory: EngineFactory,
+    sample_rate: float = 0.0,
+    k: int = 10,
+    history_size: int = 500,
+    run_in_background: bool = True,
+    rng: Optional[random.Random] = None,
+  ) -> None:
+    self.production_factory = production_factory
+    self.shadow_factory = shadow_factory
+    self.sample_rate = max(0.0, min(1.0, sample_rate))
+    self.k = k
+    self.run_in_background = run_in_background
+    self.records: Deque[ShadowRecord] = deque(maxlen=history_size)
+    self._rng = rng or random.Random()
+    self._lock = threading.Lock()
+
+  def _should_sample(self) -> bool:
+    return self.sample_rate > 0 and self._rng.random() < self.sample_rate
+
+  def recommend(
+    self,
+    candidate: CandidateProfile,
+    internships: List[Internship],
+    top_k: Optional[int] = None,
+  ) -> List[Dict[str, Any]]:
+    """
+    Return the production ranking; shadow the request if it is sampled.
+    """
+    started = time.perf_counter()
+    results = self.production_factory().recommend(candidate, internships, top_k=top_k)
+    production_ms = (time.perf_counter() - started) * 1000
+
+    if self._should_sample():
+      args = (candidate, list(internships), top_k, _ranked_ids(results), production_ms)
+      if self.run_in_background:
+        threading.Thread(target=self._compare, args=args, daemon=True).start()
+      else:
+        self._compare(*args)
+
+    return results
+
+  def _compare(
+    self,
+    candidate: CandidateProfile,
+    internships: List[Internship],
+    top_k: Optional[int],
+    production_ids: List[Any],
+    production_ms: float,
+  ) -> None:
+    record = ShadowRecord(k=self.k, production_ms=production_ms)
+    try:
+      started = time.perf_counter()
+      shadow_results = self.shadow_factory().recommend(candidate, internships, top_k=top_k)
+      record.shadow_ms = (time.perf_counter() - started) * 1000
+      record.latency_delta_ms = record.shadow_ms - production_ms
+
+      shadow_ids = _ranked_ids(shadow_results)
+      record.jaccard_at_k = jaccard_at_k(production_ids, shadow_ids, self.k)
+      record.ndcg_at_k = ndcg_at_k(production_ids, shadow_ids, self.k)
+    except Exception as exc:  # the shadow must never break the live request
+      record.error = f"{type(exc).__name__}: {exc}"
+      logger.exception("Shadow recommendation engine failed")
+
+    with self._lock:
+      self.records.append(record)
+    logger.info("recommendation shadow %s", asdict(record))
+
+  def summary(self) -> Dict[str, Any]:
+    """
+    Aggregate the buffered records.
+    """
+    with self._lock:
+      records = list(self.records)
+
+    completed = [record for record in records if record.error is None]
+    summary: Dict[str, Any] = {
+      "sample_rate": self.sample_rate,
+      "k": self.k,
+      "samples": len(records),
+      "errors": len(records) - len(completed),
+    }
+    if not completed:
+      return summary
+
+    deltas = np.array([record.latency_delta_ms for record in completed], dtype=float)
+    summary.update(
+      {
+        "latency_delta_ms_mean": float(deltas.mean()),
+        "latency_delta_ms_p95": float(np.percentile(deltas, 95)),
+        "jaccard_at_k_mean": float(np.mean([record.jaccard_at_k for record in completed])),
+        "ndcg_at_k_mean": float(np.mean([record.ndcg_at_k for record in completed])),
+      }
+    )
+    return summary
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 class User(AbstractUser):
@@ -16,5 +17,16 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username', 'first_name', 'last_name', 'role']
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+        ]
+
     def __str__(self):
         return self.email
+
+
+# `email__lower=value.lower()` compiles to LOWER(email) = %s, which the
+# functional index above serves (`iexact` uses UPPER()/LIKE and cannot).
+# Registered on this field only, not on every EmailField.
+User._meta.get_field('email').register_lookup(Lower)
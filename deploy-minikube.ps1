@@ -104,6 +104,10 @@ $backendPod = & $MINIKUBE kubectl -- get pods -n internconnect -l app=backend -o
 Write-Info "Running migrations on pod: $backendPod"
 & $MINIKUBE kubectl -- exec -n internconnect $backendPod -- python manage.py migrate --noinput
 Write-Info "Migrations complete [OK]"
+& $MINIKUBE kubectl -- apply -f k8s/analytics-cronjob.yaml
+Write-Info "Analytics refresh CronJob scheduled [OK]"
+& $MINIKUBE kubectl -- apply -f k8s/scores-cronjob.yaml
+Write-Info "Score recompute CronJob scheduled [OK]"
 
 # --- Seed Demo Data (Admin + Students + Recruiters) ---
 Write-Section "Seeding Demo Data"
@@ -87,6 +87,10 @@ section "Running Django Migrations"
 BACKEND_POD=$(kubectl get pods -n internconnect -l app=backend -o jsonpath='{.items[0].metadata.name}')
 kubectl exec -n internconnect $BACKEND_POD -- python manage.py migrate --noinput
 info "Migrations complete ✓"
+kubectl apply -f k8s/analytics-cronjob.yaml
+info "Analytics refresh CronJob scheduled ✓"
+kubectl apply -f k8s/scores-cronjob.yaml
+info "Score recompute CronJob scheduled ✓"
 
 # ── Deploy Frontend + Nginx ────────────────────────────────────────────────────
 section "Phase 6 — Deploying Frontend + Nginx"
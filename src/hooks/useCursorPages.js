@@ -0,0 +1,67 @@
+import { useCallback, useEffect, useRef, useState } from 'react'
+import API from '../services/api'
+import { fetchPage } from '../services/pagination'
+
+// Loads the first page of a cursor-paginated list and appends the following
+// pages on demand through `loadMore()`. Changing `url` or `params` starts
+// over from the first page; a null `url` waits without requesting anything.
+export function useCursorPages(url, params) {
+  const [items, setItems] = useState([])
+  const [next, setNext] = useState(null)
+  const [loading, setLoading] = useState(Boolean(url))
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [error, setError] = useState(null)
+  // Responses for a previous url/params (or a superseded reload) are dropped.
+  const generation = useRef(0)
+  const paramsKey = JSON.stringify(params || {})
+
+  const reload = useCallback(async () => {
+    const current = ++generation.current
+    if (!url) {
+      setItems([])
+      setNext(null)
+      setLoading(false)
+      return
+    }
+    setLoading(true)
+    setError(null)
+    try {
+      const page = await fetchPage(API, url, { params: JSON.parse(paramsKey) })
+      if (current !== generation.current) return
+      setItems(page.items)
+      setNext(page.next)
+    } catch (err) {
+      if (current !== generation.current) return
+      console.error(`Failed to load ${url}`, err)
+      setError(err)
+      setItems([])
+      setNext(null)
+    } finally {
+      if (current === generation.current) setLoading(false)
+    }
+  }, [url, paramsKey])
+
+  const loadMore = useCallback(async () => {
+    if (!next || loadingMore) return
+    const current = generation.current
+    setLoadingMore(true)
+    try {
+      // `next` already carries the cursor, page size and filters.
+      const page = await fetchPage(API, next)
+      if (current !== generation.current) return
+      setItems((previous) => [...previous, ...page.items])
+      setNext(page.next)
+    } catch (err) {
+      console.error(`Failed to load more from ${url}`, err)
+      setError(err)
+    } finally {
+      setLoadingMore(false)
+    }
+  }, [next, loadingMore, url])
+
+  useEffect(() => {
+    reload()
+  }, [reload])
+
+  return { items, hasMore: Boolean(next), loading, loadingMore, error, loadMore, reload }
+}
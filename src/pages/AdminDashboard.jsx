@@ -35,6 +35,7 @@ import {
 } from 'lucide-react'
 import { useAuth } from '../context/AuthContext'
 import API from '../services/api'
+import { fetchAllPages, fetchPage } from '../services/pagination'
 import FeedbackToast from '../components/FeedbackToast'
 
 const sidebarLinks = [
@@ -51,6 +52,14 @@ const sidebarLinks = [
   { label: 'Profile', icon: ShieldCheck },
 ]
 
+const toApplicationRow = (app, internship) => ({
+  id: app.id,
+  student: app.applicant_name || 'Applicant',
+  internship: internship?.title || `Internship #${app.internship}`,
+  company: internship?.company_name || '—',
+  status: app.status,
+})
+
 export default function AdminDashboard() {
   const navigate = useNavigate()
   const { user, logout, login, refreshUser } = useAuth()
@@ -64,6 +73,13 @@ export default function AdminDashboard() {
   const [recruiterProfiles, setRecruiterProfiles] = useState([])
   const [internshipList, setInternshipList] = useState([])
   const [applications, setApplications] = useState([])
+  // Cursors of the next internship/application pages; lists load on demand.
+  const [internshipNext, setInternshipNext] = useState(null)
+  const [applicationsNext, setApplicationsNext] = useState(null)
+  const [pageLoading, setPageLoading] = useState(null)
+  const [applicationInternships, setApplicationInternships] = useState({})
+  const requestedInternships = useRef(new Set())
+  const [platformAnalytics, setPlatformAnalytics] = useState(null)
   const [assessmentAttempts, setAssessmentAttempts] = useState([])
   const [skills, setSkills] = useState([])
   const [users, setUsers] = useState([])
@@ -121,7 +137,18 @@ export default function AdminDashboard() {
   }, [])
 
   const verifiedStudents = useMemo(() => studentProfiles.filter((profile) => (profile.vsps_score ?? 0) > 0), [studentProfiles])
-  const pendingApplications = useMemo(() => applications.filter((app) => app.status === 'PENDING').length, [applications])
+  // Platform-wide totals come from the analytics rollups; the loaded pages are a floor while those catch up.
+  const rollupTotal = (metric) => Object.values(platformAnalytics?.[metric] || {}).reduce((sum, value) => sum + value, 0)
+  const internshipTotal = Math.max(rollupTotal('internships_by_status'), internshipList.length)
+  const applicationTotal = Math.max(rollupTotal('applications_by_status'), applications.length)
+  const pendingApplications = useMemo(
+    () =>
+      Math.max(
+        platformAnalytics?.applications_by_status?.PENDING || 0,
+        applications.filter((app) => app.status === 'PENDING').length,
+      ),
+    [platformAnalytics, applications],
+  )
   const activeRecruiters = useMemo(() => recruiterProfiles.filter((rec) => rec.is_verified).length, [recruiterProfiles])
 
   useEffect(() => {
@@ -137,8 +164,8 @@ export default function AdminDashboard() {
   const metrics = useMemo(() => {
     const totalStudents = studentProfiles.length
     const totalRecruiters = recruiterProfiles.length
-    const totalInternships = internshipList.length
-    const totalApplications = applications.length
+    const totalInternships = internshipTotal
+    const totalApplications = applicationTotal
     const totalUsers = users.length || totalStudents + totalRecruiters
     const totalAssessments = verifiedStudents.length
     const avgVsps = totalAssessments
@@ -154,7 +181,7 @@ export default function AdminDashboard() {
       { title: 'Total Applications', value: totalApplications.toLocaleString('en-US'), change: `${pendingApplications} pending`, icon: ClipboardList, glow: 'from-emerald-500/40 to-teal-500/20' },
       { title: 'Assessments Verified', value: totalAssessments.toLocaleString('en-US'), change: `${(avgVsps * 100).toFixed(0)} avg VSPS`, icon: Activity, glow: 'from-pink-500/40 to-indigo-500/20' },
     ]
-  }, [studentProfiles, recruiterProfiles, internshipList, applications, verifiedStudents, activeRecruiters, pendingApplications, users])
+  }, [studentProfiles, recruiterProfiles, internshipTotal, applicationTotal, verifiedStudents, activeRecruiters, pendingApplications, users])
 
   const userRows = useMemo(() => {
     const studentByEmail = new Map(studentProfiles.map((profile) => [profile.email?.toLowerCase(), profile]))
@@ -235,25 +262,16 @@ export default function AdminDashboard() {
 
   const studentTableRows = useMemo(() => studentProfiles.slice(0, Math.max(5, studentProfiles.length)), [studentProfiles])
 
-  const internshipsByRecruiter = useMemo(() => {
-    const map = new Map()
-    internshipList.forEach((internship) => {
-      const current = map.get(internship.recruiter) || 0
-      map.set(internship.recruiter, current + 1)
-    })
-    return map
-  }, [internshipList])
-
   const recruiterDisplay = useMemo(
     () =>
       recruiterProfiles.map((rec) => ({
         id: rec.id,
         company: rec.company_name || '—',
         recruiter: rec.email,
-        internships: internshipsByRecruiter.get(rec.id) || 0,
+        internships: rec.internship_count || 0,
         verified: rec.is_verified,
       })),
-    [recruiterProfiles, internshipsByRecruiter],
+    [recruiterProfiles],
   )
 
   const recruiterOptions = useMemo(
@@ -392,7 +410,7 @@ export default function AdminDashboard() {
     URL.revokeObjectURL(url)
   }
 
-  const exportSectionToCSV = (section) => {
+  const exportSectionToCSV = async (section) => {
     let headers = []
     let rows = []
     switch (section) {
@@ -430,7 +448,13 @@ export default function AdminDashboard() {
         ]
         break
       case 'internships':
-        rows = internshipList
+        // Exports cover every listing, not just the pages loaded on screen.
+        try {
+          rows = internshipNext ? await fetchAllPages(API, '/api/internships/') : internshipList
+        } catch (error) {
+          setFeedback({ type: 'error', message: 'Unable to export internships.' })
+          return
+        }
         headers = [
           { label: 'Title', value: (row) => row.title },
           { label: 'Company', value: (row) => row.company_name },
@@ -444,7 +468,21 @@ export default function AdminDashboard() {
         ]
         break
       case 'applications':
-        rows = applicationsDisplay
+        if (applicationsNext) {
+          try {
+            const [allApplications, allInternships] = await Promise.all([
+              fetchAllPages(API, '/api/applications/'),
+              fetchAllPages(API, '/api/internships/'),
+            ])
+            const lookup = new Map(allInternships.map((internship) => [internship.id, internship]))
+            rows = allApplications.map((app) => toApplicationRow(app, lookup.get(app.internship)))
+          } catch (error) {
+            setFeedback({ type: 'error', message: 'Unable to export applications.' })
+            return
+          }
+        } else {
+          rows = applicationsDisplay
+        }
         headers = [
           { label: 'Student', value: (row) => row.student },
           { label: 'Internship', value: (row) => row.internship },
@@ -496,21 +534,62 @@ export default function AdminDashboard() {
     return lookup
   }, [internshipList])
 
+  // Listings referenced by loaded applications but not on a loaded internship page.
+  useEffect(() => {
+    const missing = [...new Set(applications.map((app) => app.internship))].filter(
+      (id) => id != null && !internshipLookup.has(id) && !requestedInternships.current.has(id),
+    )
+    if (!missing.length) return
+    missing.forEach((id) => requestedInternships.current.add(id))
+    fetchPage(API, '/api/internships/', { params: { ids: missing.join(','), page_size: missing.length } })
+      .then(({ items }) => {
+        setApplicationInternships((previous) => {
+          const map = { ...previous }
+          items.forEach((internship) => {
+            map[internship.id] = internship
+          })
+          return map
+        })
+      })
+      .catch(() => missing.forEach((id) => requestedInternships.current.delete(id)))
+  }, [applications, internshipLookup])
+
   const applicationsDisplay = useMemo(
     () =>
-      applications.map((app) => {
-        const internship = internshipLookup.get(app.internship)
-        return {
-          id: app.id,
-          student: app.applicant_name || 'Applicant',
-          internship: internship?.title || `Internship #${app.internship}`,
-          company: internship?.company_name || '—',
-          status: app.status,
-        }
-      }),
-    [applications, internshipLookup],
+      applications.map((app) =>
+        toApplicationRow(app, internshipLookup.get(app.internship) || applicationInternships[app.internship]),
+      ),
+    [applications, internshipLookup, applicationInternships],
   )
 
+  const loadMoreInternships = async () => {
+    if (!internshipNext || pageLoading) return
+    setPageLoading('internships')
+    try {
+      const page = await fetchPage(API, internshipNext)
+      setInternshipList((previous) => [...previous, ...page.items])
+      setInternshipNext(page.next)
+    } catch (error) {
+      setFeedback({ type: 'error', message: 'Unable to load more internships.' })
+    } finally {
+      setPageLoading(null)
+    }
+  }
+
+  const loadMoreApplications = async () => {
+    if (!applicationsNext || pageLoading) return
+    setPageLoading('applications')
+    try {
+      const page = await fetchPage(API, applicationsNext)
+      setApplications((previous) => [...previous, ...page.items])
+      setApplicationsNext(page.next)
+    } catch (error) {
+      setFeedback({ type: 'error', message: 'Unable to load more applications.' })
+    } finally {
+      setPageLoading(null)
+    }
+  }
+
   const chartData = useMemo(() => {
     const growthBuckets = new Array(7).fill(0)
     studentProfiles.forEach((student, index) => {
@@ -983,11 +1062,12 @@ const handleSkillAdd = async (e) => {
         API.get('/api/users/'),
         API.get('/api/applicants/'),
         API.get('/api/recruiters/'),
-        API.get('/api/internships/'),
-        API.get('/api/applications/'),
+        fetchPage(API, '/api/internships/').then((data) => ({ data })),
+        fetchPage(API, '/api/applications/').then((data) => ({ data })),
         API.get('/api/assessments/attempts/?limit=120'),
         API.get('/api/skills/'),
         API.get('/api/platform-settings/settings/'),
+        API.get('/api/platform-settings/analytics/'),
       ])
       if (signal?.aborted) return
 
@@ -1000,6 +1080,7 @@ const handleSkillAdd = async (e) => {
         attemptsRes,
         skillsRes,
         platformSettingsRes,
+        analyticsRes,
       ] = responses
 
       const getData = (result) => (result.status === 'fulfilled' ? result.value.data : null)
@@ -1012,14 +1093,18 @@ const handleSkillAdd = async (e) => {
       const skillsData = getData(skillsRes)
       const attemptsData = getData(attemptsRes)
       const platformSettingsData = getData(platformSettingsRes)
+      const analyticsData = getData(analyticsRes)
 
       setUsers(usersData ?? [])
       setStudentProfiles(applicantsData ?? [])
       setRecruiterProfiles(recruitersData ?? [])
-      setInternshipList(internshipsData ?? [])
-      setApplications(applicationsData ?? [])
+      setInternshipList(internshipsData?.items ?? [])
+      setInternshipNext(internshipsData?.next ?? null)
+      setApplications(applicationsData?.items ?? [])
+      setApplicationsNext(applicationsData?.next ?? null)
       setSkills(skillsData ?? [])
       setAssessmentAttempts(attemptsData ?? [])
+      setPlatformAnalytics(analyticsData)
 
       if (platformSettingsData) {
         setEnforce2FA(platformSettingsData.enforce_2fa_for_admins_recruiters ?? true)
@@ -1038,7 +1123,9 @@ const handleSkillAdd = async (e) => {
       setStudentProfiles([])
       setRecruiterProfiles([])
       setInternshipList([])
+      setInternshipNext(null)
       setApplications([])
+      setApplicationsNext(null)
       setSkills([])
     } finally {
       if (!signal?.aborted) {
@@ -1381,7 +1468,7 @@ const handleSkillAdd = async (e) => {
       <div className="mb-4 flex flex-wrap items-center justify-between gap-3">
         <div>
           <h3 className="text-xl font-semibold">Internships</h3>
-          <span className="text-xs text-indigo-200">{internshipList.length} listings</span>
+          <span className="text-xs text-indigo-200">{internshipTotal} listings</span>
         </div>
         <div className="flex items-center gap-2">
           <button
@@ -1458,6 +1545,16 @@ const handleSkillAdd = async (e) => {
           </table>
         </div>
       )}
+      {internshipNext && (
+        <button
+          type="button"
+          onClick={loadMoreInternships}
+          disabled={pageLoading === 'internships'}
+          className="mt-4 rounded-full border border-white/10 px-4 py-2 text-[11px] uppercase tracking-[0.35em] text-indigo-100 hover:border-white/30 disabled:opacity-50"
+        >
+          {pageLoading === 'internships' ? 'Loading…' : 'Load more'}
+        </button>
+      )}
     </div>
   )
 
@@ -1513,6 +1610,16 @@ const handleSkillAdd = async (e) => {
           </tbody>
         </table>
       )}
+      {applicationsNext && (
+        <button
+          type="button"
+          onClick={loadMoreApplications}
+          disabled={pageLoading === 'applications'}
+          className="mt-4 rounded-full border border-white/10 px-3 py-1 text-[10px] uppercase tracking-[0.3em] text-indigo-100 hover:border-white/30 disabled:opacity-50"
+        >
+          {pageLoading === 'applications' ? 'Loading…' : 'Load more'}
+        </button>
+      )}
     </div>
   )
 
@@ -12,6 +12,8 @@ import {
   X,
 } from 'lucide-react'
 import API from '../services/api'
+import { fetchPage } from '../services/pagination'
+import { useCursorPages } from '../hooks/useCursorPages'
 import { useAuth } from '../context/AuthContext'
 
 const navLinks = [
@@ -72,17 +74,24 @@ const statusLabelMap = {
   CLOSED: 'Closed',
 }
 
-const deriveListingStatus = (listing, apps = []) => {
+// `counts` is the listing's `applications` entry from /api/recruiters/dashboard/.
+const deriveListingStatus = (listing, counts) => {
   if (listing?.status) {
     return statusLabelMap[listing.status] || listing.status
   }
-  if (!apps.length) return 'Open'
-  if (apps.some((app) => app.status === 'ACCEPTED')) return 'Offer sent'
-  if (apps.every((app) => app.status === 'REJECTED')) return 'Closed'
-  if (apps.some((app) => app.status === 'REVIEWED')) return 'In review'
+  if (!counts?.total) return 'Open'
+  if (counts.accepted) return 'Offer sent'
+  if (counts.rejected === counts.total) return 'Closed'
+  if (counts.reviewed) return 'In review'
   return 'Active'
 }
 
+// Status filter behind each "AI Suggested Candidates" tab.
+const matchFilterStatuses = {
+  Active: 'PENDING,REVIEWED',
+  Starred: 'ACCEPTED',
+}
+
 const normalizeSkillLabel = (skill) => {
   if (!skill) return ''
   if (typeof skill === 'string') return skill
@@ -97,8 +106,8 @@ const formatVsps = (value) => Math.round(((value ?? 0) * 100))
 export default function RecruiterDashboard() {
   const { user, logout } = useAuth()
   const [profile, setProfile] = useState(null)
-  const [internships, setInternships] = useState([])
-  const [applications, setApplications] = useState([])
+  const [dashboard, setDashboard] = useState(null)
+  const [recentApplications, setRecentApplications] = useState([])
   const [applicants, setApplicants] = useState([])
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState(null)
@@ -177,15 +186,15 @@ export default function RecruiterDashboard() {
       setProfile(recruiterProfile)
       setForm((prev) => ({ ...prev, company: recruiterProfile.company_name || prev.company }))
 
-      const [internshipRes, applicationRes, applicantRes] = await Promise.all([
-        API.get('/api/internships/'),
-        API.get('/api/applications/'),
+      // Counts come from the aggregated dashboard; lists are paged below.
+      const [dashboardRes, recent, applicantRes] = await Promise.all([
+        API.get('/api/recruiters/dashboard/'),
+        fetchPage(API, '/api/applications/', { params: { page_size: 2 } }),
         API.get('/api/applicants/'),
       ])
 
-      const recruiterInternships = (internshipRes.data || []).filter((listing) => listing.recruiter === recruiterProfile.id)
-      setInternships(recruiterInternships)
-      setApplications(applicationRes.data || [])
+      setDashboard(dashboardRes.data)
+      setRecentApplications(recent.items)
       setApplicants(applicantRes.data || [])
     } catch (err) {
       console.error('Failed to load recruiter dashboard', err)
@@ -204,46 +213,56 @@ export default function RecruiterDashboard() {
     fetchRecruiterData()
   }, [fetchRecruiterData])
 
-  const applicationsByInternship = useMemo(() => {
+  // The recruiter's own listings, one cursor page at a time.
+  const internshipParams = useMemo(() => (profile?.id ? { recruiter: profile.id } : null), [profile?.id])
+  const {
+    items: internships,
+    hasMore: hasMoreInternships,
+    loadingMore: loadingMoreInternships,
+    loadMore: loadMoreInternships,
+    reload: reloadInternships,
+  } = useCursorPages(internshipParams ? '/api/internships/' : null, internshipParams)
+
+  // Only the first page of the selected tab is shown, newest first.
+  const applicationParams = useMemo(() => ({ status: matchFilterStatuses[matchFilter] }), [matchFilter])
+  const { items: applications, reload: reloadApplications } = useCursorPages(
+    profile?.id ? '/api/applications/' : null,
+    applicationParams,
+  )
+
+  const refreshRecruiterData = async () => {
+    await fetchRecruiterData()
+    reloadInternships()
+    reloadApplications()
+  }
+
+  const listingCounts = useMemo(() => {
     const map = new Map()
-    applications.forEach((app) => {
-      const existing = map.get(app.internship) || []
-      existing.push(app)
-      map.set(app.internship, existing)
-    })
+    ;(dashboard?.internships || []).forEach((row) => map.set(row.id, row.applications))
     return map
-  }, [applications])
-
-  const statusCounts = useMemo(() => {
-    return applications.reduce(
-      (acc, app) => {
-        const key = app.status || 'PENDING'
-        acc[key] = (acc[key] || 0) + 1
-        return acc
-      },
-      { PENDING: 0, REVIEWED: 0, ACCEPTED: 0, REJECTED: 0 }
-    )
-  }, [applications])
+  }, [dashboard])
 
-  const totalApplicants = applications.length
-  const pendingCount = statusCounts.PENDING || 0
-  const reviewedCount = statusCounts.REVIEWED || 0
-  const acceptedCount = statusCounts.ACCEPTED || 0
-  const rejectedCount = statusCounts.REJECTED || 0
-  const avgApplicantsPerListing = internships.length ? (totalApplicants / internships.length).toFixed(1) : '0.0'
+  const totals = dashboard?.totals || {}
+  const listingTotal = totals.internships || 0
+  const totalApplicants = totals.applications || 0
+  const pendingCount = totals.pending || 0
+  const reviewedCount = totals.reviewed || 0
+  const acceptedCount = totals.accepted || 0
+  const rejectedCount = totals.rejected || 0
+  const avgApplicantsPerListing = listingTotal ? (totalApplicants / listingTotal).toFixed(1) : '0.0'
   const offerRate = totalApplicants ? Math.round((acceptedCount / totalApplicants) * 100) : 0
   const newlyPosted = useMemo(
     () =>
-      internships.filter((listing) => {
+      (dashboard?.internships || []).filter((listing) => {
         const posted = new Date(listing.created_at)
         const diff = Date.now() - posted.getTime()
         return diff < 1000 * 60 * 60 * 24 * 30
       }).length,
-    [internships]
+    [dashboard]
   )
 
   const overviewCards = [
-    { title: 'Active Internships', value: internships.length.toString(), sub: `${newlyPosted} posted this month` },
+    { title: 'Active Internships', value: listingTotal.toString(), sub: `${newlyPosted} posted this month` },
     { title: 'Total Applicants', value: totalApplicants.toString(), sub: `${pendingCount} awaiting review` },
     { title: 'Interviews', value: reviewedCount.toString(), sub: 'Marked as reviewed' },
     { title: 'Offers Extended', value: acceptedCount.toString(), sub: `${offerRate}% acceptance rate` },
@@ -281,13 +300,10 @@ export default function RecruiterDashboard() {
     return Array.from(scored.values()).sort((a, b) => b.vsps - a.vsps)
   }, [applications, applicantLookup])
 
-  const activeMatches = candidateMatches.filter((candidate) => candidate.status === 'PENDING' || candidate.status === 'REVIEWED')
-  const starredMatches = candidateMatches.filter((candidate) => candidate.status === 'ACCEPTED')
-  const filteredMatches = matchFilter === 'Active'
-    ? (activeMatches.length ? activeMatches : candidateMatches)
-    : (starredMatches.length ? starredMatches : candidateMatches.slice(0, 1))
-
-  const appliedApplicantIds = useMemo(() => new Set(applications.map((app) => app.applicant)), [applications])
+  const appliedApplicantIds = useMemo(
+    () => new Set([...applications, ...recentApplications].map((app) => app.applicant)),
+    [applications, recentApplications],
+  )
   const discoveryResults = useMemo(() => {
     const sorted = applicants
       .filter((candidate) => !appliedApplicantIds.has(candidate.id))
@@ -347,17 +363,17 @@ export default function RecruiterDashboard() {
       .slice()
       .sort((a, b) => new Date(b.created_at) - new Date(a.created_at))
       .map((listing) => {
-        const apps = applicationsByInternship.get(listing.id) || []
+        const counts = listingCounts.get(listing.id)
         return {
           id: listing.id,
           title: listing.title,
           location: listing.location || 'Remote',
-          applicants: apps.length,
+          applicants: counts?.total || 0,
           posted: formatDate(listing.created_at),
-          status: deriveListingStatus(apps),
+          status: deriveListingStatus(listing, counts),
         }
       })
-  }, [internships, applicationsByInternship])
+  }, [internships, listingCounts])
 
   const pipelineStages = [
     { label: 'Total Applied', count: totalApplicants },
@@ -368,17 +384,14 @@ export default function RecruiterDashboard() {
   ]
 
   const latestMessages = useMemo(() => {
-    const titleMap = new Map(internships.map((listing) => [listing.id, listing.title]))
-    return applications
-      .slice()
-      .sort((a, b) => new Date(b.applied_at) - new Date(a.applied_at))
-      .slice(0, 2)
+    const titleMap = new Map((dashboard?.internships || []).map((listing) => [listing.id, listing.title]))
+    return recentApplications
       .map((app) => ({
         sender: app.applicant_name || 'Candidate',
         preview: `Applied to ${titleMap.get(app.internship) || 'an internship'}`,
         time: formatRelativeTime(app.applied_at),
       }))
-  }, [applications, internships])
+  }, [recentApplications, dashboard])
 
   const highVspsSupply = discoveryResults.filter((candidate) => candidate.vsps >= 0.7).length
   const verifiedTalent = applicants.filter((candidate) => (candidate.vsps_score ?? 0) >= 0.5).length
@@ -428,7 +441,7 @@ export default function RecruiterDashboard() {
 
       setEditingListing(null)
       setForm(blankForm(profile?.company_name || ''))
-      await fetchRecruiterData()
+      await refreshRecruiterData()
     } catch (err) {
       console.error('Failed to publish internship', err)
       setFormFeedback(err.response?.data?.detail || 'Could not publish internship')
@@ -454,7 +467,7 @@ export default function RecruiterDashboard() {
         company_website: trimmedWebsite,
       })
       setCompanyEditorOpen(false)
-      await fetchRecruiterData()
+      await refreshRecruiterData()
     } catch (err) {
       setCompanyError(err.response?.data?.detail || 'Unable to update company profile right now.')
     } finally {
@@ -521,7 +534,7 @@ export default function RecruiterDashboard() {
         status: listingStatus,
       })
       setStatusFeedback('Status updated successfully.')
-      await fetchRecruiterData()
+      await refreshRecruiterData()
     } catch (err) {
       setStatusFeedback(err.response?.data?.detail || 'Unable to update internship status right now.')
     } finally {
@@ -623,13 +636,13 @@ export default function RecruiterDashboard() {
                       </tr>
                     )}
                     {internships.map((listing) => {
-                      const apps = applicationsByInternship.get(listing.id) || []
+                      const counts = listingCounts.get(listing.id)
                       const row = {
                         title: listing.title,
                         location: listing.location || 'Remote',
-                        applicants: apps.length,
+                        applicants: counts?.total || 0,
                         posted: formatDate(listing.created_at),
-                        status: deriveListingStatus(apps),
+                        status: deriveListingStatus(listing, counts),
                       }
 
                       return (
@@ -663,6 +676,16 @@ export default function RecruiterDashboard() {
                   </tbody>
                 </table>
               </div>
+              {hasMoreInternships && (
+                <button
+                  type="button"
+                  onClick={loadMoreInternships}
+                  disabled={loadingMoreInternships}
+                  className="mt-4 rounded-full border border-white/10 px-4 py-2 text-xs text-white/70 transition hover:bg-white/5 disabled:opacity-50"
+                >
+                  {loadingMoreInternships ? 'Loading…' : 'Load more listings'}
+                </button>
+              )}
             </div>
           </section>
         )
@@ -855,8 +878,8 @@ export default function RecruiterDashboard() {
                   </div>
                 </div>
                 <div className="mt-6 space-y-4">
-                  {filteredMatches.length === 0 && <p className="text-xs text-white/60">No candidates yet. Post a role to receive matches.</p>}
-                  {filteredMatches.slice(0, 3).map((candidate) => (
+                  {candidateMatches.length === 0 && <p className="text-xs text-white/60">No candidates yet. Post a role to receive matches.</p>}
+                  {candidateMatches.slice(0, 3).map((candidate) => (
                     <div key={candidate.id} className="rounded-2xl border border-white/10 bg-[#0b1129] p-4">
                       <div className="flex items-center justify-between">
                         <div>
@@ -994,7 +1017,7 @@ export default function RecruiterDashboard() {
               <p className="text-xs uppercase tracking-[0.35em] text-white/50">Recruiter Command Center</p>
               <h1 className="text-3xl font-semibold">Welcome back, {user?.first_name || 'Recruiter'}.</h1>
               <p className="mt-1 text-sm text-white/70">
-                {internships.length} active listings · {totalApplicants} applicants in flight this week.
+                {listingTotal} active listings · {totalApplicants} applicants in flight this week.
               </p>
             </div>
             <div className="flex flex-wrap items-center gap-3">
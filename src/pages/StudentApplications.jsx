@@ -1,6 +1,8 @@
-import { useEffect, useMemo, useState } from 'react'
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react'
 import { motion } from 'framer-motion'
 import API from '../services/api'
+import { fetchPage } from '../services/pagination'
+import { useCursorPages } from '../hooks/useCursorPages'
 import { Loader2 } from 'lucide-react'
 
 const stages = [
@@ -11,41 +13,28 @@ const stages = [
 ]
 
 export default function StudentApplications() {
-  const [applications, setApplications] = useState([])
   const [internshipMap, setInternshipMap] = useState({})
-  const [loading, setLoading] = useState(true)
+  const requested = useRef(new Set())
 
-  useEffect(() => {
-    fetchApplications()
-  }, [])
-
-  const fetchApplications = async () => {
+  // Only the listings the loaded applications point at, in one request per page.
+  const loadInternships = useCallback(async (ids) => {
+    const missing = [...new Set(ids)].filter((id) => id != null && !requested.current.has(id))
+    if (!missing.length) return
+    missing.forEach((id) => requested.current.add(id))
     try {
-      const [applicationsRes, internshipsRes] = await Promise.all([
-        API.get('/api/applications/'),
-        API.get('/api/internships/'),
-      ])
-      setApplications(applicationsRes.data || [])
-      const map = {};
-      (internshipsRes.data || []).forEach((internship) => {
-        map[internship.id] = internship
+      const { items } = await fetchPage(API, '/api/internships/', { params: { ids: missing.join(','), page_size: missing.length } })
+      setInternshipMap((previous) => {
+        const map = { ...previous }
+        items.forEach((internship) => {
+          map[internship.id] = internship
+        })
+        return map
       })
-      setInternshipMap(map)
     } catch (err) {
-      console.error('Failed to fetch applications', err)
-    } finally {
-      setLoading(false)
+      missing.forEach((id) => requested.current.delete(id))
+      console.error('Failed to fetch internships', err)
     }
-  }
-
-  const columnData = useMemo(
-    () =>
-      stages.map((stage) => ({
-        ...stage,
-        items: applications.filter((app) => app.status === stage.id),
-      })),
-    [applications],
-  )
+  }, [])
 
   return (
     <div className="space-y-6 text-white">
@@ -58,59 +47,81 @@ export default function StudentApplications() {
         </p>
       </section>
 
-      {loading ? (
-        <div className="flex items-center justify-center rounded-3xl border border-white/10 bg-[#050914] p-20">
-          <Loader2 className="h-8 w-8 animate-spin text-white/60" />
-        </div>
-      ) : (
-        <div className="grid gap-4 lg:grid-cols-4">
-          {columnData.map((column) => (
-            <motion.div
-              key={column.id}
-              initial={{ opacity: 0, y: 10 }}
-              animate={{ opacity: 1, y: 0 }}
-              className="flex min-h-[320px] flex-col rounded-3xl border border-white/10 bg-[#060b19] p-4"
-            >
-              <div className="mb-4">
-                <p className="text-xs uppercase tracking-[0.35em] text-white/40">{column.label}</p>
-                <p className="text-[11px] text-white/50">{column.description}</p>
-                <span className="mt-2 inline-flex items-center rounded-full bg-white/5 px-3 py-1 text-xs text-white/60">
-                  {column.items.length} applications
+      <div className="grid gap-4 lg:grid-cols-4">
+        {stages.map((stage) => (
+          <StageColumn key={stage.id} stage={stage} internshipMap={internshipMap} onApplications={loadInternships} />
+        ))}
+      </div>
+    </div>
+  )
+}
+
+// One column per status, each paged through `?status=` on its own.
+function StageColumn({ stage, internshipMap, onApplications }) {
+  const params = useMemo(() => ({ status: stage.id }), [stage.id])
+  const { items, hasMore, loading, loadingMore, loadMore } = useCursorPages('/api/applications/', params)
+
+  useEffect(() => {
+    onApplications(items.map((application) => application.internship))
+  }, [items, onApplications])
+
+  return (
+    <motion.div
+      initial={{ opacity: 0, y: 10 }}
+      animate={{ opacity: 1, y: 0 }}
+      className="flex min-h-[320px] flex-col rounded-3xl border border-white/10 bg-[#060b19] p-4"
+    >
+      <div className="mb-4">
+        <p className="text-xs uppercase tracking-[0.35em] text-white/40">{stage.label}</p>
+        <p className="text-[11px] text-white/50">{stage.description}</p>
+        <span className="mt-2 inline-flex items-center rounded-full bg-white/5 px-3 py-1 text-xs text-white/60">
+          {items.length}
+          {hasMore ? '+' : ''} applications
+        </span>
+      </div>
+      <div className="flex flex-1 flex-col gap-4">
+        {loading ? (
+          <div className="flex flex-1 items-center justify-center">
+            <Loader2 className="h-6 w-6 animate-spin text-white/60" />
+          </div>
+        ) : items.length === 0 ? (
+          <p className="text-center text-xs text-white/30">No records</p>
+        ) : (
+          items.map((application) => (
+            <div key={application.id} className="rounded-2xl border border-white/10 bg-white/5 p-4 text-sm text-white/80">
+              <p className="text-xs uppercase tracking-[0.3em] text-white/40">
+                {internshipMap[application.internship]?.company_name || 'Recruiter'}
+              </p>
+              <h3 className="mt-1 text-base font-semibold">
+                {internshipMap[application.internship]?.title || 'Internship'}
+              </h3>
+              <p className="text-xs text-white/50">
+                Applied {application.applied_at ? new Date(application.applied_at).toLocaleDateString() : '—'}
+              </p>
+              <div className="mt-3 flex flex-wrap gap-2 text-[11px] text-white/60">
+                <span className="rounded-full border border-white/10 px-3 py-1">
+                  {internshipMap[application.internship]?.location || 'Remote'}
                 </span>
+                {internshipMap[application.internship]?.stipend ? (
+                  <span className="rounded-full border border-white/10 px-3 py-1">
+                    ₹{internshipMap[application.internship].stipend}/month
+                  </span>
+                ) : null}
               </div>
-              <div className="flex flex-1 flex-col gap-4">
-                {column.items.length === 0 ? (
-                  <p className="text-center text-xs text-white/30">No records</p>
-                ) : (
-                  column.items.map((application) => (
-                    <div key={application.id} className="rounded-2xl border border-white/10 bg-white/5 p-4 text-sm text-white/80">
-                      <p className="text-xs uppercase tracking-[0.3em] text-white/40">
-                        {internshipMap[application.internship]?.company_name || 'Recruiter'}
-                      </p>
-                      <h3 className="mt-1 text-base font-semibold">
-                        {internshipMap[application.internship]?.title || 'Internship'}
-                      </h3>
-                      <p className="text-xs text-white/50">
-                        Applied {application.applied_at ? new Date(application.applied_at).toLocaleDateString() : '—'}
-                      </p>
-                      <div className="mt-3 flex flex-wrap gap-2 text-[11px] text-white/60">
-                        <span className="rounded-full border border-white/10 px-3 py-1">
-                          {internshipMap[application.internship]?.location || 'Remote'}
-                        </span>
-                        {internshipMap[application.internship]?.stipend ? (
-                          <span className="rounded-full border border-white/10 px-3 py-1">
-                            ₹{internshipMap[application.internship].stipend}/month
-                          </span>
-                        ) : null}
-                      </div>
-                    </div>
-                  ))
-                )}
-              </div>
-            </motion.div>
-          ))}
-        </div>
-      )}
-    </div>
+            </div>
+          ))
+        )}
+        {hasMore && (
+          <button
+            type="button"
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="rounded-full border border-white/10 px-3 py-2 text-xs text-white/60 hover:border-white/30 disabled:opacity-50"
+          >
+            {loadingMore ? 'Loading…' : 'Load more'}
+          </button>
+        )}
+      </div>
+    </motion.div>
   )
 }
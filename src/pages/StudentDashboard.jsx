@@ -2,6 +2,7 @@ import React, { useEffect, useState } from 'react'
 import { useNavigate } from 'react-router-dom'
 import { motion } from 'framer-motion'
 import API from '../services/api'
+import { fetchPage } from '../services/pagination'
 import { useAuth } from '../context/AuthContext'
 
 export default function StudentDashboard() {
@@ -10,6 +11,8 @@ export default function StudentDashboard() {
   const [profile, setProfile] = useState(null)
   const [internships, setInternships] = useState([])
   const [loading, setLoading] = useState(true)
+  const [nextPage, setNextPage] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
 
   const [newSkill, setNewSkill] = useState('')
   const [isAddingSkill, setIsAddingSkill] = useState(false)
@@ -23,8 +26,9 @@ export default function StudentDashboard() {
       const profileRes = await API.get('/api/applicants/me/')
       setProfile(profileRes.data)
 
-      const internRes = await API.get('/api/internships/')
-      setInternships(internRes.data)
+      const page = await fetchPage(API, '/api/internships/')
+      setInternships(page.items)
+      setNextPage(page.next)
     } catch (error) {
       console.error('Failed to fetch dashboard data', error)
     } finally {
@@ -32,6 +36,20 @@ export default function StudentDashboard() {
     }
   }
 
+  const loadMoreInternships = async () => {
+    if (!nextPage || loadingMore) return
+    setLoadingMore(true)
+    try {
+      const page = await fetchPage(API, nextPage)
+      setInternships((previous) => [...previous, ...page.items])
+      setNextPage(page.next)
+    } catch (error) {
+      console.error('Failed to fetch more internships', error)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const addSkill = async () => {
     if (!newSkill) return
     try {
@@ -394,6 +412,16 @@ export default function StudentDashboard() {
                         </motion.div>
                       )
                     })}
+                    {nextPage && (
+                      <button
+                        type="button"
+                        onClick={loadMoreInternships}
+                        disabled={loadingMore}
+                        className="w-full rounded-full border border-slate-200 bg-white px-4 py-2 text-xs font-semibold text-slate-600 hover:bg-slate-50 disabled:opacity-50"
+                      >
+                        {loadingMore ? 'Loading…' : 'Load more internships'}
+                      </button>
+                    )}
                   </div>
                 )}
               </div>
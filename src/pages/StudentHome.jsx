@@ -3,6 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import { motion } from 'framer-motion';
 import { Sparkles, ShieldCheck, Zap, TrendingUp, Clock8, ArrowUpRight, LineChart, Activity } from 'lucide-react';
 import API from '../services/api';
+import { fetchPage } from '../services/pagination';
 import { useAuth } from '../context/AuthContext';
 
 export default function StudentHome() {
@@ -19,8 +20,9 @@ export default function StudentHome() {
                 return recRes.data || [];
             } catch (error) {
                 if (error?.response?.status === 403 || error?.response?.status === 401 || error?.response?.status === 404) {
-                    const allRes = await API.get('/api/internships/');
-                    return allRes.data || [];
+                    // The featured cards only need the first page.
+                    const page = await fetchPage(API, '/api/internships/');
+                    return page.items;
                 }
                 throw error;
             }
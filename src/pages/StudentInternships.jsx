@@ -2,6 +2,7 @@ import { useCallback, useEffect, useMemo, useState } from 'react'
 import { useNavigate } from 'react-router-dom'
 import { motion } from 'framer-motion'
 import API from '../services/api'
+import { fetchPage } from '../services/pagination'
 import {
   Filter,
   MapPin,
@@ -66,6 +67,9 @@ export default function StudentInternships() {
   const [selectedInternship, setSelectedInternship] = useState(null)
   const [savedIds, setSavedIds] = useState(new Set())
   const [refreshing, setRefreshing] = useState(false)
+  // Cursor of the next page of the plain listing; recommendations come in one response.
+  const [nextPage, setNextPage] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
 
   const fetchData = useCallback(async (forceRefresh = false) => {
     try {
@@ -78,23 +82,18 @@ export default function StudentInternships() {
           const recRes = await API.get('/api/internships/recommendations/', {
             params: forceRefresh ? { refresh: true } : undefined,
           })
-          return recRes.data || []
+          return { items: recRes.data || [], next: null }
         } catch (error) {
           if ([401, 403, 404].includes(error?.response?.status)) {
-            const fallback = await API.get('/api/internships/')
-            return fallback.data || []
+            return fetchPage(API, '/api/internships/')
           }
           throw error
         }
       }
 
-      if (verified) {
-        const data = await fetchRecommendations()
-        setInternships(data)
-      } else {
-        const fallback = await API.get('/api/internships/')
-        setInternships(fallback.data || [])
-      }
+      const page = verified ? await fetchRecommendations() : await fetchPage(API, '/api/internships/')
+      setInternships(page.items)
+      setNextPage(page.next)
     } catch (error) {
       console.error('Failed to fetch internships', error)
     } finally {
@@ -107,6 +106,20 @@ export default function StudentInternships() {
     fetchData()
   }, [fetchData])
 
+  const loadMore = async () => {
+    if (!nextPage || loadingMore) return
+    setLoadingMore(true)
+    try {
+      const page = await fetchPage(API, nextPage)
+      setInternships((previous) => [...previous, ...page.items])
+      setNextPage(page.next)
+    } catch (error) {
+      console.error('Failed to fetch more internships', error)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const filteredInternships = useMemo(() => {
     const term = search.trim().toLowerCase()
     if (!term) return internships
@@ -328,6 +341,19 @@ export default function StudentInternships() {
         )}
       </div>
 
+      {nextPage && (
+        <div className="flex justify-center">
+          <button
+            type="button"
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="rounded-2xl border border-white/15 bg-white/5 px-6 py-2 text-xs font-semibold uppercase tracking-[0.3em] text-white/70 transition hover:bg-white/10 disabled:cursor-not-allowed disabled:opacity-50"
+          >
+            {loadingMore ? 'Loading…' : 'Load more internships'}
+          </button>
+        </div>
+      )}
+
       {selectedInternship && (
         <div className="fixed inset-0 z-50 flex items-start justify-center overflow-y-auto bg-black/80 px-4 py-10">
           <div className="w-full max-w-5xl rounded-[32px] border border-white/10 bg-[#050916] p-8 text-white shadow-[0_60px_140px_rgba(3,4,20,0.8)]">
@@ -0,0 +1,29 @@
+// Fetches one page of a DRF cursor-paginated list: `{ items, next }`, where
+// `next` is the URL of the following page (or null on the last one).
+// Unpaginated endpoints (plain arrays) come back as a single last page.
+export async function fetchPage(api, url, config = {}) {
+    const response = await api.get(url, config);
+    const data = response?.data;
+    if (!data || Array.isArray(data)) {
+        return { items: data || [], next: null };
+    }
+    return { items: data.results || [], next: data.next || null };
+}
+
+// Follows DRF cursor pagination `next` links and returns every result.
+// Only for explicit, user-triggered needs such as CSV exports; screens
+// should load the first page and page on demand (see useCursorPages).
+export async function fetchAllPages(api, url, config = {}) {
+    const items = [];
+    let nextUrl = url;
+    let requestConfig = { ...config, params: { page_size: 100, ...(config.params || {}) } };
+
+    while (nextUrl) {
+        const page = await fetchPage(api, nextUrl, requestConfig);
+        items.push(...page.items);
+        nextUrl = page.next;
+        // `next` already carries the cursor and page size.
+        requestConfig = { ...config, params: undefined };
+    }
+    return items;
+}